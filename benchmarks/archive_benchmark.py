@@ -0,0 +1,105 @@
+"""Measure FeedArchive bulk ingest and query latency on a synthetic archive.
+
+    python benchmarks/archive_benchmark.py --items 200000
+
+Builds a throwaway archive with `items` tweets and videos (from the synthetic
+server's record generators), re-ingests a slice to exercise upserts and
+snapshots, then times representative queries. Prints a JSON report.
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from feed_archive import FeedArchive, format_timestamp
+from synthetic_server import x_item, youtube_item
+
+WORDS = ("rust", "python", "async", "browser", "scraper", "sqlite", "release", "benchmark", "compiler", "kernel")
+
+
+def tweet_record(index: int, scraped_at: str) -> dict:
+    item = x_item(index)
+    return {
+        "author": {"name": item["name"], "handle": "@" + item["handle"]},
+        "text": f"{item['text']} about {WORDS[index % len(WORDS)]} and {WORDS[index * 7 % len(WORDS)]}",
+        "timestamp": item["datetime"],
+        "posted_at": item["datetime"][:19] + "Z",
+        "counts": {"like": index % 5000, "reply": index % 50, "retweet": index % 200, "views": index * 3},
+        "url": f"https://x.com/{item['handle']}/status/{item['id']}",
+        "media_url": None,
+        "scraped_at": scraped_at,
+    }
+
+
+def video_record(index: int, anchor: datetime, scraped_at: str) -> dict:
+    item = youtube_item(index)
+    return {
+        "title": f"{item['title']} on {WORDS[index % len(WORDS)]}",
+        "url": f"https://www.youtube.com/watch?v={item['id']}",
+        "channel": item["channel"],
+        "views": item["views"],
+        "posted_time": item["posted"],
+        "posted_at": format_timestamp(anchor - timedelta(minutes=index)),
+        "counts": {"views": index * 11},
+        "video_id": item["id"],
+        "scraped_at": scraped_at,
+    }
+
+
+def timed(callable_, repeat: int = 20) -> dict:
+    result = callable_()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        callable_()
+    return {"results": len(result), "ms": round((time.perf_counter() - started) / repeat * 1000, 2)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=200000, help="total items, split evenly between platforms")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    anchor = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    first_scrape = format_timestamp(anchor)
+    second_scrape = format_timestamp(anchor + timedelta(hours=6))
+    half = args.items // 2
+    report = {"items": args.items}
+
+    with tempfile.TemporaryDirectory() as directory:
+        with FeedArchive(Path(directory) / "archive.sqlite3") as archive:
+            started = time.perf_counter()
+            archive.ingest((tweet_record(i, first_scrape) for i in range(half)), "x", args.batch_size)
+            archive.ingest((video_record(i, anchor, first_scrape) for i in range(half)), "youtube", args.batch_size)
+            seconds = time.perf_counter() - started
+            report["ingest"] = {"seconds": round(seconds, 2), "items_per_sec": round(args.items / seconds)}
+
+            # A later scrape sees the newest tenth again with fresh counts
+            started = time.perf_counter()
+            archive.ingest((tweet_record(i, second_scrape) for i in range(half // 10)), "x", args.batch_size)
+            report["reingest_seconds"] = round(time.perf_counter() - started, 2)
+
+            report["queries"] = {
+                "text": timed(lambda: archive.search("async scraper")),
+                "text_prefix": timed(lambda: archive.search("bench*", platform="x")),
+                "author": timed(lambda: archive.search(author="@user7")),
+                "text_author_range": timed(lambda: archive.search(
+                    "rust", author="user7", since="2024-09-01", until="2024-11-01")),
+                "channel_range": timed(lambda: archive.search(
+                    author="Channel 5", since="2025-12-01", until="2026-01-01")),
+                "latest": timed(lambda: archive.search(limit=50)),
+                "history": timed(lambda: archive.history(tweet_record(5, first_scrape)["url"])),
+            }
+            report["stats"] = archive.stats()
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
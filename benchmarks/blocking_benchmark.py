@@ -0,0 +1,91 @@
+"""Compare bytes transferred with and without ResourceBlocker on the synthetic feeds.
+
+    python benchmarks/blocking_benchmark.py --platforms youtube x --scrolls 5
+
+Each setup opens the page in a fresh tab, scrolls `scrolls` times, then reloads
+and scrolls again. The reload should fetch /static/app.js from the HTTP cache.
+Setups:
+
+    none      nothing blocked (a ResourceBlocker with no types or patterns, measuring only)
+    blocker   the scrapers' ResourceBlocker
+    route     page.route('**/*') letting everything through, which turns the cache off
+
+Prints transferred bytes per load, as counted from Network.loadingFinished.
+The setups share one profile, so only the first first-load starts with a cold
+cache; compare reload_bytes.
+"""
+import argparse
+import json
+import socket
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from social_media_scraper import BrowserManager, ResourceBlocker
+from synthetic_server import start_server
+
+PATHS = {"youtube": "/youtube", "x": "/x/home"}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def load(page, url: str, scrolls: int, reload: bool = False):
+    if reload:
+        page.reload(wait_until="load")
+    else:
+        page.goto(url, wait_until="load")
+    for _ in range(scrolls):
+        page.evaluate("window.scrollTo(0, document.documentElement.scrollHeight)")
+        page.wait_for_timeout(200)
+
+
+def run_setup(context, url: str, setup: str, scrolls: int) -> dict:
+    page = context.new_page()
+    try:
+        blocker = ResourceBlocker() if setup == "blocker" else ResourceBlocker(blocked_types=(), blocked_patterns=())
+        blocker.install(page)
+        if setup == "route":
+            page.route("**/*", lambda route: route.continue_())
+        loads = []
+        for reload in (False, True):
+            before = blocker.transferred_bytes
+            load(page, url, scrolls, reload)
+            loads.append(blocker.transferred_bytes - before)
+        return {"first_load_bytes": loads[0], "reload_bytes": loads[1], **blocker.report()}
+    finally:
+        page.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--platforms", nargs="+", choices=sorted(PATHS), default=sorted(PATHS))
+    parser.add_argument("--scrolls", type=int, default=5)
+    parser.add_argument("--chrome-path", default=None)
+    args = parser.parse_args()
+
+    server = start_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    report = {}
+    try:
+        with tempfile.TemporaryDirectory() as profile:
+            with BrowserManager(chrome_path=args.chrome_path, headless=True, port=free_port(),
+                                user_data_dir=profile, stop_on_exit=True) as browser:
+                context = browser.contexts[0]
+                for platform in args.platforms:
+                    url = f"{base_url}{PATHS[platform]}?latency_ms=0"
+                    report[platform] = {setup: run_setup(context, url, setup, args.scrolls)
+                                        for setup in ("none", "blocker", "route")}
+    finally:
+        server.shutdown()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
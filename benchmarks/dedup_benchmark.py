@@ -0,0 +1,128 @@
+"""Measure near-duplicate clustering speed and accuracy on synthetic feeds.
+
+    python benchmarks/dedup_benchmark.py --sizes 10000 100000 200000
+
+Each feed holds random tweets and video titles, plus a share of planted
+near-duplicates (one word swapped, a retweet prefix, a trailing link, or the same
+title from another channel) and of near-misses that must stay apart (episode
+titles that differ only in their number). Reports items/sec, LSH comparisons per
+item (which should stay flat as the feed grows), recall and precision on the
+planted pairs, and how many near-miss pairs were wrongly merged. The vocabulary
+is uniform random, so precision here is an upper bound for real text; the unit
+tests hold the realistic near-miss cases.
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from feed_dedup import DEFAULT_THRESHOLD, NearDuplicateIndex, find_clusters, signature
+
+
+def make_feed(size: int, duplicate_share: float, near_miss_share: float = 0.02, seed: int = 7):
+    rng = random.Random(seed)
+    vocabulary = [f"w{index}" for index in range(20000)]
+    records, planted, near_misses = [], [], []
+    while len(records) < size:
+        if rng.random() < near_miss_share:
+            # Two episodes of one series: same channel, same title up to the episode number
+            series = ' '.join(rng.choice(vocabulary) for _ in range(rng.randint(3, 6)))
+            channel = f"Channel {rng.randrange(500)}"
+            first = rng.randrange(1, 100)
+            for episode in (first, first + 1):
+                records.append({'type': 'youtube', 'title': f"{series} Day {episode}", 'channel': channel,
+                                'url': f"https://example.com/{len(records)}"})
+            near_misses.append((len(records) - 2, len(records) - 1))
+        elif records and rng.random() < duplicate_share:
+            source = rng.randrange(len(records))
+            original = records[source]
+            copy = dict(original)
+            edit = rng.choice(("swap", "retweet", "link"))
+            if original['type'] == 'youtube':
+                copy['channel'] = f"Reupload {rng.randrange(100)}"
+                if edit == "swap":
+                    words = copy['title'].split()
+                    words[rng.randrange(len(words))] = rng.choice(vocabulary)
+                    copy['title'] = ' '.join(words)
+            elif edit == "swap":
+                words = copy['text'].split()
+                words[rng.randrange(len(words))] = rng.choice(vocabulary)
+                copy['text'] = ' '.join(words)
+            elif edit == "retweet":
+                copy['text'] = "RT " + copy['text']
+            else:
+                copy['text'] = copy['text'] + f" https://t.co/{rng.randrange(10 ** 8)}"
+            copy['url'] = f"https://example.com/{len(records)}"
+            planted.append((source, len(records)))
+            records.append(copy)
+        elif rng.random() < 0.3:
+            title = ' '.join(rng.choice(vocabulary) for _ in range(rng.randint(6, 12)))
+            records.append({'type': 'youtube', 'title': title, 'channel': f"Channel {rng.randrange(500)}",
+                            'url': f"https://example.com/{len(records)}"})
+        else:
+            text = ' '.join(rng.choice(vocabulary) for _ in range(rng.randint(12, 40)))
+            records.append({'type': 'twitter', 'text': text, 'url': f"https://example.com/{len(records)}"})
+    return records[:size], [pair for pair in planted if pair[1] < size], [pair for pair in near_misses if pair[1] < size]
+
+
+def bench(size: int, duplicate_share: float, threshold: float) -> dict:
+    records, planted, near_misses = make_feed(size, duplicate_share)
+
+    started = time.perf_counter()
+    clusters = find_clusters(records, threshold)
+    seconds = time.perf_counter() - started
+
+    cluster_of = {}
+    for number, members in enumerate(clusters):
+        for position in members:
+            cluster_of[position] = number
+    found = sum(1 for source, copy in planted if cluster_of[source] == cluster_of[copy])
+    merged_near_misses = sum(1 for first, second in near_misses if cluster_of[first] == cluster_of[second])
+
+    # Pairs clustered together that were never planted (nor chained through planted copies)
+    origin = list(range(len(records)))
+    for source, copy in planted:
+        origin[copy] = origin[source]
+    clustered_pairs = sum(len(members) - 1 for members in clusters)
+    false_pairs = sum(
+        1 for members in clusters if len(members) > 1
+        for position in members[1:] if origin[position] != origin[members[0]]
+    )
+
+    # Comparison count is tracked on the index itself, so rebuild one to read it
+    index = NearDuplicateIndex(threshold)
+    for position, record in enumerate(records):
+        value = signature(record)
+        if value is not None:
+            index.query(value)
+            index.add(position, value)
+
+    return {
+        'items': size,
+        'planted_pairs': len(planted),
+        'seconds': round(seconds, 2),
+        'items_per_sec': round(size / seconds),
+        'comparisons_per_item': round(index.comparisons / size, 2),
+        'recall': round(found / len(planted), 3) if planted else None,
+        'precision': round(1 - false_pairs / clustered_pairs, 3) if clustered_pairs else None,
+        'near_miss_pairs': len(near_misses),
+        'near_misses_merged': merged_near_misses,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--duplicate-share", type=float, default=0.1)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    print(json.dumps([bench(size, args.duplicate_share, args.threshold) for size in args.sizes], indent=2))
+
+
+if __name__ == "__main__":
+    main()
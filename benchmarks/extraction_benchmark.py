@@ -0,0 +1,150 @@
+"""Compare per-handle and batched extraction against the saved HTML fixtures.
+
+Runs offline in Playwright's bundled Chromium:
+
+    python benchmarks/extraction_benchmark.py --items 200 --repeat 5
+
+Prints a JSON report with browser round trips and wall time per mode, plus
+the cost of one scroll pass for batch and observer collection as the timeline
+grows.
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from playwright.sync_api import sync_playwright
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from social_media_scraper import ScrapeMetrics, XScraper, YouTubeScraper
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+# Clones fixture cards (with unique links) until the page holds `items` of them
+APPEND_CLONES_JS = """([selector, items]) => {
+    const originals = Array.from(document.querySelectorAll(selector));
+    const parent = originals[0].parentElement;
+    for (let i = originals.length; i < items; i++) {
+        const clone = originals[i % originals.length].cloneNode(true);
+        clone.querySelectorAll('a[href]').forEach((a) => {
+            const href = a.getAttribute('href');
+            a.setAttribute('href', href + (href.includes('?') ? '&' : '?') + 'copy=' + i);
+        });
+        parent.appendChild(clone);
+    }
+}"""
+
+
+def load_fixture(page, name: str, selector: str, items: int):
+    """Load a fixture and clone its cards until the page holds `items` of them, each with unique links"""
+    page.goto("about:blank")  # fresh window, so page-side collectors are reinstalled
+    page.set_content((FIXTURES_DIR / name).read_text(encoding="utf-8"))
+    page.evaluate(APPEND_CLONES_JS, [selector, items])
+
+
+def measure(page, extract, repeat: int) -> dict:
+    # The scrapers' own call counting, so these numbers match their playwright_calls metric
+    metrics = ScrapeMetrics("benchmark")
+    instrumented = metrics.instrument(page)
+    records = None
+    start = time.perf_counter()
+    for _ in range(repeat):
+        records = extract(instrumented)
+    wall = time.perf_counter() - start
+    calls = metrics.counters["playwright_calls"]
+    return {
+        "items": len(records),
+        "round_trips": calls // repeat,
+        "round_trips_per_item": round(calls / repeat / max(len(records), 1), 2),
+        "wall_ms": round(wall / repeat * 1000, 2),
+        "records": records,
+    }
+
+
+def bench_x(page, items: int, repeat: int) -> dict:
+    scraper = XScraper()
+    load_fixture(page, "x_home.html", 'article[role="article"]', items)
+
+    def handles(p):
+        return list(scraper._iter_tweets_from_handles(p.query_selector_all('article[role="article"]')))
+
+    return {
+        "handles": measure(page, handles, repeat),
+        "batch": measure(page, scraper._extract_tweets_in_page, repeat),
+    }
+
+
+def bench_youtube(page, items: int, repeat: int) -> dict:
+    scraper = YouTubeScraper()
+    load_fixture(page, "youtube_home.html", "ytd-rich-grid-media", items)
+
+    def handles(p):
+        return [scraper._extract_video_from_handle(element) for element in p.query_selector_all("ytd-rich-grid-media")]
+
+    return {
+        "handles": measure(page, handles, repeat),
+        "batch": measure(page, lambda p: scraper._extract_videos_in_page(p, items), repeat),
+    }
+
+
+def bench_x_scroll_pass(page, sizes, step: int) -> dict:
+    """Time one scroll pass that yields `step` new tweets on a timeline already holding each size"""
+    scraper = XScraper()
+    selector = 'article[role="article"]'
+    results = {}
+    for size in sizes:
+        load_fixture(page, "x_home.html", selector, size)
+        scraper._install_tweet_collector(page)
+        scraper._drain_tweet_collector(page)
+
+        page.evaluate(APPEND_CLONES_JS, [selector, size + step])
+        start = time.perf_counter()
+        drained = scraper._drain_tweet_collector(page)
+        observer_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        scraper._extract_tweets_in_page(page)
+        batch_ms = (time.perf_counter() - start) * 1000
+
+        results[str(size)] = {
+            "new_tweets": len(drained),
+            "observer_ms": round(observer_ms, 2),
+            "batch_ms": round(batch_ms, 2),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100, help="cards to render per fixture")
+    parser.add_argument("--repeat", type=int, default=3, help="extraction passes to average over")
+    parser.add_argument("--scroll-sizes", type=int, nargs="+", default=[100, 500, 1000],
+                        help="timeline depths at which to time a single scroll pass")
+    args = parser.parse_args()
+
+    report = {}
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=True)
+        page = browser.new_page()
+        report["x"] = bench_x(page, args.items, args.repeat)
+        report["youtube"] = bench_youtube(page, args.items, args.repeat)
+        scroll_pass = bench_x_scroll_pass(page, args.scroll_sizes, step=20)
+        browser.close()
+
+    for platform, modes in report.items():
+        baseline = modes.pop("handles")
+        batch = modes["batch"]
+        if baseline.pop("records") != batch.pop("records"):
+            raise SystemExit(f"{platform}: batched extraction does not match per-handle extraction")
+        modes["handles"] = baseline
+        modes["speedup"] = round(baseline["wall_ms"] / max(batch["wall_ms"], 0.01), 1)
+
+    report["x_scroll_pass"] = scroll_pass
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Time MediaCache prefetching against the synthetic server's /img/ stand-in.
+
+    python benchmarks/media_benchmark.py --items 200 --workers 1 8 --variants 320
+
+For each worker count the same records are localized twice into a fresh cache:
+the cold pass downloads every image, the warm pass should be served entirely
+from the index. Prints a JSON report and fails if a rewritten URL has no file.
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from social_media_scraper import MediaCache, YouTubeScraper
+from synthetic_server import start_server
+
+
+def make_records(base_url: str, items: int):
+    # Every tenth record repeats the previous thumbnail so URL de-duplication is exercised too
+    records = []
+    for index in range(items):
+        image = index - 1 if index % 10 == 9 else index
+        records.append({"video_id": f"vid{index:08d}", "thumbnail": f"{base_url}/img/vid{image:08d}.jpg"})
+    return records
+
+
+def localize_pass(cache: MediaCache, records) -> dict:
+    started = time.perf_counter()
+    localized = cache.localize(records, YouTubeScraper.MEDIA_FIELDS)
+    seconds = time.perf_counter() - started
+    for record in localized:
+        relative = record["thumbnail"][len(cache.url_prefix) + 1:]
+        if not (cache.root / relative).exists():
+            raise SystemExit(f"missing cached file for {record['thumbnail_source']}")
+    return {"seconds": round(seconds, 3), **cache.report()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--variants", type=int, nargs="*", default=[], help="downscaled widths (needs Pillow)")
+    args = parser.parse_args()
+
+    server = start_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    records = make_records(base_url, args.items)
+    report = {}
+    try:
+        for workers in args.workers:
+            with tempfile.TemporaryDirectory() as root:
+                cache = MediaCache(root, max_workers=workers, variant_widths=args.variants)
+                cold = localize_pass(cache, records)
+                warm_cache = MediaCache(root, max_workers=workers, variant_widths=args.variants)
+                warm = localize_pass(warm_cache, records)
+                report[f"workers_{workers}"] = {"cold": cold, "warm": warm}
+    finally:
+        server.shutdown()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Local stand-in for X and YouTube that serves recorded feed payloads.
+
+    python benchmarks/replay_server.py --port 8765
+
+Then point a scraper in network mode at it:
+
+    YouTubeScraper(extraction_mode='network', home_url='http://127.0.0.1:8765/')
+    XScraper(extraction_mode='network', home_url='http://127.0.0.1:8765/home')
+
+`/` embeds the recorded ytInitialData and POSTs /youtubei/v1/browse once the
+page is scrolled to the bottom. `/home` fetches the recorded Home timeline from
+/i/api/graphql/replay/HomeTimeline on load and again on scroll; later pages
+are empty so the feed ends.
+"""
+import argparse
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+# Loads the next feed page whenever the viewport reaches the bottom of a tall page
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>{title}</title></head>
+<body>
+<div id="feed" style="height: 3000px">{title}</div>
+<script>{script}
+let loading = false;
+async function loadMore() {{
+    if (loading) return;
+    loading = true;
+    const response = await fetch('{feed_path}', {{method: '{method}'}});
+    await response.json();
+    document.getElementById('feed').style.height = (document.getElementById('feed').offsetHeight + 3000) + 'px';
+    loading = false;
+}}
+window.addEventListener('scroll', () => {{
+    if (window.innerHeight + window.scrollY >= document.documentElement.scrollHeight - 10) loadMore();
+}});
+{on_load}
+</script>
+</body>
+</html>
+"""
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    x_pages_served = 0
+    youtube_pages_served = 0
+
+    def _send(self, body: str, content_type: str):
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_fixture(self, name: str, first_page: bool):
+        payload = (FIXTURES_DIR / name).read_text(encoding="utf-8") if first_page else "{}"
+        self._send(payload, "application/json")
+
+    def do_GET(self):
+        if self.path == "/":
+            initial_data = (FIXTURES_DIR / "youtube_initial_data.json").read_text(encoding="utf-8")
+            self._send(PAGE_TEMPLATE.format(
+                title="YouTube",
+                script=f"var ytInitialData = {initial_data};",
+                feed_path="/youtubei/v1/browse",
+                method="POST",
+                on_load="",
+            ), "text/html")
+        elif self.path == "/home":
+            self._send(PAGE_TEMPLATE.format(
+                title="Home / X",
+                script="",
+                feed_path="/i/api/graphql/replay/HomeTimeline",
+                method="GET",
+                on_load="loadMore();",
+            ), "text/html")
+        elif self.path.startswith("/i/api/graphql/replay/HomeTimeline"):
+            ReplayHandler.x_pages_served += 1
+            self._send_fixture("x_home_timeline.json", ReplayHandler.x_pages_served == 1)
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        if self.path.startswith("/youtubei/v1/browse"):
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            ReplayHandler.youtube_pages_served += 1
+            self._send_fixture("youtube_browse_continuation.json", ReplayHandler.youtube_pages_served == 1)
+        else:
+            self.send_error(404)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), ReplayHandler)
+    print(json.dumps({"listening": f"http://127.0.0.1:{args.port}"}))
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""Run the scrapers against the synthetic infinite-scroll feeds and report throughput.
+
+    python benchmarks/run_benchmarks.py --sizes 50 500 5000 --output results.json
+    python benchmarks/run_benchmarks.py --compare before.json after.json
+
+Every case scrapes `size` items from a local synthetic_server page in a
+headless browser and records items/sec, Playwright calls per item, total
+scroll wait time and peak RSS of the browser process tree and of this process.
+Results are JSON tagged with the current git commit so runs can be compared.
+"""
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from social_media_scraper import BrowserPool, XScraper, YouTubeScraper
+from synthetic_server import start_server
+
+SCRAPERS = {"youtube": (YouTubeScraper, "/youtube"), "x": (XScraper, "/x/home")}
+DEFAULT_MODES = {"youtube": ["batch"], "x": ["batch", "observer"]}
+
+
+def _rss_kb(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def _process_tree(root_pid: int):
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as stat:
+                parent = int(stat.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(parent, []).append(int(entry))
+    tree, stack = [], [root_pid]
+    while stack:
+        pid = stack.pop()
+        tree.append(pid)
+        stack.extend(children.get(pid, []))
+    return tree
+
+
+class RSSSampler:
+    """Samples RSS of the browser process tree and of this process in the background, keeping the peaks"""
+
+    def __init__(self, browser_pid, interval: float = 0.2):
+        self.browser_pid = browser_pid
+        self.interval = interval
+        self.peak_browser_kb = 0
+        self.peak_python_kb = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _sample(self):
+        self.peak_python_kb = max(self.peak_python_kb, _rss_kb(os.getpid()))
+        if self.browser_pid:
+            browser_kb = sum(_rss_kb(pid) for pid in _process_tree(self.browser_pid))
+            self.peak_browser_kb = max(self.peak_browser_kb, browser_kb)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._sample()
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_case(pool, base_url: str, platform: str, mode: str, size: int, latency_ms: int, window: int,
+             deadline: float = None) -> dict:
+    scraper_class, path = SCRAPERS[platform]
+    # Serve twice as many items as requested so the feed never ends early
+    url = f"{base_url}{path}?total={size * 2}&latency_ms={latency_ms}&window={window}"
+    scraper = scraper_class(extraction_mode=mode, home_url=url, browser_pool=pool, deadline_seconds=deadline)
+
+    # Warm the pooled browser first so startup does not count against the case
+    with pool.session():
+        pass
+    browser_pid = pool._managers[0].process.pid if pool._managers and pool._managers[0].process else None
+
+    with RSSSampler(browser_pid) as sampler:
+        started = time.perf_counter()
+        records = scraper.scrape_feed(size)
+        seconds = time.perf_counter() - started
+
+    items = len(records)
+    # Counted by the scraper's instrumented page: every call that crosses to the browser
+    calls = scraper.metrics.counters["playwright_calls"]
+    return {
+        "platform": platform,
+        "mode": mode,
+        "size": size,
+        "items": items,
+        "status": scraper.metrics.status,
+        "seconds": round(seconds, 3),
+        "items_per_sec": round(items / seconds, 2) if seconds else None,
+        "playwright_calls": calls,
+        "calls_per_item": round(calls / items, 2) if items else None,
+        "scroll_steps": len(scraper.scroll_steps),
+        "wait_ms": sum(step["waited_ms"] for step in scraper.scroll_steps),
+        "peak_browser_rss_mb": round(sampler.peak_browser_kb / 1024, 1),
+        "peak_python_rss_mb": round(sampler.peak_python_kb / 1024, 1),
+    }
+
+
+def compare(before_path: str, after_path: str):
+    """Print per-case ratios (after / before) of throughput and calls per item"""
+    def load(path):
+        with open(path, encoding="utf-8") as f:
+            report = json.load(f)
+        return report["commit"], {(r["platform"], r["mode"], r["size"]): r for r in report["results"]}
+
+    before_commit, before = load(before_path)
+    after_commit, after = load(after_path)
+    rows = []
+    for key in sorted(before.keys() & after.keys()):
+        old, new = before[key], after[key]
+        rows.append({
+            "case": "/".join(str(part) for part in key),
+            "items_per_sec": [old["items_per_sec"], new["items_per_sec"]],
+            "calls_per_item": [old["calls_per_item"], new["calls_per_item"]],
+            "wait_ms": [old["wait_ms"], new["wait_ms"]],
+            "speedup": round(new["items_per_sec"] / old["items_per_sec"], 2)
+            if old["items_per_sec"] and new["items_per_sec"] else None,
+        })
+    print(json.dumps({"before": before_commit, "after": after_commit, "cases": rows}, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--platforms", nargs="+", choices=sorted(SCRAPERS), default=sorted(SCRAPERS))
+    parser.add_argument("--modes", nargs="+", default=None,
+                        help="extraction modes to run for every platform (default: batch, plus observer for X)")
+    parser.add_argument("--latency-ms", type=int, default=50, help="simulated feed response latency")
+    parser.add_argument("--window", type=int, default=60, help="cards kept in the DOM on X (0 disables virtualization)")
+    parser.add_argument("--deadline", type=float, default=None,
+                        help="per-scrape deadline in seconds; large sizes then report how far they got")
+    parser.add_argument("--chrome-path", default=None)
+    parser.add_argument("--output", default=None, help="write results JSON here instead of stdout")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="compare two result files")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    server = start_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    results = []
+    with tempfile.TemporaryDirectory() as profile:
+        pool = BrowserPool(chrome_path=args.chrome_path, headless=True, port=free_port(), user_data_dir=profile)
+        try:
+            for platform in args.platforms:
+                for mode in args.modes or DEFAULT_MODES[platform]:
+                    for size in args.sizes:
+                        window = args.window if platform == "x" else 0
+                        results.append(run_case(pool, base_url, platform, mode, size, args.latency_ms, window,
+                                                args.deadline))
+                        print(json.dumps(results[-1]), file=sys.stderr)
+        finally:
+            process = pool._managers[0].process if pool._managers else None
+            pool.close()
+            if process:
+                process.terminate()
+                process.wait()
+            server.shutdown()
+
+    report = {
+        "commit": git_commit(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "latency_ms": args.latency_ms,
+        "window": args.window,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Measure cold and warm browser startup latency.
+
+    python benchmarks/startup_benchmark.py --runs 5
+
+Cold runs launch a fresh headless Chrome (or Playwright's bundled Chromium) on
+a free port with a throwaway profile and connect to it. Warm runs take a
+session from a BrowserPool that is already connected. Prints a JSON report.
+"""
+import argparse
+import json
+import socket
+import sys
+import tempfile
+from pathlib import Path
+
+from playwright.sync_api import sync_playwright
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from social_media_scraper import BrowserManager, BrowserPool
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def summarize(latencies_ms) -> dict:
+    latencies_ms = sorted(latencies_ms)
+    return {
+        "runs": len(latencies_ms),
+        "min_ms": round(latencies_ms[0], 1),
+        "median_ms": round(latencies_ms[len(latencies_ms) // 2], 1),
+        "max_ms": round(latencies_ms[-1], 1),
+    }
+
+
+def bench_cold(runs: int, chrome_path: str = None) -> dict:
+    latencies = []
+    with sync_playwright() as playwright:
+        for _ in range(runs):
+            with tempfile.TemporaryDirectory() as profile:
+                manager = BrowserManager(chrome_path=chrome_path, headless=True, port=free_port(),
+                                         user_data_dir=profile, playwright=playwright)
+                with manager:
+                    latencies.append(manager.startup_seconds * 1000)
+                manager.process.terminate()
+                manager.process.wait()
+    return summarize(latencies)
+
+
+def bench_warm(runs: int, chrome_path: str = None) -> dict:
+    with tempfile.TemporaryDirectory() as profile:
+        pool = BrowserPool(chrome_path=chrome_path, headless=True, port=free_port(), user_data_dir=profile)
+        try:
+            # The first session pays the cold start; every later one should be warm
+            for _ in range(runs + 1):
+                with pool.session() as browser:
+                    browser.contexts[0].pages
+            report = pool.report()
+        finally:
+            process = pool._managers[0].process if pool._managers else None
+            pool.close()
+            if process:
+                process.terminate()
+                process.wait()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--chrome-path", default=None, help="browser binary (defaults to BrowserManager's lookup)")
+    args = parser.parse_args()
+
+    print(json.dumps({
+        "cold": bench_cold(args.runs, args.chrome_path),
+        "pool": bench_warm(args.runs, args.chrome_path),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""Synthetic infinite-scroll X and YouTube pages for offline benchmarks.
+
+    python benchmarks/synthetic_server.py --port 8766
+
+Pages (all query parameters optional):
+
+    /youtube?total=5000&batch=24&latency_ms=50&window=0
+    /x/home?total=5000&batch=20&latency_ms=50&window=60
+
+Cards use the same selectors the scrapers read (`ytd-rich-grid-media`,
+`article[role="article"]`). Each time the viewport reaches the bottom the page
+requests the next `batch` items from /youtubei/v1/browse or
+/i/api/graphql/synthetic/HomeTimeline, which the server answers after
+`latency_ms`. With `window` > 0 only the newest `window` cards stay in the
+DOM, like X's virtualized timeline.
+
+/img/<name> returns a 640x360 PNG whose colour is derived from <name>, for
+exercising MediaCache without touching the real CDNs.
+
+/static/app.js is an 80 KB script every page loads. Unlike everything else it
+is cacheable, so a reload shows whether the browser's HTTP cache is in use.
+"""
+import argparse
+import hashlib
+import json
+import struct
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+DEFAULTS = {"total": 5000, "batch": 20, "latency_ms": 50, "window": 0}
+
+
+def youtube_item(index: int) -> dict:
+    return {
+        "id": f"vid{index:08d}",
+        "title": f"Synthetic video number {index}",
+        "channel": f"Channel {index % 97}",
+        "views": f"{(index * 37) % 999 + 1}K views",
+        "posted": f"{index % 23 + 1} hours ago",
+    }
+
+
+def x_item(index: int) -> dict:
+    return {
+        "id": str(1900000000000000000 + index),
+        "name": f"User {index % 113}",
+        "handle": f"user{index % 113}",
+        "text": f"Synthetic tweet number {index} with some text to extract",
+        "datetime": time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(1_730_000_000 - index * 60)),
+        "reply": str(index % 50),
+        "retweet": str(index % 200),
+        "like": f"{index % 9 + 1}.{index % 10}K",
+        "views": f"{index % 90 + 10}K",
+        "photo": index % 3 == 0,
+    }
+
+
+def png_image(name: str, width: int = 640, height: int = 360) -> bytes:
+    """A solid-colour RGB PNG, distinct per name"""
+    red, green, blue = hashlib.sha256(name.encode("utf-8")).digest()[:3]
+    row = b"\x00" + bytes([red, green, blue]) * width
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(row * height))
+            + chunk(b"IEND", b""))
+
+
+RENDER_YOUTUBE_JS = """
+function renderItem(item) {
+    const card = document.createElement('ytd-rich-grid-media');
+    card.innerHTML = `
+        <div id="dismissible">
+          <ytd-thumbnail><a id="thumbnail" href="/watch?v=${item.id}"><img src="/img/${item.id}.jpg"></a></ytd-thumbnail>
+          <div id="details"><div id="meta">
+            <h3><a id="video-title-link" href="/watch?v=${item.id}"><yt-formatted-string id="video-title">${item.title}</yt-formatted-string></a></h3>
+            <ytd-channel-name id="channel-name"><div id="text-container"><yt-formatted-string id="text"><a href="/@c">${item.channel}</a></yt-formatted-string></div></ytd-channel-name>
+            <div id="metadata-line"><span>${item.views}</span><span>${item.posted}</span></div>
+          </div></div>
+        </div>`;
+    card.style.display = 'block';
+    card.style.height = '320px';
+    return card;
+}
+"""
+
+RENDER_X_JS = """
+function renderItem(item) {
+    const article = document.createElement('article');
+    article.setAttribute('role', 'article');
+    const photo = item.photo ? `<div data-testid="tweetPhoto"><img src="/img/${item.id}.jpg"></div>` : '';
+    const stat = (testid, value) => `<button data-testid="${testid}"><span data-testid="app-text-transition-container"><span>${value}</span></span></button>`;
+    article.innerHTML = `
+        <div data-testid="User-Name">
+          <div class="css-175oi2r r-1awozwy r-18u37iz r-1wbh5a2"><a href="/${item.handle}"><div dir="ltr"><span>${item.name}</span></div></a></div>
+          <div class="css-175oi2r r-1d09ksm r-18u37iz r-1wbh5a2"><a href="/${item.handle}"><div dir="ltr"><span>@${item.handle}</span></div></a><a href="/${item.handle}/status/${item.id}"><time datetime="${item.datetime}">now</time></a></div>
+        </div>
+        <div data-testid="tweetText"><span>${item.text}</span></div>
+        ${photo}
+        <div role="group">
+          ${stat('reply', item.reply)}${stat('retweet', item.retweet)}${stat('like', item.like)}
+          <a aria-label="${item.views} views" href="/${item.handle}/status/${item.id}/analytics"><span data-testid="app-text-transition-container"><span>${item.views}</span></span></a>
+        </div>`;
+    article.style.display = 'block';
+    article.style.height = '240px';
+    return article;
+}
+"""
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>{title}</title><script src="/static/app.js"></script></head>
+<body style="margin: 0">
+<div id="spacer"></div>
+<div id="feed"></div>
+<script>
+{render}
+const config = {config};
+const feed = document.getElementById('feed');
+const spacer = document.getElementById('spacer');
+let offset = 0;
+let loading = false;
+
+function append(items) {{
+    for (const item of items) feed.appendChild(renderItem(item));
+    if (config.window > 0) {{
+        // Virtualize: drop the oldest cards but keep the scroll height stable
+        while (feed.children.length > config.window) {{
+            spacer.style.height = (spacer.offsetHeight + feed.firstElementChild.offsetHeight) + 'px';
+            feed.removeChild(feed.firstElementChild);
+        }}
+    }}
+}}
+
+async function loadMore() {{
+    if (loading || offset >= config.total) return;
+    loading = true;
+    const response = await fetch(`{feed_path}?offset=${{offset}}&batch=${{config.batch}}&total=${{config.total}}&latency_ms=${{config.latency_ms}}`, {{method: '{method}'}});
+    const items = await response.json();
+    offset += items.length;
+    append(items);
+    loading = false;
+}}
+
+window.addEventListener('scroll', () => {{
+    if (window.innerHeight + window.scrollY >= document.documentElement.scrollHeight - 200) loadMore();
+}});
+loadMore();
+</script>
+</body>
+</html>
+"""
+
+# Stands in for the large, cacheable bundles real feeds load on every visit
+STATIC_SCRIPT = "".join(f"// synthetic bundle line {index:05d} {'x' * 48}\n" for index in range(1024))
+
+PLATFORMS = {
+    "/youtube": {"title": "YouTube", "render": RENDER_YOUTUBE_JS, "feed_path": "/youtubei/v1/browse", "method": "POST"},
+    "/x/home": {"title": "Home / X", "render": RENDER_X_JS, "feed_path": "/i/api/graphql/synthetic/HomeTimeline", "method": "GET"},
+}
+
+
+class SyntheticFeedHandler(BaseHTTPRequestHandler):
+    def _params(self) -> dict:
+        query = parse_qs(urlparse(self.path).query)
+        return {key: int(query[key][0]) if key in query else default for key, default in DEFAULTS.items()}
+
+    def _send(self, body, content_type: str, cache_control: str = "no-store"):
+        data = body.encode("utf-8") if isinstance(body, str) else body
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", cache_control)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_items(self, make_item):
+        query = parse_qs(urlparse(self.path).query)
+        params = self._params()
+        offset = int(query.get("offset", ["0"])[0])
+        time.sleep(params["latency_ms"] / 1000)
+        end = min(offset + params["batch"], params["total"])
+        self._send(json.dumps([make_item(index) for index in range(offset, end)]), "application/json")
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path in PLATFORMS:
+            platform = PLATFORMS[path]
+            self._send(PAGE_TEMPLATE.format(
+                title=platform["title"],
+                render=platform["render"],
+                config=json.dumps(self._params()),
+                feed_path=platform["feed_path"],
+                method=platform["method"],
+            ), "text/html")
+        elif path == "/i/api/graphql/synthetic/HomeTimeline":
+            self._send_items(x_item)
+        elif path.startswith("/img/"):
+            self._send(png_image(path[len("/img/"):]), "image/png")
+        elif path == "/static/app.js":
+            self._send(STATIC_SCRIPT, "application/javascript", "public, max-age=3600")
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        if urlparse(self.path).path == "/youtubei/v1/browse":
+            self._send_items(youtube_item)
+        else:
+            self.send_error(404)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(port: int = 0) -> ThreadingHTTPServer:
+    """Serve the synthetic pages from a background thread; port 0 picks a free one"""
+    server = ThreadingHTTPServer(("127.0.0.1", port), SyntheticFeedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), SyntheticFeedHandler)
+    print(json.dumps({"listening": f"http://127.0.0.1:{args.port}"}))
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
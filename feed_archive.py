@@ -0,0 +1,323 @@
+"""Searchable history of every scraped tweet and video, kept in SQLite with an FTS5 index.
+
+    python feed_archive.py ingest scraped_data/twitter_feed.json --platform x
+    python feed_archive.py search "rust async" --author @someone --since 2026-10-01
+    python feed_archive.py history https://x.com/someone/status/123
+    python feed_archive.py stats
+
+Items are deduplicated on (platform, tweet URL / video_id); every ingest adds a
+snapshot of the item's counts so views and likes can be followed over time.
+"""
+import argparse
+import json
+import sqlite3
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+DEFAULT_ARCHIVE_PATH = Path("scraped_data") / "archive.sqlite3"
+# Record field that identifies an item on each platform (the URL is the fallback)
+ITEM_KEYS = {'youtube': 'video_id', 'x': 'url'}
+SNAPSHOT_COUNTS = ('views', 'like', 'reply', 'retweet')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    platform TEXT NOT NULL,
+    item_key TEXT NOT NULL,
+    author TEXT,
+    author_name TEXT,
+    body TEXT,
+    url TEXT,
+    posted_at TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    record TEXT NOT NULL,
+    UNIQUE (platform, item_key)
+);
+CREATE INDEX IF NOT EXISTS items_posted_at ON items (posted_at);
+CREATE INDEX IF NOT EXISTS items_author ON items (author COLLATE NOCASE, posted_at);
+-- history() looks items up by key alone, without the platform
+CREATE INDEX IF NOT EXISTS items_item_key ON items (item_key);
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+    body, author, author_name,
+    content='items', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS items_fts_insert AFTER INSERT ON items BEGIN
+    INSERT INTO items_fts (rowid, body, author, author_name) VALUES (new.id, new.body, new.author, new.author_name);
+END;
+CREATE TRIGGER IF NOT EXISTS items_fts_delete AFTER DELETE ON items BEGIN
+    INSERT INTO items_fts (items_fts, rowid, body, author, author_name)
+    VALUES ('delete', old.id, old.body, old.author, old.author_name);
+END;
+CREATE TRIGGER IF NOT EXISTS items_fts_update AFTER UPDATE OF body, author, author_name ON items BEGIN
+    INSERT INTO items_fts (items_fts, rowid, body, author, author_name)
+    VALUES ('delete', old.id, old.body, old.author, old.author_name);
+    INSERT INTO items_fts (rowid, body, author, author_name) VALUES (new.id, new.body, new.author, new.author_name);
+END;
+CREATE TABLE IF NOT EXISTS stats_snapshots (
+    item_id INTEGER NOT NULL REFERENCES items (id),
+    captured_at TEXT NOT NULL,
+    views INTEGER,
+    like INTEGER,
+    reply INTEGER,
+    retweet INTEGER,
+    PRIMARY KEY (item_id, captured_at)
+) WITHOUT ROWID;
+"""
+
+UPSERT_ITEM_SQL = """
+INSERT INTO items (platform, item_key, author, author_name, body, url, posted_at, first_seen, last_seen, record)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (platform, item_key) DO UPDATE SET
+    author = excluded.author,
+    author_name = excluded.author_name,
+    body = excluded.body,
+    url = excluded.url,
+    -- Relative YouTube times get coarser as videos age, so the first estimate is the best one
+    posted_at = coalesce(items.posted_at, excluded.posted_at),
+    last_seen = max(items.last_seen, excluded.last_seen),
+    record = excluded.record
+"""
+
+INSERT_SNAPSHOT_SQL = """
+INSERT OR IGNORE INTO stats_snapshots (item_id, captured_at, views, like, reply, retweet)
+SELECT id, ?, ?, ?, ?, ? FROM items WHERE platform = ? AND item_key = ?
+"""
+
+
+def format_timestamp(moment: datetime) -> str:
+    """UTC ISO-8601 with a Z suffix, the format posted_at and scraped_at are stored in; it sorts chronologically.
+
+    Naive datetimes are taken to be UTC.
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def parse_time_bound(value: Optional[str]) -> Optional[str]:
+    """Accept a date or datetime (ISO-8601) and return it in the archive's timestamp format"""
+    if not value:
+        return None
+    return format_timestamp(datetime.fromisoformat(value.replace('Z', '+00:00')))
+
+
+def fts_query(text: str) -> str:
+    """Quote each search term so user input never reaches FTS5 as query syntax; a trailing * keeps prefix matching"""
+    terms = []
+    for term in text.split():
+        prefix = term.endswith('*')
+        term = term.rstrip('*')
+        if term:
+            terms.append('"' + term.replace('"', '""') + '"' + ('*' if prefix else ''))
+    return ' '.join(terms)
+
+
+def _item_row(platform: str, record: Dict, seen_at: str) -> tuple:
+    if platform == 'x':
+        author = record.get('author') or {}
+        handle, author_name, body = author.get('handle'), author.get('name'), record.get('text')
+    else:
+        handle, author_name, body = record.get('channel'), record.get('channel'), record.get('title')
+    return (
+        platform,
+        record.get(ITEM_KEYS[platform]) or record.get('url'),
+        handle,
+        author_name,
+        body,
+        record.get('url'),
+        record.get('posted_at') or record.get('timestamp'),
+        seen_at,
+        seen_at,
+        json.dumps(record, ensure_ascii=False),
+    )
+
+
+def _snapshot_row(platform: str, record: Dict, seen_at: str) -> tuple:
+    counts = record.get('counts') or {}
+    return (seen_at, *(counts.get(name) for name in SNAPSHOT_COUNTS),
+            platform, record.get(ITEM_KEYS[platform]) or record.get('url'))
+
+
+class FeedArchive:
+    """SQLite archive of scraped items with a full-text index over tweet text, video titles and authors.
+
+    ingest() upserts records in batched transactions and appends a stats snapshot
+    per item and scrape. search() combines FTS5 matching with author, platform and
+    posted_at filters, all served from indexes.
+    """
+
+    def __init__(self, path: Path = DEFAULT_ARCHIVE_PATH):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(path))
+        self.connection.row_factory = sqlite3.Row
+        # WAL lets the front end or CLI read while a scrape is ingesting
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+        self.connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def ingest(self, records: Iterable[Dict], platform: str, batch_size: int = 1000) -> int:
+        """Upsert records and snapshot their counts, one transaction per batch; returns how many were ingested.
+
+        A record's scraped_at is used as its snapshot time, so re-ingesting the same file adds no snapshots.
+        """
+        if platform not in ITEM_KEYS:
+            raise ValueError(f"Unknown platform: {platform}")
+        now = format_timestamp(datetime.now(timezone.utc))
+        ingested = 0
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                ingested += self._ingest_batch(batch, platform, now)
+                batch = []
+        if batch:
+            ingested += self._ingest_batch(batch, platform, now)
+        return ingested
+
+    def _ingest_batch(self, records: List[Dict], platform: str, now: str) -> int:
+        records = [record for record in records if record.get(ITEM_KEYS[platform]) or record.get('url')]
+        with self.connection:
+            self.connection.executemany(
+                UPSERT_ITEM_SQL, [_item_row(platform, record, record.get('scraped_at') or now) for record in records]
+            )
+            self.connection.executemany(
+                INSERT_SNAPSHOT_SQL, [_snapshot_row(platform, record, record.get('scraped_at') or now) for record in records]
+            )
+        return len(records)
+
+    def search(self, text: Optional[str] = None, author: Optional[str] = None, platform: Optional[str] = None,
+               since: Optional[str] = None, until: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        """Newest-first items matching every given filter.
+
+        text is matched against tweet text, video titles and author names; author is a
+        handle (with or without @) or channel name; since/until bound posted_at.
+        """
+        clauses, params = [], []
+        if text and fts_query(text):
+            clauses.append('items.id IN (SELECT rowid FROM items_fts WHERE items_fts MATCH ?)')
+            params.append(fts_query(text))
+        if author:
+            clauses.append('(items.author = ? COLLATE NOCASE OR items.author = ? COLLATE NOCASE)')
+            params += [author.lstrip('@'), '@' + author.lstrip('@')]
+        if platform:
+            clauses.append('items.platform = ?')
+            params.append(platform)
+        if since:
+            clauses.append('items.posted_at >= ?')
+            params.append(parse_time_bound(since))
+        if until:
+            clauses.append('items.posted_at < ?')
+            params.append(parse_time_bound(until))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        rows = self.connection.execute(
+            f'SELECT platform, item_key, posted_at, first_seen, last_seen, record FROM items {where} '
+            'ORDER BY posted_at DESC LIMIT ?',
+            (*params, limit),
+        ).fetchall()
+        return [self._result(row) for row in rows]
+
+    def history(self, item_key: str, platform: Optional[str] = None) -> List[Dict]:
+        """Count snapshots of one item, oldest first"""
+        query = ('SELECT s.captured_at, s.views, s.like, s.reply, s.retweet FROM stats_snapshots s '
+                 'JOIN items ON items.id = s.item_id WHERE items.item_key = ?')
+        params = [item_key]
+        if platform:
+            query += ' AND items.platform = ?'
+            params.append(platform)
+        rows = self.connection.execute(query + ' ORDER BY s.captured_at', params).fetchall()
+        return [{key: row[key] for key in row.keys() if row[key] is not None} for row in rows]
+
+    def stats(self) -> Dict:
+        items = {row['platform']: row['count'] for row in self.connection.execute(
+            'SELECT platform, count(*) AS count FROM items GROUP BY platform')}
+        snapshots = self.connection.execute('SELECT count(*) FROM stats_snapshots').fetchone()[0]
+        oldest, newest = self.connection.execute('SELECT min(posted_at), max(posted_at) FROM items').fetchone()
+        return {'items': items, 'snapshots': snapshots, 'oldest_posted_at': oldest, 'newest_posted_at': newest}
+
+    @staticmethod
+    def _result(row) -> Dict:
+        record = json.loads(row['record'])
+        record.update({
+            'platform': row['platform'],
+            'posted_at': row['posted_at'],
+            'first_seen': row['first_seen'],
+            'last_seen': row['last_seen'],
+        })
+        return record
+
+
+def _describe(item: Dict) -> str:
+    if item['platform'] == 'x':
+        author = (item.get('author') or {}).get('handle', '')
+        body = item.get('text', '')
+    else:
+        author, body = item.get('channel', ''), item.get('title', '')
+    body = ' '.join(body.split())
+    return f"{item.get('posted_at') or '?':20}  {item['platform']:7}  {author:20}  {body[:80]}  {item.get('url')}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--archive", type=Path, default=DEFAULT_ARCHIVE_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest = commands.add_parser("ingest", help="add a saved feed (JSON array or NDJSON) to the archive")
+    ingest.add_argument("path", type=Path)
+    ingest.add_argument("--platform", choices=sorted(ITEM_KEYS), required=True)
+
+    search = commands.add_parser("search", help="full-text search with author, platform and time filters")
+    search.add_argument("text", nargs="?")
+    search.add_argument("--author", help="tweet handle or YouTube channel")
+    search.add_argument("--platform", choices=sorted(ITEM_KEYS))
+    search.add_argument("--since", help="ISO date or datetime, inclusive")
+    search.add_argument("--until", help="ISO date or datetime, exclusive")
+    search.add_argument("--limit", type=int, default=20)
+    search.add_argument("--json", action="store_true", help="print matching records as NDJSON")
+
+    history = commands.add_parser("history", help="count snapshots for one tweet URL or video_id")
+    history.add_argument("item_key")
+    history.add_argument("--platform", choices=sorted(ITEM_KEYS))
+
+    commands.add_parser("stats", help="archive size and covered time range")
+    args = parser.parse_args(argv)
+
+    with FeedArchive(args.archive) as archive:
+        if args.command == "ingest":
+            with open(args.path, encoding="utf-8") as f:
+                if args.path.suffix == ".ndjson":
+                    records = [json.loads(line) for line in f if line.strip()]
+                else:
+                    records = json.load(f)
+            started = time.perf_counter()
+            count = archive.ingest(records, args.platform)
+            print(f"Ingested {count} {args.platform} items in {time.perf_counter() - started:.2f}s")
+        elif args.command == "search":
+            started = time.perf_counter()
+            results = archive.search(args.text, args.author, args.platform, args.since, args.until, args.limit)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            for item in results:
+                print(json.dumps(item, ensure_ascii=False) if args.json else _describe(item))
+            if not args.json:
+                print(f"{len(results)} results in {elapsed_ms:.1f} ms")
+        elif args.command == "history":
+            for snapshot in archive.history(args.item_key, args.platform):
+                print(json.dumps(snapshot))
+        else:
+            print(json.dumps(archive.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""Near-duplicate detection for feed items with MinHash signatures and a banded LSH index.
+
+    python feed_dedup.py scraped_data/feed.json --output scraped_data/feed.deduped.json
+
+Tweets are fingerprinted on overlapping three-word shingles of their text, videos
+on shingles of their title. Links and a leading "RT @handle:" are ignored. Items
+whose estimated Jaccard similarity reaches `threshold` are collapsed into one
+cluster, represented by its earliest-posted member. Shingles rather than single
+words keep the same question about two topics apart, and items only match when
+they contain exactly the same numbers, so "Day 1" and "Day 2" episodes stay apart.
+"""
+import argparse
+import hashlib
+import json
+import re
+import struct
+import time
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
+
+# 128 hash functions split into 32 bands of 4 rows: pairs at 0.8 similarity share
+# a band with probability > 0.99, pairs below 0.3 rarely do; 128 slots estimate
+# similarity to within about 0.04
+SIGNATURE_SIZE = 128
+BAND_ROWS = 4
+DEFAULT_THRESHOLD = 0.8
+# Each salted blake2b digest yields 8 independent 64-bit hash values
+_HASHES_PER_DIGEST = 8
+_SALTS = [index.to_bytes(16, 'big') for index in range(SIGNATURE_SIZE // _HASHES_PER_DIGEST)]
+SHINGLE_WORDS = 3
+# Fewer shingles than this (texts under five words) are too little to compare
+MIN_SHINGLES = 3
+URL_PATTERN = re.compile(r'https?://\S+')
+RETWEET_PREFIX = re.compile(r'^\s*rt\b(?:\s+@\w+:?)?', re.IGNORECASE)
+TOKEN_PATTERN = re.compile(r"[^\W_]+(?:'[^\W_]+)?")
+
+
+def _item_words(record: Dict) -> List[str]:
+    if record.get('type') == 'youtube' or 'title' in record:
+        text = record.get('title') or ''
+    else:
+        text = RETWEET_PREFIX.sub(' ', record.get('text') or '')
+    return TOKEN_PATTERN.findall(URL_PATTERN.sub(' ', text).lower())
+
+
+def item_features(record: Dict) -> Set[str]:
+    """Three-word shingles of a tweet's text or a video's title"""
+    words = _item_words(record)
+    shingles = {' '.join(words[start:start + SHINGLE_WORDS]) for start in range(len(words) - SHINGLE_WORDS + 1)}
+    return shingles if len(shingles) >= MIN_SHINGLES else set()
+
+
+def _feature_hashes(feature: str) -> Tuple[int, ...]:
+    """The feature's value under every MinHash function"""
+    data = feature.encode('utf-8')
+    values = ()
+    for salt in _SALTS:
+        values += struct.unpack('<8Q', hashlib.blake2b(data, digest_size=64, salt=salt).digest())
+    return values
+
+
+def minhash(features: Set[str]) -> Tuple[int, ...]:
+    """MinHash signature; the share of equal slots between two signatures estimates their Jaccard similarity"""
+    return tuple(map(min, zip(*(_feature_hashes(feature) for feature in features))))
+
+
+# An item's numbers plus its MinHash; only items with identical numbers are compared
+Signature = Tuple[FrozenSet[str], Tuple[int, ...]]
+
+
+def signature(record: Dict) -> Optional[Signature]:
+    words = _item_words(record)
+    features = item_features(record)
+    if not features:
+        return None
+    numbers = frozenset(word for word in words if any(character.isdigit() for character in word))
+    return numbers, minhash(features)
+
+
+def similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+    return sum(1 for a, b in zip(first, second) if a == b) / len(first)
+
+
+class NearDuplicateIndex:
+    """LSH index that finds signatures at or above `threshold` similarity without comparing against every item.
+
+    MinHash slots are cut into bands of BAND_ROWS; only items with the same numbers
+    that agree on a whole band land in the same bucket and are compared.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self._buckets = [{} for _ in range(SIGNATURE_SIZE // BAND_ROWS)]
+        self._signatures = {}
+        self.comparisons = 0
+
+    def __len__(self):
+        return len(self._signatures)
+
+    @staticmethod
+    def _bands(value: Signature) -> Iterator[Tuple]:
+        numbers, slots = value
+        for start in range(0, SIGNATURE_SIZE, BAND_ROWS):
+            yield numbers, slots[start:start + BAND_ROWS]
+
+    def add(self, key, value: Signature):
+        self._signatures[key] = value
+        for buckets, band in zip(self._buckets, self._bands(value)):
+            buckets.setdefault(band, []).append(key)
+
+    def query(self, value: Signature) -> List:
+        """Keys of indexed signatures whose estimated similarity to value reaches the threshold"""
+        candidates = set()
+        for buckets, band in zip(self._buckets, self._bands(value)):
+            candidates.update(buckets.get(band, ()))
+        self.comparisons += len(candidates)
+        return [key for key in candidates if similarity(self._signatures[key][1], value[1]) >= self.threshold]
+
+
+def find_clusters(records: List[Dict], threshold: float = DEFAULT_THRESHOLD) -> List[List[int]]:
+    """Indexes of records grouped into near-duplicate clusters (singletons included), in first-seen order"""
+    parent = list(range(len(records)))
+
+    def root(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    index = NearDuplicateIndex(threshold)
+    for position, record in enumerate(records):
+        value = signature(record)
+        if value is None:
+            continue
+        for match in index.query(value):
+            parent[root(match)] = root(position)
+        index.add(position, value)
+
+    clusters = {}
+    for position in range(len(records)):
+        clusters.setdefault(root(position), []).append(position)
+    return sorted(clusters.values(), key=lambda members: members[0])
+
+
+def _duplicate_summary(record: Dict) -> Dict:
+    author = record.get('channel') or (record.get('author') or {}).get('handle')
+    return {'type': record.get('type'), 'url': record.get('url'), 'author': author, 'posted_at': record.get('posted_at')}
+
+
+def collapse_near_duplicates(records: List[Dict], threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """Replace each cluster of near-duplicates with its earliest-posted member, keeping feed order.
+
+    The kept record lists the others under `duplicates` and carries `cluster_size`.
+    Undated members never win over dated ones.
+    """
+    representatives = {}
+    for members in find_clusters(records, threshold):
+        if len(members) == 1:
+            representatives[members[0]] = records[members[0]]
+            continue
+        original = min(members, key=lambda position: (records[position].get('posted_at') or '9999', position))
+        record = dict(records[original])
+        record['cluster_size'] = len(members)
+        record['duplicates'] = [_duplicate_summary(records[position]) for position in members if position != original]
+        representatives[original] = record
+    return [representatives[position] for position in range(len(records)) if position in representatives]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", type=Path, help="feed JSON array, e.g. scraped_data/feed.json")
+    parser.add_argument("--output", type=Path, help="write the collapsed feed here (default: report only)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="estimated Jaccard similarity counted as a duplicate")
+    args = parser.parse_args(argv)
+
+    with open(args.path, encoding="utf-8") as f:
+        records = json.load(f)
+    started = time.perf_counter()
+    collapsed = collapse_near_duplicates(records, args.threshold)
+    seconds = time.perf_counter() - started
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(collapsed, f, ensure_ascii=False, indent=2)
+    print(json.dumps({
+        'items': len(records),
+        'kept': len(collapsed),
+        'clusters': sum(1 for record in collapsed if record.get('cluster_size')),
+        'seconds': round(seconds, 3),
+    }))
+
+
+if __name__ == "__main__":
+    main()
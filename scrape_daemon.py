@@ -0,0 +1,249 @@
+"""Run recurring YouTube and X scrapes from a JSON config file, without prompts.
+
+    python scrape_daemon.py scraper_config.json
+    python scrape_daemon.py scraper_config.json --once
+
+One BrowserPool keeps the browser connected between jobs. Jobs run one at a
+time, so they never contend for the same page, and consecutive starts are at
+least stagger_seconds apart. A failed job is retried with exponential backoff
+before it returns to its interval. Feeds, feed.json, metrics and the daemon's
+own status file are written to a temp file and renamed into place.
+
+Config (see scraper_config.example.json):
+
+    {
+      "output_dir": "scraped_data",
+      "browser": {"port": 9222, "user_data_dir": null, "headless": false},
+      "stagger_seconds": 60,
+      "backoff": {"initial_seconds": 60, "max_seconds": 3600},
+      "download_media": false,
+      "dedup_threshold": null,
+      "jobs": [
+        {"platform": "youtube", "interval_seconds": 3600, "max_items": 100,
+         "scraper": {"deadline_seconds": 180}},
+        {"platform": "x", "interval_seconds": 900, "max_items": 200, "incremental": true}
+      ]
+    }
+
+"scraper" holds keyword arguments for YouTubeScraper / XScraper, e.g.
+extraction_mode, deadline_seconds or max_scrolls. A dedup_threshold (e.g. 0.8)
+collapses near-duplicates in feed.json, see feed_dedup.py.
+"""
+import argparse
+import json
+import logging
+import random
+import signal
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from feed_archive import FeedArchive
+from social_media_scraper import (
+    PROFILE_SCRAPERS,
+    BrowserPool,
+    MediaCache,
+    SeenIndex,
+    configure_logging,
+    scrape_and_store,
+    write_json_atomic,
+    write_run_metrics,
+    write_unified_feed,
+)
+
+logger = logging.getLogger('social_media_scraper.daemon')
+
+DEFAULT_CONFIG = {
+    'output_dir': 'scraped_data',
+    'browser': {},
+    'stagger_seconds': 60,
+    'backoff': {'initial_seconds': 60, 'max_seconds': 3600},
+    'download_media': False,
+    'dedup_threshold': None,
+    'jobs': [],
+}
+# BrowserManager arguments accepted under "browser"
+BROWSER_OPTIONS = ('chrome_path', 'headless', 'port', 'user_data_dir', 'launch_timeout', 'connect_timeout',
+                   'stop_on_exit')
+# Statuses after which a job goes back to its normal interval; 'truncated' still saved a partial feed
+SUCCESS_STATUSES = ('complete', 'truncated')
+
+
+class ScrapeJob:
+    """One recurring scrape of a platform, plus its schedule and failure state"""
+
+    def __init__(self, platform: str, interval_seconds: float, max_items: int = 50, incremental: bool = True,
+                 scraper: Optional[Dict] = None, name: Optional[str] = None):
+        if platform not in PROFILE_SCRAPERS:
+            raise ValueError(f"Unknown platform {platform!r}, expected one of {sorted(PROFILE_SCRAPERS)}")
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be positive")
+        self.platform = platform
+        self.name = name or platform
+        self.interval_seconds = interval_seconds
+        self.max_items = max_items
+        # Recurring runs usually want only what is new since the previous one
+        self.incremental = incremental
+        self.scraper_options = scraper or {}
+        self.next_run = 0.0
+        self.failures = 0
+        self.runs = 0
+        self.last_status = None
+        self.last_error = None
+
+    def reschedule(self, finished_at: float, succeeded: bool, initial_backoff: float, max_backoff: float):
+        """Plan the next run: the job's interval after a success, doubling backoff (with jitter) after failures"""
+        if succeeded:
+            self.failures = 0
+            self.next_run = finished_at + self.interval_seconds
+            return
+        self.failures += 1
+        delay = min(max_backoff, initial_backoff * 2 ** (self.failures - 1))
+        # Jitter keeps jobs that failed together (e.g. browser gone) from retrying in lockstep
+        self.next_run = finished_at + delay * random.uniform(1.0, 1.1)
+
+    def report(self) -> Dict:
+        return {
+            'name': self.name,
+            'platform': self.platform,
+            'runs': self.runs,
+            'last_status': self.last_status,
+            'last_error': self.last_error,
+            'failures': self.failures,
+            'next_run': datetime.fromtimestamp(self.next_run, timezone.utc).isoformat() if self.next_run else None,
+        }
+
+
+def load_config(path: Path) -> Dict:
+    """Read a daemon config file and fill in defaults; raises ValueError for unusable settings"""
+    with open(path, encoding="utf-8") as f:
+        config = {**DEFAULT_CONFIG, **json.load(f)}
+    config['backoff'] = {**DEFAULT_CONFIG['backoff'], **config['backoff']}
+    unknown = set(config['browser']) - set(BROWSER_OPTIONS)
+    if unknown:
+        raise ValueError(f"Unknown browser options: {sorted(unknown)}")
+    if not config['jobs']:
+        raise ValueError("The config has no jobs")
+    names = [job.get('name') or job.get('platform') for job in config['jobs']]
+    if len(set(names)) != len(names):
+        raise ValueError("Jobs for the same platform need distinct names")
+    return config
+
+
+class ScrapeDaemon:
+    """Runs the configured jobs forever (or once each) over one long-lived browser connection"""
+
+    def __init__(self, config: Dict):
+        self.config = config
+        self.output_dir = Path(config['output_dir'])
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.jobs = [ScrapeJob(**job) for job in config['jobs']]
+        self.stagger_seconds = config['stagger_seconds']
+        self.initial_backoff = config['backoff']['initial_seconds']
+        self.max_backoff = config['backoff']['max_seconds']
+        self.pool = BrowserPool(**config['browser'])
+        self.archive = FeedArchive(self.output_dir / "archive.sqlite3")
+        self.seen_index = None
+        if any(job.incremental for job in self.jobs):
+            self.seen_index = SeenIndex(self.output_dir / "seen_index.sqlite3")
+        self.media_cache = MediaCache(self.output_dir / "media", variant_widths=(320,)) if config['download_media'] else None
+        self._stop = threading.Event()
+        self._last_start = None
+
+    def stop(self):
+        """Ask the loop to exit once the running job (if any) finishes"""
+        self._stop.set()
+
+    def close(self):
+        self.pool.close()
+        self.archive.close()
+        if self.seen_index is not None:
+            self.seen_index.close()
+
+    def run(self, once: bool = False):
+        """Run jobs as they come due until stop() is called; with once, run every job a single time"""
+        started = time.time()
+        for position, job in enumerate(self.jobs):
+            job.next_run = started + position * self.stagger_seconds
+        pending = list(self.jobs)
+
+        while pending and not self._stop.is_set():
+            job = min(pending, key=lambda candidate: candidate.next_run)
+            due = job.next_run
+            if self._last_start is not None:
+                due = max(due, self._last_start + self.stagger_seconds)
+            if self._stop.wait(max(0.0, due - time.time())):
+                break
+
+            self._last_start = time.time()
+            self.run_job(job)
+            if once:
+                pending.remove(job)
+            self._write_status()
+
+    def run_job(self, job: ScrapeJob) -> bool:
+        """Scrape one job's feed into the output directory; returns whether it succeeded"""
+        scraper_class, stem = PROFILE_SCRAPERS[job.platform]
+        seen_index = self.seen_index if job.incremental else None
+        logger.info("Starting job %s (run %d)", job.name, job.runs + 1)
+        job.runs += 1
+        items = 0
+        try:
+            scraper = scraper_class(browser_pool=self.pool, seen_index=seen_index, **job.scraper_options)
+            items = scrape_and_store(scraper, job.max_items, self.output_dir, stem, seen_index, self.archive,
+                                     self.media_cache)
+            write_unified_feed(self.output_dir, dedup_threshold=self.config['dedup_threshold'])
+            write_run_metrics([scraper], self.output_dir / "metrics")
+            job.last_status = scraper.metrics.status
+            job.last_error = None
+        except Exception as e:
+            logger.exception("Job %s failed", job.name)
+            job.last_status = 'failed'
+            job.last_error = str(e)
+
+        succeeded = job.last_status in SUCCESS_STATUSES
+        job.reschedule(time.time(), succeeded, self.initial_backoff, self.max_backoff)
+        if succeeded:
+            logger.info("Job %s %s with %d items", job.name, job.last_status, items)
+        else:
+            logger.warning("Job %s failed %d time(s) in a row, retrying in %.0fs",
+                           job.name, job.failures, job.next_run - time.time())
+        return succeeded
+
+    def _write_status(self):
+        write_json_atomic(self.output_dir / "daemon_status.json", {
+            'updated_at': datetime.now(timezone.utc).isoformat(),
+            'jobs': [job.report() for job in self.jobs],
+            'browser_sessions': self.pool.report(),
+        })
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("config", type=Path, help="daemon config JSON")
+    parser.add_argument("--once", action="store_true", help="run every job once, then exit")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    configure_logging()
+    daemon = ScrapeDaemon(load_config(args.config))
+
+    # Finish the current job, then exit cleanly on Ctrl-C or a service manager's SIGTERM
+    def request_stop(signum, frame):
+        logger.info("Received signal %d, stopping after the current job", signum)
+        daemon.stop()
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+    try:
+        daemon.run(once=args.once)
+    finally:
+        daemon.close()
+
+
+if __name__ == "__main__":
+    main()
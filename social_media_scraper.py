@@ -1,441 +1,2713 @@
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import sync_playwright, ElementHandle, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright, ElementHandle as AsyncElementHandle, TimeoutError as AsyncPlaywrightTimeoutError
+import argparse
+import asyncio
+import logging
 import time
+import re
 import json
-from typing import List, Dict, Optional
+import html
+import hashlib
+import heapq
+import inspect
+import itertools
+import io
+import math
+import mimetypes
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, ExitStack
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Iterable, Iterator
 import os
 import subprocess
+import shutil
+import queue
+import threading
+import sqlite3
+import stat
+import tempfile
 import requests
 from pathlib import Path
+from urllib.parse import urlparse
+
+from feed_archive import FeedArchive, format_timestamp
+from feed_dedup import collapse_near_duplicates
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is only needed for downscaled media variants
+    Image = None
+
+# Quiet unless the application configures logging (main() honours $SCRAPER_LOG_LEVEL)
+logger = logging.getLogger('social_media_scraper')
 
 CHROME_PATH = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+DEBUGGING_PORT = 9222
+# Chrome prints this to stderr once its DevTools endpoint accepts connections
+DEVTOOLS_LISTENING_PATTERN = re.compile(r'DevTools listening on (ws://\S+)')
+
+# Serializes one tweet <article> into the same shape XScraper builds from element
+# handles. Kept as a plain function body so several page scripts can share it.
+SERIALIZE_TWEET_JS = """
+    const serializeTweet = (article) => {
+        const timeElement = article.querySelector('time');
+        if (!timeElement) return null;
+        const text = (element) => element ? element.textContent.trim() : '';
+
+        const author = {name: '', handle: ''};
+        const authorElement = article.querySelector('[data-testid="User-Name"]');
+        if (authorElement) {
+            const nameElement = authorElement.querySelector('div.css-175oi2r.r-1awozwy.r-18u37iz.r-1wbh5a2 div[dir="ltr"]');
+            if (nameElement) author.name = text(nameElement);
+            const handleElement = authorElement.querySelector('div.css-175oi2r.r-1d09ksm div[dir="ltr"]');
+            if (handleElement) author.handle = text(handleElement);
+        }
+
+        const stats = {};
+        const readStat = (key, selector) => {
+            const container = article.querySelector(selector);
+            if (!container) return;
+            const count = container.querySelector('span[data-testid="app-text-transition-container"]');
+            stats[key] = count ? text(count) : '0';
+        };
+        readStat('reply', '[data-testid="reply"]');
+        readStat('retweet', '[data-testid="retweet"]');
+        readStat('like', '[data-testid="like"]');
+        readStat('views', 'a[aria-label*="views"]');
+
+        let mediaUrl = null;
+        const mediaContainer = article.querySelector('[data-testid="tweetPhoto"]');
+        if (mediaContainer) {
+            const img = mediaContainer.querySelector('img');
+            if (img) mediaUrl = img.getAttribute('src');
+        } else {
+            const video = article.querySelector('video');
+            if (video) mediaUrl = video.getAttribute('poster');
+        }
+
+        const link = timeElement.parentElement ? timeElement.parentElement.href : null;
+        return {
+            author: author,
+            text: text(article.querySelector('[data-testid="tweetText"]')),
+            timestamp: timeElement.getAttribute('datetime'),
+            stats: stats,
+            url: link || null,
+            media_url: mediaUrl,
+        };
+    };
+"""
+
+# Serializes every tweet currently in the DOM with a single evaluate call
+TWEET_BATCH_JS = """() => {
+""" + SERIALIZE_TWEET_JS + """
+    return Array.from(document.querySelectorAll('article[role="article"]'))
+        .map(serializeTweet)
+        .filter((tweet) => tweet !== null);
+}"""
+
+# Installs a MutationObserver that queues tweet articles as they are attached, so
+# each scroll only serializes new nodes. Articles the virtualized timeline detaches
+# before we drain are serialized on removal instead of being lost.
+TWEET_OBSERVER_INSTALL_JS = """() => {
+    if (window.__tweetCollector) return;
+""" + SERIALIZE_TWEET_JS + """
+    const selector = 'article[role="article"]';
+    const pending = new Set();
+    const seen = new Set();
+    let ready = [];
+
+    // Returns false while the article is still rendering and should stay queued
+    const take = (article) => {
+        const tweet = serializeTweet(article);
+        if (!tweet || !tweet.url) return false;
+        if (!seen.has(tweet.url)) {
+            seen.add(tweet.url);
+            ready.push(tweet);
+        }
+        return true;
+    };
+    const articlesIn = (node) => {
+        if (node.nodeType !== Node.ELEMENT_NODE) return [];
+        return node.matches(selector) ? [node] : Array.from(node.querySelectorAll(selector));
+    };
+
+    const observer = new MutationObserver((mutations) => {
+        for (const mutation of mutations) {
+            for (const node of mutation.addedNodes) {
+                const element = node.nodeType === Node.ELEMENT_NODE ? node : node.parentElement;
+                const article = element ? element.closest(selector) : null;
+                if (article) {
+                    pending.add(article);
+                } else {
+                    articlesIn(node).forEach((added) => pending.add(added));
+                }
+            }
+            for (const node of mutation.removedNodes) {
+                for (const removed of articlesIn(node)) {
+                    if (pending.delete(removed)) take(removed);
+                }
+            }
+        }
+    });
+    observer.observe(document.body, {childList: true, subtree: true});
+    document.querySelectorAll(selector).forEach((article) => pending.add(article));
+
+    window.__tweetCollector = {
+        drain: () => {
+            for (const article of pending) {
+                if (take(article) || !article.isConnected) pending.delete(article);
+            }
+            const drained = ready;
+            ready = [];
+            return drained;
+        },
+    };
+}"""
+
+TWEET_OBSERVER_DRAIN_JS = "() => window.__tweetCollector ? window.__tweetCollector.drain() : []"
+
+# Serializes the first `maxVideos` grid cards (all when null), or the cards in a [start, end) pair,
+# into YouTubeScraper's video_data shape
+VIDEO_BATCH_JS = """(range) => {
+    const [start, end] = Array.isArray(range) ? range : [0, range];
+    const text = (element) => element ? element.textContent.trim() : null;
+    const toUrl = (href) => href.startsWith('http') ? href : 'https://www.youtube.com' + href;
+    const toVideoId = (href) => href.includes('v=') ? href.split('v=').pop().split('&')[0] : null;
+
+    return Array.from(document.querySelectorAll('ytd-rich-grid-media')).slice(start, end ?? undefined).map((card) => {
+        let url = null;
+        let videoId = null;
+        for (const selector of ['#thumbnail[href]', '#video-title[href]']) {
+            const link = card.querySelector(selector);
+            const href = link ? link.getAttribute('href') : null;
+            if (href) {
+                url = toUrl(href);
+                videoId = toVideoId(href);
+                break;
+            }
+        }
+
+        const metadata = Array.from(card.querySelectorAll('#metadata-line span'));
+        let thumbnail = null;
+        if (videoId) {
+            thumbnail = `https://i.ytimg.com/vi/${videoId}/hq720.jpg`;
+        } else {
+            const img = card.querySelector('#thumbnail img[src]');
+            if (img) thumbnail = img.getAttribute('src');
+        }
+
+        return {
+            title: text(card.querySelector('#video-title')) ?? 'Unknown Title',
+            url: url,
+            channel: text(card.querySelector('#channel-name a')) ?? 'Unknown Channel',
+            views: metadata.length >= 2 ? text(metadata[0]) : 'Unknown Views',
+            posted_time: metadata.length >= 2 ? text(metadata[1]) : 'Unknown Time',
+            thumbnail: thumbnail,
+            video_id: videoId,
+        };
+    });
+}"""
 
 class BrowserManager:
-    def __init__(self, chrome_path=CHROME_PATH):
-        self.chrome_path = chrome_path
+    """Connects Playwright to a Chrome instance with remote debugging enabled.
+
+    Reuses a Chrome already listening on `port`, otherwise launches one and waits
+    for its "DevTools listening on ..." line instead of polling the port. The
+    binary is resolved from chrome_path, $CHROME_PATH, the macOS default, Chrome or
+    Chromium on PATH, and finally Playwright's bundled Chromium. Pass a started
+    `playwright` to share it (it is then not stopped on exit).
+    
+    With port=0 a new Chrome is always launched and picks a free port itself; the
+    port it reports is stored back on `port`. stop_on_exit terminates a Chrome this
+    manager launched instead of leaving it running for the next attach.
+    
+    `deadline` (a time.monotonic() value, e.g. ScrapeBudget.deadline) caps the
+    probe, launch and connect timeouts so startup cannot outlast a scrape's budget.
+    """
+    
+    def __init__(self, chrome_path=None, headless: bool = False, port: int = DEBUGGING_PORT,
+                 user_data_dir: str = None, launch_timeout: float = 15, playwright=None,
+                 stop_on_exit: bool = False, connect_timeout: float = 20, deadline: Optional[float] = None):
+        self.chrome_path = chrome_path or os.environ.get('CHROME_PATH') or CHROME_PATH
+        self.headless = headless
+        self.port = port
+        self.user_data_dir = user_data_dir
+        self.launch_timeout = launch_timeout
+        self.connect_timeout = connect_timeout
+        self.deadline = deadline
+        self.stop_on_exit = stop_on_exit
         self.browser = None
-        self.playwright = None
+        self.playwright = playwright
+        self._owns_playwright = playwright is None
+        self.process = None
+        # 'attached' to a running Chrome or 'cold' launch, and how long it took
+        self.startup_kind = None
+        self.startup_seconds = None
+    
+    @property
+    def endpoint(self) -> str:
+        return f'http://localhost:{self.port}'
+    
+    def _time_left(self, limit: float) -> float:
+        """limit in seconds, shortened to what is left before the deadline"""
+        if self.deadline is None:
+            return limit
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            raise RuntimeError('Scrape deadline passed before Chrome was ready')
+        return min(limit, remaining)
     
     def __enter__(self):
-        self.playwright = sync_playwright().start()
-        self.browser = self._setup_browser_with_instance()
+        started = time.perf_counter()
+        if self.playwright is None:
+            self.playwright = sync_playwright().start()
+        try:
+            self.browser = self._setup_browser_with_instance()
+        except BaseException as error:
+            # __exit__ is not called when __enter__ raises; stop what was started so far
+            self.__exit__(type(error), error, error.__traceback__)
+            raise
+        self.startup_seconds = time.perf_counter() - started
+        logger.info('Browser ready in %.0f ms (%s start)', self.startup_seconds * 1000, self.startup_kind)
         return self.browser
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.browser:
             self.browser.close()
-        if self.playwright:
+        if self.playwright and self._owns_playwright:
             self.playwright.stop()
+        self._stop_launched_chrome()
+    
+    def _stop_launched_chrome(self):
+        if self.stop_on_exit and self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
     
     def _setup_browser_with_instance(self):
         """Connect to an existing Chrome instance or start a new one with remote debugging enabled"""
+        endpoint = self._ensure_debugging_endpoint()
+        
+        # Connect to the Chrome instance
+        timeout = self._time_left(self.connect_timeout)
+        try:
+            browser = self.playwright.chromium.connect_over_cdp(
+                endpoint_url=endpoint,
+                timeout=timeout * 1000
+            )
+            return browser
+        except Exception as e:
+            raise self._connection_error(e)
+    
+    def _ensure_debugging_endpoint(self) -> str:
+        """Make sure a Chrome instance is listening on the debugging port and return its endpoint"""
+        if self.port == 0:
+            self.startup_kind = 'cold'
+            return self._launch_chrome()
         try:
             # Check if browser is already running with debugging port
-            response = requests.get('http://localhost:9222/json/version', timeout=2)
+            response = requests.get(f'{self.endpoint}/json/version', timeout=self._time_left(1))
             if response.status_code == 200:
-                print('Connecting to existing Chrome instance')
-                browser = self.playwright.chromium.connect_over_cdp(
-                    endpoint_url='http://localhost:9222',
-                    timeout=20000  # 20 second timeout for connection
-                )
-                return browser
+                logger.info('Connecting to existing Chrome instance')
+                self.startup_kind = 'attached'
+                return self.endpoint
         except requests.ConnectionError:
-            print('No existing Chrome instance with debugging port found, starting a new one')
+            logger.info('No existing Chrome instance with debugging port found, starting a new one')
+        
+        self.startup_kind = 'cold'
+        return self._launch_chrome()
+    
+    def _resolve_chrome_path(self) -> str:
+        if os.path.exists(self.chrome_path):
+            return self.chrome_path
+        for name in ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser'):
+            found = shutil.which(name)
+            if found:
+                return found
+        # Playwright's bundled Chromium (installed with `playwright install chromium`)
+        return self.playwright.chromium.executable_path
+    
+    def _launch_chrome(self) -> str:
+        """Start Chrome with remote debugging enabled and return its websocket endpoint once it is listening"""
+        args = [
+            self._resolve_chrome_path(),
+            f'--remote-debugging-port={self.port}',
+            '--no-first-run',
+            '--no-default-browser-check',
+            '--disable-blink-features=AutomationControlled',
+        ]
+        if self.user_data_dir:
+            args.append(f'--user-data-dir={self.user_data_dir}')
+        if self.headless:
+            args.append('--headless=new')
         
-        # Start a new Chrome instance with remote debugging enabled
-        subprocess.Popen(
-            [
-                self.chrome_path,
-                '--remote-debugging-port=9222',
-                '--no-first-run',
-                '--no-default-browser-check',
-                '--disable-blink-features=AutomationControlled',
-            ],
+        self.process = subprocess.Popen(
+            args,
             stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
         )
+        return self._wait_for_devtools(self.process)
+    
+    def _wait_for_devtools(self, process) -> str:
+        """Block until Chrome announces its DevTools websocket on stderr"""
+        lines = queue.Queue()
+        
+        # Keep draining stderr for the life of the process so Chrome never blocks on a full pipe
+        def pump():
+            for line in process.stderr:
+                lines.put(line)
+            lines.put(None)
+        threading.Thread(target=pump, daemon=True).start()
         
-        # Wait for Chrome to start and be available
-        for _ in range(10):
+        launch_timeout = self._time_left(self.launch_timeout)
+        deadline = time.monotonic() + launch_timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise RuntimeError(f'Chrome did not open its debugging port within {launch_timeout:.1f} s')
             try:
-                response = requests.get('http://localhost:9222/json/version', timeout=2)
-                if response.status_code == 200:
-                    break
-            except requests.ConnectionError:
-                pass
-            time.sleep(1)
+                line = lines.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            if line is None:
+                raise RuntimeError(f'Chrome exited with code {process.wait()} before opening its debugging port')
+            match = DEVTOOLS_LISTENING_PATTERN.search(line)
+            if match:
+                # With --remote-debugging-port=0 this is the only place the chosen port shows up
+                self.port = urlparse(match.group(1)).port or self.port
+                return match.group(1)
+    
+    def _connection_error(self, error: Exception) -> RuntimeError:
+        logger.error('Failed to connect to Chrome: %s', error)
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return RuntimeError('Scrape deadline passed while connecting to Chrome')
+        return RuntimeError(
+            'To start Chrome in Debug mode, you need to close all existing Chrome instances and try again.'
+        )
+
+class BrowserPool:
+    """Keeps connected browsers warm across scrapes so only the first session pays for startup.
+
+    session() hands out an idle browser when one is still connected and launches
+    (or attaches to) one otherwise. Up to `size` browsers are kept idle between
+    sessions; all share a single Playwright driver. A session's `deadline` only
+    bounds launching or attaching; a warm browser is handed out immediately.
+    """
+    
+    def __init__(self, size: int = 1, **manager_options):
+        self.size = size
+        self.manager_options = manager_options
+        self.playwright = None
+        self._idle = []
+        self._managers = []
+        self.sessions = []
+    
+    @contextmanager
+    def session(self, deadline: Optional[float] = None):
+        started = time.perf_counter()
+        if self.playwright is None:
+            self.playwright = sync_playwright().start()
+        
+        manager = None
+        while self._idle:
+            candidate = self._idle.pop()
+            if candidate.browser.is_connected():
+                manager = candidate
+                break
+            self._managers.remove(candidate)
+        
+        if manager is not None:
+            kind = 'warm'
+        else:
+            manager = BrowserManager(playwright=self.playwright, deadline=deadline, **self.manager_options)
+            # A manager that fails to start has already stopped the Chrome it launched
+            manager.__enter__()
+            self._managers.append(manager)
+            kind = manager.startup_kind
+        self.sessions.append({'kind': kind, 'startup_ms': round((time.perf_counter() - started) * 1000, 1)})
         
-        # Connect to the Chrome instance
         try:
-            browser = self.playwright.chromium.connect_over_cdp(
-                endpoint_url='http://localhost:9222',
-                timeout=20000
+            yield manager.browser
+        finally:
+            if len(self._idle) < self.size:
+                self._idle.append(manager)
+            else:
+                self._managers.remove(manager)
+                manager.__exit__(None, None, None)
+    
+    def report(self) -> Dict:
+        """Mean startup latency per session kind (cold, attached, warm)"""
+        summary = {}
+        for kind in {session['kind'] for session in self.sessions}:
+            latencies = [session['startup_ms'] for session in self.sessions if session['kind'] == kind]
+            summary[kind] = {'sessions': len(latencies), 'mean_startup_ms': round(sum(latencies) / len(latencies), 1)}
+        return summary
+    
+    def close(self):
+        for manager in self._managers:
+            manager.__exit__(None, None, None)
+        self._managers = []
+        self._idle = []
+        if self.playwright:
+            self.playwright.stop()
+            self.playwright = None
+
+class AsyncBrowserManager(BrowserManager):
+    """asyncio counterpart of BrowserManager, built on playwright.async_api"""
+    
+    async def __aenter__(self):
+        started = time.perf_counter()
+        self.playwright = await async_playwright().start()
+        try:
+            # Probing and launching Chrome is blocking, keep it off the event loop
+            endpoint = await asyncio.to_thread(self._ensure_debugging_endpoint)
+            timeout = self._time_left(self.connect_timeout)
+            try:
+                self.browser = await self.playwright.chromium.connect_over_cdp(
+                    endpoint_url=endpoint,
+                    timeout=timeout * 1000
+                )
+            except Exception as e:
+                raise self._connection_error(e)
+        except BaseException as error:
+            await self.__aexit__(type(error), error, error.__traceback__)
+            raise
+        self.startup_seconds = time.perf_counter() - started
+        logger.info('Browser ready in %.0f ms (%s start)', self.startup_seconds * 1000, self.startup_kind)
+        return self.browser
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.browser:
+            await self.browser.close()
+        if self.playwright:
+            await self.playwright.stop()
+        await asyncio.to_thread(self._stop_launched_chrome)
+
+# Feed XHRs whose completion means the next batch of items is on its way
+YOUTUBE_BROWSE_URL_PATTERN = re.compile(r'/youtubei/v1/browse')
+X_TIMELINE_URL_PATTERN = re.compile(r'/i/api/graphql/[^/]+/Home(Latest)?Timeline')
+
+SCROLL_STATE_JS = """(selector) => ({
+    count: document.querySelectorAll(selector).length,
+    height: document.documentElement.scrollHeight,
+    position: window.pageYOffset || document.documentElement.scrollTop,
+})"""
+
+# Wraps fetch and XMLHttpRequest to count in-flight feed requests (URLs matching the
+# pattern) so settling can be judged inside the page. Installed with add_init_script
+# before navigation, so it sees the feed's first requests and any fetch reference the
+# page's own scripts keep
+FEED_REQUEST_TRACKER_JS = """(pattern) => {
+    if (window.__feedRequests) return;
+    const feed = new RegExp(pattern);
+    const requests = window.__feedRequests = {inflight: 0, lastActivity: performance.now()};
+    const started = () => { requests.inflight += 1; requests.lastActivity = performance.now(); };
+    const finished = () => {
+        requests.inflight = Math.max(0, requests.inflight - 1);
+        requests.lastActivity = performance.now();
+    };
+    const fetch = window.fetch;
+    window.fetch = function (input) {
+        const url = typeof input === 'string' ? input : (input && input.url) || String(input);
+        if (!feed.test(url)) return fetch.apply(this, arguments);
+        started();
+        return fetch.apply(this, arguments).finally(finished);
+    };
+    const open = XMLHttpRequest.prototype.open;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__feedRequest = feed.test(String(url));
+        return open.apply(this, arguments);
+    };
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        if (this.__feedRequest) {
+            started();
+            this.addEventListener('loadend', finished, {once: true});
+        }
+        return send.apply(this, arguments);
+    };
+}"""
+
+def feed_request_tracker_script(feed_url_pattern=None) -> str:
+    """FEED_REQUEST_TRACKER_JS applied to a pattern, as a script for page.add_init_script"""
+    # An empty pattern counts every fetch/XHR as a feed request
+    pattern = feed_url_pattern.pattern if feed_url_pattern is not None else ''
+    return f"({FEED_REQUEST_TRACKER_JS})({json.dumps(pattern)});"
+
+# Records the feed's state, scrolls to the bottom and notes when
+SCROLL_STEP_JS = """(selector) => {
+    const state = {
+        count: document.querySelectorAll(selector).length,
+        height: document.documentElement.scrollHeight,
+        position: window.pageYOffset || document.documentElement.scrollTop,
+    };
+    window.scrollTo(0, document.documentElement.scrollHeight);
+    window.__feedScrolledAt = performance.now();
+    return state;
+}"""
+
+# Resolves once the feed has rendered more items or grown taller than `state`, or once no
+# feed request has been in flight for settleMs since the scroll. Without the tracker
+# (FEED_REQUEST_TRACKER_JS) only new items end the step early
+FEED_STEP_DONE_JS = """([selector, state, settleMs]) => {
+    if (document.querySelectorAll(selector).length !== state.count
+            || document.documentElement.scrollHeight > state.height) return true;
+    const requests = window.__feedRequests;
+    if (!requests || requests.inflight > 0) return false;
+    return performance.now() - Math.max(requests.lastActivity, window.__feedScrolledAt) >= settleMs;
+}"""
+# Poll on an interval rather than requestAnimationFrame, which stalls in background tabs
+FEED_STEP_POLL_MS = 50
+
+class ScrollDriver:
+    """Scrolls a feed and returns as soon as new items render or the feed's XHRs settle.
+
+    Each step waits at most max_wait_ms. A step ends early when the item count or
+    page height changes, or when no feed request has been in flight for settle_ms.
+    Both are checked inside the page by a single wait_for_function, so a step costs
+    three Playwright calls however long it waits. After idle_steps_for_end steps with
+    no movement and no new content the feed is considered exhausted.
+    """
+
+    def __init__(self, page, item_selector: str, max_wait_ms: int = 5000,
+                 settle_ms: int = 500, idle_steps_for_end: int = 3):
+        self.page = page
+        self.item_selector = item_selector
+        self.max_wait_ms = max_wait_ms
+        self.settle_ms = settle_ms
+        self.idle_steps_for_end = idle_steps_for_end
+        self.steps = []
+        self.end_of_feed = False
+        self._idle_steps = 0
+
+    @property
+    def total_wait_ms(self) -> int:
+        return sum(step['waited_ms'] for step in self.steps)
+
+    def step(self) -> Dict:
+        """Scroll to the bottom once and wait for the feed to react; returns a report of the step"""
+        before = self.page.evaluate(SCROLL_STEP_JS, self.item_selector)
+        scrolled_at = time.monotonic()
+        timed_out = False
+        try:
+            self.page.wait_for_function(
+                FEED_STEP_DONE_JS,
+                arg=[self.item_selector, before, self.settle_ms],
+                timeout=max(1, self.max_wait_ms),
+                polling=FEED_STEP_POLL_MS,
             )
-            return browser
-        except Exception as e:
-            print(f'Failed to connect to Chrome: {str(e)}')
-            raise RuntimeError(
-                'To start Chrome in Debug mode, you need to close all existing Chrome instances and try again.'
+        except PlaywrightTimeoutError:
+            timed_out = True
+        after = self.page.evaluate(SCROLL_STATE_JS, self.item_selector)
+        return self._record_step(before, after, timed_out, scrolled_at)
+
+    def _record_step(self, before: Dict, after: Dict, timed_out: bool, scrolled_at: float) -> Dict:
+        waited_ms = int((time.monotonic() - scrolled_at) * 1000)
+        moved = after['position'] - before['position']
+        grew = after['count'] != before['count'] or after['height'] > before['height']
+        reason = 'new_items' if grew else 'timeout' if timed_out else 'settled'
+
+        if grew or moved > 0:
+            self._idle_steps = 0
+        else:
+            self._idle_steps += 1
+            self.end_of_feed = self._idle_steps >= self.idle_steps_for_end
+
+        step = {
+            'waited_ms': waited_ms,
+            'reason': reason,
+            'items': after['count'],
+            'new_items': after['count'] - before['count'],
+            'moved': moved,
+        }
+        self.steps.append(step)
+        return step
+
+class AsyncScrollDriver(ScrollDriver):
+    """ScrollDriver for playwright.async_api pages; step() is a coroutine"""
+
+    async def step(self) -> Dict:
+        before = await self.page.evaluate(SCROLL_STEP_JS, self.item_selector)
+        scrolled_at = time.monotonic()
+        timed_out = False
+        try:
+            await self.page.wait_for_function(
+                FEED_STEP_DONE_JS,
+                arg=[self.item_selector, before, self.settle_ms],
+                timeout=max(1, self.max_wait_ms),
+                polling=FEED_STEP_POLL_MS,
             )
+        except AsyncPlaywrightTimeoutError:
+            timed_out = True
+        after = await self.page.evaluate(SCROLL_STATE_JS, self.item_selector)
+        return self._record_step(before, after, timed_out, scrolled_at)
 
-class YouTubeScraper:
-    def __init__(self, user_data_dir: str = None):
-        self.user_data_dir = user_data_dir
+def _walk_json(node, key: str):
+    """Yield every value stored under `key` anywhere in a decoded JSON payload, without descending into matches"""
+    if isinstance(node, dict):
+        for name, value in node.items():
+            if name == key:
+                yield value
+            else:
+                yield from _walk_json(value, key)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _walk_json(item, key)
+
+COUNT_UNITS = ((1_000, 'K'), (1_000_000, 'M'), (1_000_000_000, 'B'))
+
+def _format_count(count) -> str:
+    """Render a number the way the feeds display it (e.g. 4500 -> 4.5K)"""
+    try:
+        count = int(count)
+    except (TypeError, ValueError):
+        return "0"
+    if count < 1_000:
+        return str(count)
+    for threshold, suffix in COUNT_UNITS:
+        # Round before picking the unit, so 999_999 shows as 1M rather than 1000K
+        value = round(count / threshold, 1)
+        if value < 1_000 or suffix == COUNT_UNITS[-1][1]:
+            return f"{value:.1f}".rstrip('0').rstrip('.') + suffix
+
+def _int_or_none(value) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+def _youtube_text(node) -> Optional[str]:
+    if not isinstance(node, dict):
+        return None
+    if 'simpleText' in node:
+        return node['simpleText'].strip()
+    if 'runs' in node:
+        return ''.join(run.get('text', '') for run in node['runs']).strip()
+    return None
+
+def extract_yt_initial_data(document: str) -> Optional[Dict]:
+    """Pull the ytInitialData object out of a YouTube HTML document"""
+    match = re.search(r'ytInitialData\s*=\s*', document)
+    if not match:
+        return None
+    try:
+        data, _ = json.JSONDecoder().raw_decode(document, match.end())
+    except ValueError:
+        return None
+    return data
+
+def parse_youtube_browse_payload(payload) -> List[Dict]:
+    """Build video_data records from ytInitialData or a browse continuation response"""
+    videos = []
+    for renderer in _walk_json(payload, 'videoRenderer'):
+        video_id = renderer.get('videoId')
+        if not video_id:
+            continue
+        channel = (_youtube_text(renderer.get('ownerText'))
+                   or _youtube_text(renderer.get('shortBylineText'))
+                   or "Unknown Channel")
+        views = (_youtube_text(renderer.get('shortViewCountText'))
+                 or _youtube_text(renderer.get('viewCountText'))
+                 or "Unknown Views")
+        videos.append({
+            'title': _youtube_text(renderer.get('title')) or "Unknown Title",
+            'url': f'https://www.youtube.com/watch?v={video_id}',
+            'channel': channel,
+            'views': views,
+            'posted_time': _youtube_text(renderer.get('publishedTimeText')) or "Unknown Time",
+            'thumbnail': f'https://i.ytimg.com/vi/{video_id}/hq720.jpg',
+            'video_id': video_id
+        })
+    return videos
+
+def _x_tweet_record(result: Dict) -> Optional[Dict]:
+    if result.get('__typename') == 'TweetWithVisibilityResults':
+        result = result.get('tweet', {})
+    legacy = result.get('legacy')
+    if not legacy:
+        return None
+    # Retweets render as the original tweet in the timeline
+    retweeted = legacy.get('retweeted_status_result', {}).get('result')
+    if retweeted:
+        return _x_tweet_record(retweeted)
+    
+    user = result.get('core', {}).get('user_results', {}).get('result', {})
+    user_names = {**user.get('legacy', {}), **user.get('core', {})}
+    screen_name = user_names.get('screen_name', '')
+    
+    note = result.get('note_tweet', {}).get('note_tweet_results', {}).get('result', {})
+    if note.get('text'):
+        text = note['text']
+    else:
+        # full_text escapes &, < and >, while display_text_range counts the unescaped characters
+        full_text = html.unescape(legacy.get('full_text', ''))
+        start, end = legacy.get('display_text_range', [0, len(full_text)])
+        text = full_text[start:end]
+    
+    timestamp = None
+    if legacy.get('created_at'):
+        created = datetime.strptime(legacy['created_at'], '%a %b %d %H:%M:%S %z %Y')
+        timestamp = created.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+    
+    stats = {
+        'reply': _format_count(legacy.get('reply_count')),
+        'retweet': _format_count(legacy.get('retweet_count')),
+        'like': _format_count(legacy.get('favorite_count')),
+    }
+    # The payload has exact numbers, so keep them rather than re-parsing the display strings
+    counts = {
+        'reply': _int_or_none(legacy.get('reply_count')),
+        'retweet': _int_or_none(legacy.get('retweet_count')),
+        'like': _int_or_none(legacy.get('favorite_count')),
+    }
+    views = result.get('views', {}).get('count')
+    if views is not None:
+        stats['views'] = _format_count(views)
+        counts['views'] = _int_or_none(views)
     
+    # Photos and video posters both come through as media_url_https
+    media = legacy.get('extended_entities', legacy.get('entities', {})).get('media', [])
+    media_url = media[0].get('media_url_https') if media else None
+    
+    return {
+        'author': {
+            'name': user_names.get('name', ''),
+            'handle': f'@{screen_name}' if screen_name else ''
+        },
+        'text': text.strip(),
+        'timestamp': timestamp,
+        'stats': stats,
+        'counts': counts,
+        'url': f"https://x.com/{screen_name}/status/{legacy.get('id_str') or result.get('rest_id')}",
+        'media_url': media_url
+    }
+
+def parse_x_timeline_payload(payload) -> List[Dict]:
+    """Build tweet_data records from a Home timeline GraphQL response"""
+    tweets = []
+    for tweet_results in _walk_json(payload, 'tweet_results'):
+        tweet = _x_tweet_record(tweet_results.get('result', {}))
+        if tweet:
+            tweets.append(tweet)
+    return tweets
+
+COUNT_PATTERN = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*([KMB])?', re.IGNORECASE)
+COUNT_SUFFIXES = {'k': 1_000, 'm': 1_000_000, 'b': 1_000_000_000}
+RELATIVE_TIME_PATTERN = re.compile(r'(\d+)\s+(second|minute|hour|day|week|month|year)s?\s+ago', re.IGNORECASE)
+# Months and years as YouTube rounds them; the same spans the front end used to assume
+RELATIVE_TIME_UNITS = {
+    'second': timedelta(seconds=1),
+    'minute': timedelta(minutes=1),
+    'hour': timedelta(hours=1),
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1),
+    'month': timedelta(days=30),
+    'year': timedelta(days=365),
+}
+
+def parse_count(text) -> Optional[int]:
+    """Turn a displayed count like "1.2M views", "4.5K" or "1,234" into an int ("No views" is 0)"""
+    if isinstance(text, (int, float)):
+        return int(text)
+    if not text:
+        return None
+    match = COUNT_PATTERN.search(text)
+    if not match:
+        return 0 if text.strip().lower().startswith('no ') else None
+    number = float(match.group(1).replace(',', ''))
+    suffix = match.group(2)
+    if suffix:
+        number *= COUNT_SUFFIXES[suffix.lower()]
+    return int(round(number))
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+def parse_relative_time(text: Optional[str], anchor: datetime) -> Optional[str]:
+    """Resolve "3 days ago" (or "Streamed 2 hours ago") against anchor into an absolute timestamp"""
+    if not text:
+        return None
+    match = RELATIVE_TIME_PATTERN.search(text)
+    if not match:
+        return None
+    return format_timestamp(anchor - int(match.group(1)) * RELATIVE_TIME_UNITS[match.group(2).lower()])
+
+def normalize_youtube_record(record: Dict, scraped_at: datetime) -> Dict:
+    """Add posted_at (anchored to scraped_at), numeric counts and scraped_at to a video record"""
+    record.setdefault('scraped_at', format_timestamp(scraped_at))
+    anchor = parse_timestamp(record['scraped_at']) or scraped_at
+    record['posted_at'] = parse_relative_time(record.get('posted_time'), anchor)
+    record['counts'] = {'views': parse_count(record.get('views'))}
+    return record
+
+def normalize_x_record(record: Dict, scraped_at: datetime) -> Dict:
+    """Add posted_at, numeric counts (keeping exact ones from the network payload) and scraped_at to a tweet record"""
+    record.setdefault('scraped_at', format_timestamp(scraped_at))
+    posted = parse_timestamp(record.get('timestamp'))
+    record['posted_at'] = format_timestamp(posted) if posted else None
+    counts = {name: parse_count(value) for name, value in (record.get('stats') or {}).items()}
+    counts.update({name: value for name, value in (record.get('counts') or {}).items() if value is not None})
+    record['counts'] = counts
+    return record
+
+class FeedResponseCapture:
+    """Collects feed records straight from the page's network responses.
+
+    Matching responses are queued as they arrive and only decoded on drain(), so
+    the event handler never blocks the page. Records are de-duplicated on `key`.
+    """
+
+    def __init__(self, page, url_pattern, parse_payload, key: str):
+        self.url_pattern = url_pattern
+        self.parse_payload = parse_payload
+        self.key = key
+        self.records = []
+        self.duplicates = 0
+        self._keys = set()
+        self._pending = []
+        page.on('response', self._on_response)
+
+    def _on_response(self, response):
+        if self.url_pattern.search(response.url):
+            self._pending.append(response)
+
+    def add_payload(self, payload) -> List[Dict]:
+        """Parse a decoded payload and keep the records not seen before"""
+        added = []
+        if payload is None:
+            return added
+        for record in self.parse_payload(payload):
+            record_key = record.get(self.key)
+            if record_key in self._keys:
+                self.duplicates += 1
+                continue
+            self._keys.add(record_key)
+            self.records.append(record)
+            added.append(record)
+        return added
+
+    def drain(self) -> List[Dict]:
+        """Decode the responses received since the last drain and return the new records"""
+        pending, self._pending = self._pending, []
+        added = []
+        for response in pending:
+            try:
+                payload = response.json()
+            except Exception as e:
+                logger.debug("Skipping undecodable feed response %s: %s", response.url, e)
+                continue
+            added.extend(self.add_payload(payload))
+        return added
+
+class ResourceBlocker:
+    """Fails requests for bytes the scrapers never read: images, media, fonts and trackers.
+
+    Install it on a page (not the shared context, which holds the user's other
+    tabs) before navigating. Blocking goes through the page's own CDP session:
+    Fetch only pauses requests of the blocked types and Network.setBlockedURLs
+    drops trackers, so every other request stays in Chrome's network stack and
+    keeps its HTTP cache (page.route('**/*') would disable it). URLs matching
+    `allowed_patterns` always go through. Transfer sizes come from
+    Network.loadingFinished events, without a round trip per request. Blocked
+    requests have no size, so their bytes are estimated from the average
+    transfer of allowed responses of the same type, or TYPICAL_RESPONSE_BYTES.
+    """
+    
+    BLOCKED_RESOURCE_TYPES = ('image', 'media', 'font')
+    # Network.setBlockedURLs wildcards ('*' matches any run of characters)
+    TRACKER_PATTERNS = (
+        '*doubleclick.net*',
+        '*googlesyndication.com*',
+        '*google-analytics.com*',
+        '*googletagmanager.com*',
+        '*youtube.com/api/stats/*',
+        '*youtube.com/pagead/*',
+        '*/youtubei/v1/log_event*',
+        '*/1.1/jot/*',
+        '*ads-twitter.com*',
+        '*client_event.json*',
+    )
+    # CDP spelling of the Playwright resource types that can be blocked
+    CDP_RESOURCE_TYPES = {'image': 'Image', 'media': 'Media', 'font': 'Font', 'stylesheet': 'Stylesheet',
+                          'script': 'Script', 'texttrack': 'TextTrack'}
+    # Rough bytes per request for blocked types that no allowed response has been seen for
+    TYPICAL_RESPONSE_BYTES = {'image': 30_000, 'media': 250_000, 'font': 35_000, 'script': 25_000}
+    DEFAULT_RESPONSE_BYTES = 2_000
+    
+    def __init__(self, blocked_types=BLOCKED_RESOURCE_TYPES, blocked_patterns=TRACKER_PATTERNS,
+                 allowed_patterns=()):
+        self.blocked_types = set(blocked_types)
+        self.blocked_patterns = list(blocked_patterns)
+        self.allowed_patterns = [re.compile(pattern) for pattern in allowed_patterns]
+        self.blocked_requests = 0
+        self.blocked_by_type = {}
+        self.allowed_requests = 0
+        self.transferred_bytes = 0
+        self._transferred_by_type = {}  # resource type -> [responses, bytes]
+        self._loading = {}  # request id -> resource type of responses still loading
+    
+    def commands(self) -> List:
+        """The CDP (method, params) calls that turn blocking on for a page"""
+        commands = [('Network.enable', {}), ('Network.setBlockedURLs', {'urls': self.blocked_patterns})]
+        # Fetch.enable without patterns would pause every request
+        if self.blocked_types:
+            commands.append(('Fetch.enable', {'patterns': [
+                {'urlPattern': '*', 'resourceType': self.CDP_RESOURCE_TYPES[resource_type], 'requestStage': 'Request'}
+                for resource_type in sorted(self.blocked_types)
+            ]}))
+        return commands
+    
+    def _count_blocked(self, resource_type: str):
+        self.blocked_requests += 1
+        self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+    
+    def answer_paused(self, params: Dict):
+        """The Fetch call that lets a paused request through or fails it; returns (method, params)"""
+        if any(pattern.search(params['request']['url']) for pattern in self.allowed_patterns):
+            return 'Fetch.continueRequest', {'requestId': params['requestId']}
+        self._count_blocked(params['resourceType'].lower())
+        return 'Fetch.failRequest', {'requestId': params['requestId'], 'errorReason': 'BlockedByClient'}
+    
+    def _on_response_received(self, params: Dict):
+        self._loading[params['requestId']] = params['type'].lower()
+    
+    def _on_loading_finished(self, params: Dict):
+        # Encoded body plus headers as received; a cache hit transfers (almost) nothing
+        resource_type = self._loading.pop(params['requestId'], 'other')
+        size = max(0, int(params.get('encodedDataLength', 0)))
+        self.allowed_requests += 1
+        self.transferred_bytes += size
+        seen = self._transferred_by_type.setdefault(resource_type, [0, 0])
+        seen[0] += 1
+        seen[1] += size
+    
+    def _on_loading_failed(self, params: Dict):
+        self._loading.pop(params['requestId'], None)
+        # 'inspector' marks a URL dropped by Network.setBlockedURLs
+        if params.get('blockedReason') == 'inspector':
+            self._count_blocked(params['type'].lower())
+    
+    def estimated_blocked_bytes(self) -> int:
+        total = 0
+        for resource_type, blocked in self.blocked_by_type.items():
+            seen = self._transferred_by_type.get(resource_type)
+            if seen:
+                average = seen[1] / seen[0]
+            else:
+                average = self.TYPICAL_RESPONSE_BYTES.get(resource_type, self.DEFAULT_RESPONSE_BYTES)
+            total += blocked * average
+        return int(total)
+    
+    def _listen(self, session, on_paused):
+        session.on('Fetch.requestPaused', on_paused)
+        session.on('Network.responseReceived', self._on_response_received)
+        session.on('Network.loadingFinished', self._on_loading_finished)
+        session.on('Network.loadingFailed', self._on_loading_failed)
+    
+    def install(self, page):
+        session = page.context.new_cdp_session(page)
+        self._listen(session, lambda params: session.send(*self.answer_paused(params)))
+        for method, params in self.commands():
+            session.send(method, params)
+    
+    async def install_async(self, page):
+        session = await page.context.new_cdp_session(page)
+        
+        async def on_paused(params):
+            await session.send(*self.answer_paused(params))
+        
+        self._listen(session, on_paused)
+        for method, params in self.commands():
+            await session.send(method, params)
+    
+    def report(self) -> Dict:
+        return {
+            'blocked_requests': self.blocked_requests,
+            'blocked_by_type': dict(self.blocked_by_type),
+            'allowed_requests': self.allowed_requests,
+            'transferred_bytes': self.transferred_bytes,
+            'blocked_bytes_estimate': self.estimated_blocked_bytes(),
+        }
+
+class InstrumentedPage:
+    """Wraps a Playwright page (or element handle) and counts every call that crosses to the browser.
+
+    Element handles it returns are wrapped as well, so per-field lookups in the
+    'handles' extraction modes are counted too. Listener registration stays local
+    and is not counted.
+    """
+
+    LOCAL_METHODS = ('on', 'once', 'remove_listener', 'is_closed')
+
+    def __init__(self, target, metrics: 'ScrapeMetrics'):
+        self._target = target
+        self._metrics = metrics
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if not callable(attr) or name in self.LOCAL_METHODS:
+            return attr
+
+        def counted(*args, **kwargs):
+            self._metrics.count('playwright_calls')
+            result = attr(*args, **kwargs)
+            if inspect.isawaitable(result):
+                return self._wrap_async(result)
+            return self._wrap(result)
+
+        return counted
+
+    async def _wrap_async(self, awaitable):
+        return self._wrap(await awaitable)
+
+    def _wrap(self, result):
+        if isinstance(result, list):
+            return [self._wrap(item) for item in result]
+        if isinstance(result, (ElementHandle, AsyncElementHandle)):
+            return InstrumentedPage(result, self._metrics)
+        return result
+
+class ScrapeMetrics:
+    """Per-run phase timers and counters for one scraper.
+
+    Phases are connect, navigate, scroll_wait, extract and serialize; counters
+    include playwright_calls, retries, duplicates_skipped, known_skipped and
+    items. summary() is what write_json() and write_prometheus() emit.
+    """
+
+    PHASES = ('connect', 'navigate', 'scroll_wait', 'extract', 'serialize')
+    COUNTERS = ('items', 'playwright_calls', 'retries', 'duplicates_skipped', 'known_skipped')
+
+    def __init__(self, platform: str):
+        self.platform = platform
+        self.started_at = time.time()
+        self.phases = {phase: {'seconds': 0.0, 'count': 0} for phase in self.PHASES}
+        self.counters = {counter: 0 for counter in self.COUNTERS}
+        self.status = 'running'
+        # The run's ScrapeBudget, when the scraper was given one
+        self.budget = None
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def record(self, name: str, seconds: float):
+        phase = self.phases.setdefault(name, {'seconds': 0.0, 'count': 0})
+        phase['seconds'] += seconds
+        phase['count'] += 1
+
+    def timed_iter(self, name: str, iterable) -> Iterator:
+        """Yield from iterable, charging only the time spent producing each item to phase `name`"""
+        iterator = iter(iterable)
+        while True:
+            with self.phase(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def count(self, name: str, amount: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def instrument(self, page) -> InstrumentedPage:
+        return InstrumentedPage(page, self)
+
+    def finish(self, status: str = 'complete'):
+        self.status = status
+        self.finished_at = time.time()
+
+    def summary(self) -> Dict:
+        finished_at = getattr(self, 'finished_at', None) or time.time()
+        items = self.counters.get('items', 0)
+        return {
+            'platform': self.platform,
+            'status': self.status,
+            'started_at': datetime.fromtimestamp(self.started_at, timezone.utc).isoformat(),
+            'duration_seconds': round(finished_at - self.started_at, 3),
+            'phases': {
+                name: {'seconds': round(phase['seconds'], 3), 'count': phase['count']}
+                for name, phase in self.phases.items()
+            },
+            'counters': dict(self.counters),
+            'playwright_calls_per_item': round(self.counters.get('playwright_calls', 0) / items, 2) if items else None,
+            'budget': self.budget.report() if self.budget is not None else None,
+        }
+
+    def write_json(self, path: Path):
+        write_json_atomic(path, self.summary())
+
+    def write_prometheus(self, path: Path):
+        """Write the summary in the Prometheus text format for node_exporter's textfile collector"""
+        summary = self.summary()
+        platform = summary['platform']
+        lines = [
+            '# HELP feed_scraper_run_duration_seconds Wall time of the last scrape run.',
+            '# TYPE feed_scraper_run_duration_seconds gauge',
+            f'feed_scraper_run_duration_seconds{{platform="{platform}"}} {summary["duration_seconds"]}',
+            '# HELP feed_scraper_run_timestamp_seconds Unix time the last scrape run started.',
+            '# TYPE feed_scraper_run_timestamp_seconds gauge',
+            f'feed_scraper_run_timestamp_seconds{{platform="{platform}"}} {self.started_at:.0f}',
+            '# HELP feed_scraper_run_complete Whether the last scrape run finished normally.',
+            '# TYPE feed_scraper_run_complete gauge',
+            f'feed_scraper_run_complete{{platform="{platform}"}} {int(summary["status"] == "complete")}',
+            '# HELP feed_scraper_run_truncated Whether the last scrape run was cut short by its deadline or budget.',
+            '# TYPE feed_scraper_run_truncated gauge',
+            f'feed_scraper_run_truncated{{platform="{platform}"}} {int(summary["status"] == "truncated")}',
+            '# HELP feed_scraper_phase_seconds Time spent in each phase of the last scrape run.',
+            '# TYPE feed_scraper_phase_seconds gauge',
+        ]
+        for name, phase in summary['phases'].items():
+            lines.append(f'feed_scraper_phase_seconds{{platform="{platform}",phase="{name}"}} {phase["seconds"]}')
+        lines += [
+            '# HELP feed_scraper_events Events counted during the last scrape run.',
+            '# TYPE feed_scraper_events gauge',
+        ]
+        for name, value in summary['counters'].items():
+            lines.append(f'feed_scraper_events{{platform="{platform}",event="{name}"}} {value}')
+
+        # The collector must never read a half-written file
+        write_text_atomic(path, "\n".join(lines) + "\n")
+
+# Shortest wait a paced scroll gets; below this a feed rarely renders the next batch
+MIN_STEP_WAIT_MS = 500
+
+class ScrapeBudget:
+    """Deadline and scroll/Playwright-call budgets for one scrape run.
+
+    There is no fixed scroll count: scrolling continues while items are missing
+    and stops when the feed has yielded nothing new for stall_scrolls scrolls,
+    when max_scrolls or max_playwright_calls is spent, or when another scroll
+    would eat into the reserve_seconds kept before the deadline for extracting
+    what is already loaded. Given the number of missing items, the observed yield
+    per scroll paces the waits so the scrolls still needed fit before the
+    deadline. truncated_by names the limit that cut a run short.
+    """
+
+    def __init__(self, deadline_seconds: Optional[float] = None, max_scrolls: Optional[int] = None,
+                 max_playwright_calls: Optional[int] = None, metrics: Optional[ScrapeMetrics] = None,
+                 reserve_seconds: float = 2.0, stall_scrolls: int = 3, started: Optional[float] = None):
+        self.started = started if started is not None else time.monotonic()
+        self.deadline_seconds = deadline_seconds
+        self.deadline = self.started + deadline_seconds if deadline_seconds is not None else None
+        self.max_scrolls = max_scrolls
+        self.max_playwright_calls = max_playwright_calls
+        self.metrics = metrics
+        self.reserve_seconds = reserve_seconds
+        self.stall_scrolls = stall_scrolls
+        self.scrolls = []  # (seconds, new items) per scroll
+        self.truncated_by = None
+
+    def remaining_seconds(self) -> Optional[float]:
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def timeout_ms(self, default_ms: int) -> int:
+        """default_ms, shortened so a Playwright wait gives up at the deadline"""
+        remaining = self.remaining_seconds()
+        if remaining is None:
+            return default_ms
+        return max(1, min(default_ms, int(remaining * 1000)))
+
+    def scrolls_needed(self, missing: Optional[int]) -> Optional[int]:
+        """Scrolls the yield observed so far needs to load `missing` more items, None before anything loaded"""
+        yield_per_scroll = self.yield_per_scroll
+        if not missing or not yield_per_scroll:
+            return None
+        return math.ceil(missing / yield_per_scroll)
+
+    def step_wait_ms(self, max_wait_ms: int, missing: Optional[int] = None) -> int:
+        """Longest a scroll may wait for new items without touching the extraction reserve.
+
+        With `missing`, the time left is spread over the scrolls still needed, so
+        waits shorten (down to MIN_STEP_WAIT_MS) when they would not all fit.
+        """
+        remaining = self.remaining_seconds()
+        if remaining is None:
+            return max_wait_ms
+        available_ms = (remaining - self.reserve_seconds) * 1000
+        needed = self.scrolls_needed(missing)
+        if needed:
+            max_wait_ms = min(max_wait_ms, max(MIN_STEP_WAIT_MS, available_ms / needed))
+        return max(1, int(min(max_wait_ms, available_ms)))
+
+    def record_scroll(self, seconds: float, new_items: int):
+        self.scrolls.append((seconds, max(new_items, 0)))
+
+    @property
+    def yield_per_scroll(self) -> Optional[float]:
+        if not self.scrolls:
+            return None
+        return sum(new_items for _, new_items in self.scrolls) / len(self.scrolls)
+
+    def stop_reason(self, missing: Optional[int] = None) -> Optional[str]:
+        """Why the next scroll should not happen, or None; budget limits also mark the run truncated.
+
+        Pass the number of missing items to allow for paced (shortened) scrolls near the deadline.
+        """
+        recent = self.scrolls[-self.stall_scrolls:]
+        if len(recent) == self.stall_scrolls and not any(new_items for _, new_items in recent):
+            return 'stalled'
+        if self.max_scrolls is not None and len(self.scrolls) >= self.max_scrolls:
+            return self.truncate('scroll_budget')
+        calls = self.metrics.counters.get('playwright_calls', 0) if self.metrics is not None else 0
+        if self.max_playwright_calls is not None and calls >= self.max_playwright_calls:
+            return self.truncate('call_budget')
+        remaining = self.remaining_seconds()
+        if remaining is not None:
+            typical = sum(seconds for seconds, _ in self.scrolls) / len(self.scrolls) if self.scrolls else 0
+            if self.scrolls_needed(missing):
+                # A paced scroll waits at most step_wait_ms, which can be shorter than past scrolls took
+                typical = min(typical, MIN_STEP_WAIT_MS / 1000)
+            if remaining - self.reserve_seconds <= typical:
+                return self.truncate('deadline')
+        return None
+
+    def truncate(self, reason: str) -> str:
+        if self.truncated_by is None:
+            logger.info("Stopping early: %s reached after %d scrolls (%.1f new items per scroll)",
+                        reason, len(self.scrolls), self.yield_per_scroll or 0)
+        self.truncated_by = self.truncated_by or reason
+        return reason
+
+    def status(self) -> str:
+        return 'truncated' if self.truncated_by else 'complete'
+
+    def report(self) -> Dict:
+        yield_per_scroll = self.yield_per_scroll
+        return {
+            'deadline_seconds': self.deadline_seconds,
+            'max_scrolls': self.max_scrolls,
+            'max_playwright_calls': self.max_playwright_calls,
+            'scrolls': len(self.scrolls),
+            'yield_per_scroll': round(yield_per_scroll, 2) if yield_per_scroll is not None else None,
+            'truncated_by': self.truncated_by,
+        }
+
+class SeenIndex:
+    """Durable on-disk index of feed items already scraped, keyed by platform and item key.
+
+    Scrapers consult it while scrolling to stop once they reach items from a
+    previous run; mark_seen() should be called only after the new items are saved.
+    """
+    
+    def __init__(self, path: Path = Path("scraped_data") / "seen_index.sqlite3"):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(path))
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS seen_items ('
+            'platform TEXT NOT NULL, item_key TEXT NOT NULL, first_seen REAL NOT NULL, '
+            'PRIMARY KEY (platform, item_key)) WITHOUT ROWID'
+        )
+        self.connection.commit()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def close(self):
+        self.connection.close()
+    
+    def contains(self, platform: str, key: str) -> bool:
+        row = self.connection.execute(
+            'SELECT 1 FROM seen_items WHERE platform = ? AND item_key = ?', (platform, key)
+        ).fetchone()
+        return row is not None
+    
+    def unseen_keys(self, platform: str, keys: List[str]) -> List[str]:
+        return [key for key in keys if not self.contains(platform, key)]
+    
+    def unseen(self, platform: str, records: List[Dict], key: str) -> List[Dict]:
+        return [record for record in records if not self.contains(platform, record.get(key) or record.get('url'))]
+    
+    def known_run_reached(self, platform: str, keys: List[str], run_length: int) -> bool:
+        """True if `keys` (in feed order) contains run_length already-seen items in a row"""
+        run = 0
+        for key in keys:
+            run = run + 1 if self.contains(platform, key) else 0
+            if run >= run_length:
+                return True
+        return False
+    
+    def mark_seen(self, platform: str, records: Iterable[Dict], key: str):
+        now = time.time()
+        with self.connection:
+            self.connection.executemany(
+                'INSERT OR IGNORE INTO seen_items (platform, item_key, first_seen) VALUES (?, ?, ?)',
+                ((platform, record.get(key) or record.get('url'), now) for record in records),
+            )
+
+class FeedCollector:
+    """Bookkeeping for one scrape's passes, shared by the sync and async scroll loops.
+
+    Each pass hands what is rendered to take(), which yields the new items
+    (normalized) and stops at max_items, at a run of stop_after_known items the
+    seen index already has, or at the deadline. done() then credits the last
+    scroll with the new items this pass found and decides whether to scroll
+    again; the loop does the I/O in between.
+    """
+
+    def __init__(self, scraper: 'FeedScraper', driver: 'ScrollDriver', max_items: int):
+        self.scraper = scraper
+        self.metrics = scraper.metrics
+        self.budget = scraper.metrics.budget
+        self.driver = driver
+        self.max_items = max_items
+        self.handled_keys = set()
+        self.collected = 0
+        self.known_run = 0  # Consecutive items already present in the seen index
+        self.stopped = False
+        self._step = None  # The scroll whose items the next pass reads
+        self._handled_before = 0
+
+    @property
+    def missing(self) -> int:
+        return self.max_items - self.collected
+
+    def take(self, records: Iterable[Dict]) -> Iterator[Dict]:
+        for record in records:
+            key = record.get(self.scraper.ITEM_KEY) or record.get('url')
+            if key in self.handled_keys:
+                self.metrics.count('duplicates_skipped')
+                continue
+            self.handled_keys.add(key)
+            if self.scraper._is_known(record):
+                self.metrics.count('known_skipped')
+                self.known_run += 1
+                if self.known_run >= self.scraper.stop_after_known:
+                    logger.info("Reached %d previously scraped %s items in a row, stopping early",
+                                self.known_run, self.scraper.PLATFORM)
+                    self.stopped = True
+                    return
+                continue
+            self.known_run = 0
+            self.collected += 1
+            self.metrics.count('items')
+            logger.debug("Collected %s item %d/%d: %s", self.scraper.PLATFORM, self.collected, self.max_items, key)
+            yield self.scraper.normalize(record)
+            if self.collected >= self.max_items:
+                return
+            # Only per-handle extraction is slow enough to overrun
+            if self.budget.expired():
+                self.budget.truncate('deadline')
+                self.stopped = True
+                return
+
+    def done(self) -> bool:
+        # Items a scroll brought in are only known once the next pass has read them;
+        # scrolls that load nothing new count toward the budget's stall limit
+        if self._step is not None:
+            self.budget.record_scroll(self._step['waited_ms'] / 1000, len(self.handled_keys) - self._handled_before)
+            self._step = None
+        if self.stopped or self.collected >= self.max_items:
+            return True
+        if self.driver.end_of_feed:
+            logger.info("Reached the end of the %s feed", self.scraper.PLATFORM)
+            return True
+        return bool(self.budget.stop_reason(self.missing))
+
+    def before_step(self):
+        """Pace the next scroll so the ones still needed fit before the deadline"""
+        self.driver.max_wait_ms = self.budget.step_wait_ms(self.scraper.max_scroll_wait_ms, self.missing)
+
+    def stepped(self, step: Dict):
+        logger.debug("Scroll step waited %d ms (%s), moved %d px", step['waited_ms'], step['reason'], step['moved'])
+        self._step = step
+        self._handled_before = len(self.handled_keys)
+
+    def failed(self, error: Exception):
+        logger.warning("Error during scrolling: %s", error)
+        self.metrics.count('retries')
+        # A failed pass counts as a scroll that yielded nothing, so repeated errors stall out
+        self._step = None
+        self.budget.record_scroll(self.driver.settle_ms / 1000, 0)
+
+class FeedScraper(ABC):
+    """Setup shared by the platform scrapers: options, browser session, resource blocking and per-run state.
+
+    Subclasses define HOME_URL, PLATFORM, ITEM_KEY, MEDIA_FIELDS, FEED_URL_PATTERN,
+    RESOURCE_ALLOWLIST and EXTRACTION_MODES, plus normalize() and iter_feed().
+    """
+    # Modes scrape_feed_async implements; the async path runs on scrape_feeds_concurrently's shared connection
+    ASYNC_EXTRACTION_MODES = ('batch',)
+
+    def __init__(self, user_data_dir: str = None, extraction_mode: str = 'batch',
+                 max_scroll_wait_ms: int = 5000, home_url: str = None, block_resources: bool = True,
+                 seen_index: 'SeenIndex' = None, stop_after_known: int = 10,
+                 browser_pool: BrowserPool = None, debugging_port: int = DEBUGGING_PORT,
+                 deadline_seconds: float = None, max_scrolls: int = None, max_playwright_calls: int = None):
+        if extraction_mode not in self.EXTRACTION_MODES:
+            raise ValueError(f"Unknown extraction mode: {extraction_mode}")
+        # Chrome profile to launch with; a Chrome already on debugging_port keeps its own profile
+        self.user_data_dir = user_data_dir
+        self.debugging_port = debugging_port
+        self.extraction_mode = extraction_mode
+        self.home_url = home_url or self.HOME_URL
+        self.max_scroll_wait_ms = max_scroll_wait_ms
+        self.block_resources = block_resources
+        # When set, only items missing from the index are returned and scrolling stops
+        # after stop_after_known already-scraped items in a row
+        self.seen_index = seen_index
+        self.stop_after_known = stop_after_known
+        # A shared BrowserPool keeps the browser connected between scrapes
+        self.browser_pool = browser_pool
+        # Upper bounds for one scrape, see ScrapeBudget; a run over budget returns what it has
+        self.deadline_seconds = deadline_seconds
+        self.max_scrolls = max_scrolls
+        self.max_playwright_calls = max_playwright_calls
+        self.scroll_steps = []
+        self.blocked_resources = {}
+        # Replaced at the start of every scrape; holds the last run's timers and counters
+        self.metrics = ScrapeMetrics(self.PLATFORM)
+        self.scraped_at = datetime.now(timezone.utc)
+
+    @abstractmethod
+    def normalize(self, record: Dict) -> Dict:
+        """The platform's record in the unified feed shape"""
+
+    @abstractmethod
+    def iter_feed(self, max_items: int = 50) -> Iterator[Dict]:
+        """Yield each item as soon as it is extracted; closing the generator stops the scrape"""
+
+    def _browser_session(self, budget: Optional[ScrapeBudget] = None):
+        # Launching or attaching to Chrome counts against the scrape's deadline
+        deadline = budget.deadline if budget is not None else None
+        if self.browser_pool is not None:
+            return self.browser_pool.session(deadline=deadline)
+        return BrowserManager(port=self.debugging_port, user_data_dir=self.user_data_dir, deadline=deadline)
+
+    def _resource_blocker(self) -> Optional[ResourceBlocker]:
+        if not self.block_resources:
+            return None
+        return ResourceBlocker(allowed_patterns=self.RESOURCE_ALLOWLIST)
+
+    def _start_run(self, started: Optional[float] = None):
+        """Fresh metrics and budget for a scrape; returns (metrics, budget).
+
+        started is the time.monotonic() the deadline counts from, when the run began before this call.
+        """
+        metrics = self.metrics = ScrapeMetrics(self.PLATFORM)
+        # Relative times like "3 days ago" are resolved against the start of the scrape
+        self.scraped_at = datetime.now(timezone.utc)
+        metrics.budget = ScrapeBudget(self.deadline_seconds, self.max_scrolls, self.max_playwright_calls, metrics,
+                                      started=started)
+        return metrics, metrics.budget
+
+    def _collect(self, page, driver: 'ScrollDriver', max_items: int, read_pass) -> Iterator[Dict]:
+        """Alternate passes with scroll steps, yielding new items.
+
+        read_pass(handled_keys) returns the records rendered so far; handled_keys
+        lets per-handle extraction skip items already taken before looking them up.
+        """
+        collector = FeedCollector(self, driver, max_items)
+        while True:
+            try:
+                with self.metrics.phase('extract'):
+                    records = read_pass(collector.handled_keys)
+                yield from collector.take(records)
+                if collector.done():
+                    return
+                collector.before_step()
+                with self.metrics.phase('scroll_wait'):
+                    collector.stepped(driver.step())
+            except Exception as e:
+                collector.failed(e)
+                page.wait_for_timeout(driver.settle_ms)
+
+    async def _collect_async(self, page, driver: 'AsyncScrollDriver', max_items: int, read_pass) -> List[Dict]:
+        """_collect for async pages; read_pass is a coroutine function and the items are returned at the end"""
+        collector = FeedCollector(self, driver, max_items)
+        items = []
+        while True:
+            try:
+                with self.metrics.phase('extract'):
+                    records = await read_pass(collector.handled_keys)
+                items.extend(collector.take(records))
+                if collector.done():
+                    return items
+                collector.before_step()
+                with self.metrics.phase('scroll_wait'):
+                    collector.stepped(await driver.step())
+            except Exception as e:
+                collector.failed(e)
+                await page.wait_for_timeout(driver.settle_ms)
+
+    def _open_page(self, stack: ExitStack, metrics: ScrapeMetrics):
+        """Connect, open a new tab in the browser's first context and install the blocker; returns (page, blocker)"""
+        with metrics.phase('connect'):
+            browser = stack.enter_context(self._browser_session(metrics.budget))
+        # Use the first context that's already open
+        raw_page = browser.contexts[0].new_page()
+        # Before any navigation, so ScrollDriver's settle check sees every feed request
+        raw_page.add_init_script(script=feed_request_tracker_script(self.FEED_URL_PATTERN))
+        # Skip images, video, fonts and trackers we never read
+        blocker = self._resource_blocker()
+        if blocker:
+            blocker.install(raw_page)
+        return metrics.instrument(raw_page), blocker
+
+    async def _open_page_async(self, context, metrics: ScrapeMetrics):
+        """Async _open_page on an already connected context; rejects modes the async path does not implement"""
+        if self.extraction_mode not in self.ASYNC_EXTRACTION_MODES:
+            raise ValueError(f"Extraction mode {self.extraction_mode!r} is not available for concurrent scrapes")
+        raw_page = await context.new_page()
+        await raw_page.add_init_script(script=feed_request_tracker_script(self.FEED_URL_PATTERN))
+        blocker = self._resource_blocker()
+        if blocker:
+            await blocker.install_async(raw_page)
+        return metrics.instrument(raw_page), blocker
+
+    def _is_known(self, record: Dict) -> bool:
+        """True when running incrementally and the seen index already has this item"""
+        return self.seen_index is not None and self.seen_index.contains(
+            self.PLATFORM, record.get(self.ITEM_KEY) or record['url'])
+
+class GridCursor:
+    """Where the next read of the YouTube grid starts.
+
+    The grid only ever appends cards, so a pass reads from `start` on. A card
+    appended before YouTube filled it in has no link yet, so the next pass starts
+    again from the first such card (cards after it are then skipped as handled).
+    """
+
+    def __init__(self):
+        self.start = 0
+
+    def ready(self, videos, end: int) -> Iterator[Dict]:
+        """The linked videos among (grid position, video) pairs; moves start to `end`, or back to the first unlinked card"""
+        unready = None
+        for position, video in videos:
+            if not (video.get('video_id') or video.get('url')):
+                # Captured responses have no position and are not read again
+                unready = position if unready is None else unready
+                continue
+            yield video
+        self.start = end if unready is None else unready
+
+class YouTubeScraper(FeedScraper):
+    HOME_URL = 'https://www.youtube.com'
+    PLATFORM = 'youtube'
+    ITEM_KEY = 'video_id'
+    # Remote image URLs MediaCache can replace with local copies
+    MEDIA_FIELDS = ('thumbnail',)
+    # Feed requests: counted by ScrollDriver's settle check and never aborted by ResourceBlocker
+    FEED_URL_PATTERN = YOUTUBE_BROWSE_URL_PATTERN
+    RESOURCE_ALLOWLIST = (YOUTUBE_BROWSE_URL_PATTERN.pattern,)
+    # 'batch' serializes the whole grid in one page.evaluate, 'network' builds videos
+    # from ytInitialData and browse responses, 'handles' walks element handles with
+    # a round trip per field.
+    EXTRACTION_MODES = ('batch', 'network', 'handles')
+
+    def normalize(self, record: Dict) -> Dict:
+        return normalize_youtube_record(record, self.scraped_at)
+
     def scrape_feed(self, max_videos: int = 50) -> List[Dict]:
-        videos = []
+        return list(self.iter_feed(max_videos))
+
+    def iter_feed(self, max_videos: int = 50) -> Iterator[Dict]:
+        """Yield each video as soon as it is extracted; closing the generator stops the scrape"""
+        metrics, budget = self._start_run()
+        status = 'failed'
         
-        with BrowserManager() as browser:
-            # Use the first context that's already open
-            context = browser.contexts[0]
-            
-            # Create a new page in the existing context
-            page = context.new_page()
-            page.goto('https://www.youtube.com')
-            
-            # Wait for the page to load and videos to appear
-            page.wait_for_selector('ytd-rich-grid-media', timeout=10000)
-            page.wait_for_load_state('networkidle')
-            
-            # Scroll to load more videos
-            for _ in range(min(max_videos // 10 + 1, 6)):  # Scroll more times to ensure we get enough videos
+        with ExitStack() as stack:
+            try:
+                page, blocker = self._open_page(stack, metrics)
+            except RuntimeError:
+                if not budget.expired():
+                    raise
+                # Out of time before the browser was ready, so nothing was scraped
+                budget.truncate('deadline')
+                metrics.finish(budget.status())
+                return
+            capture = None
+            try:
                 try:
-                    # Scroll and wait for new content
-                    page.evaluate("""
-                        window.scrollBy({
-                            top: window.innerHeight,
-                            behavior: 'smooth'
-                        });
-                    """)
-                    page.wait_for_timeout(2000)  # Wait for content to load
-                    
-                    # Check if we have enough videos
-                    current_videos = page.query_selector_all('ytd-rich-grid-media')
-                    if len(current_videos) >= max_videos:
-                        break
+                    with metrics.phase('navigate'):
+                        if self.extraction_mode == 'network':
+                            capture = FeedResponseCapture(
+                                page, YOUTUBE_BROWSE_URL_PATTERN, parse_youtube_browse_payload, key='video_id'
+                            )
+                        response = page.goto(self.home_url, timeout=budget.timeout_ms(30000))
                         
-                except Exception as e:
-                    print(f"Scrolling error: {str(e)}")
-                    time.sleep(1)
+                        # The first page of the grid ships inside the HTML as ytInitialData
+                        if capture is not None and response is not None:
+                            capture.add_payload(extract_yt_initial_data(response.text()))
+                    
+                    # Wait for the first videos to appear; captured payloads do not need the grid rendered
+                    if capture is None:
+                        with metrics.phase('navigate'):
+                            page.wait_for_selector('ytd-rich-grid-media', timeout=budget.timeout_ms(10000))
+                except PlaywrightTimeoutError:
+                    if not budget.expired():
+                        raise
+                    # Out of time before the grid loaded, so there is nothing to extract
+                    budget.truncate('deadline')
+                    status = budget.status()
+                    return
+                
+                driver = ScrollDriver(
+                    page,
+                    'ytd-rich-grid-media',
+                    max_wait_ms=self.max_scroll_wait_ms,
+                )
+                # Only cards from cursor.start on are read each pass
+                cursor = GridCursor()
+                yield from self._collect(page, driver, max_videos,
+                                         lambda handled: cursor.ready(*self._new_videos(page, cursor.start, capture)))
+                self.scroll_steps = driver.steps
+                status = budget.status()
+            except GeneratorExit:
+                status = 'stopped'
+                raise
+            finally:
+                if capture is not None:
+                    metrics.count('duplicates_skipped', capture.duplicates)
+                if blocker:
+                    self.blocked_resources = blocker.report()
+                page.close()
+                metrics.finish(status)
+
+    def _new_videos(self, page, extracted: int, capture=None):
+        """(grid position, video) pairs for cards from `extracted` on, plus the number of cards in the grid.
+
+        The grid only ever appends cards, so earlier cards are not read again;
+        captured responses are drained instead and have no position.
+        """
+        if capture is not None:
+            return [(None, video) for video in capture.drain()], extracted
+        if self.extraction_mode == 'batch':
+            videos = self._extract_videos_in_page(page, None, start=extracted)
+            return list(enumerate(videos, start=extracted)), extracted + len(videos)
+        video_elements = page.query_selector_all('ytd-rich-grid-media')
+        return self._iter_videos_from_handles(video_elements, extracted), len(video_elements)
+
+    def _iter_videos_from_handles(self, video_elements, start: int) -> Iterator:
+        # Fields are looked up lazily, one round trip each, as records are consumed
+        for position in range(start, len(video_elements)):
+            try:
+                with self.metrics.phase('extract'):
+                    video_data = self._extract_video_from_handle(video_elements[position])
+            except Exception as e:
+                logger.warning("Error extracting video %d: %s", position, e)
+                # Read it again on the next pass
+                video_data = {}
+            yield position, video_data
+
+    async def scrape_feed_async(self, context, max_videos: int = 50, started: Optional[float] = None) -> List[Dict]:
+        """Scrape the home grid in a new tab of an already connected async context.
+
+        Used by scrape_feeds_concurrently, whose connect time counts from `started`
+        against the deadline; only batched extraction is available here.
+        """
+        videos = []
+        metrics, budget = self._start_run(started)
+        status = 'failed'
+        page, blocker = await self._open_page_async(context, metrics)
+        try:
+            try:
+                with metrics.phase('navigate'):
+                    await page.goto(self.home_url, timeout=budget.timeout_ms(30000))
+                    await page.wait_for_selector('ytd-rich-grid-media', timeout=budget.timeout_ms(10000))
+            except AsyncPlaywrightTimeoutError:
+                if not budget.expired():
+                    raise
+                budget.truncate('deadline')
+                status = budget.status()
+                return []
             
-            # Extract video information
-            video_elements = page.query_selector_all('ytd-rich-grid-media')
-            print(f"\nFound {len(video_elements)} videos")
+            driver = AsyncScrollDriver(
+                page,
+                'ytd-rich-grid-media',
+                max_wait_ms=self.max_scroll_wait_ms,
+            )
+            cursor = GridCursor()
             
-            for i, video_element in enumerate(video_elements):
-                if i >= max_videos:
-                    break
-                
-                try:
-                    # Get video URL and ID from the thumbnail link
-                    video_url = None
-                    video_id = None
-                    
-                    # Try getting URL from thumbnail first
-                    thumbnail_link = video_element.query_selector('#thumbnail[href]')
-                    if thumbnail_link:
-                        href = thumbnail_link.get_attribute('href')
-                        if href:
-                            video_url = f'https://www.youtube.com{href}' if not href.startswith('http') else href
-                            # Extract video ID from href
-                            if 'v=' in href:
-                                video_id = href.split('v=')[-1].split('&')[0]
-                    
-                    # If not found, try getting from title
-                    if not video_url:
-                        title_link = video_element.query_selector('#video-title[href]')
-                        if title_link:
-                            href = title_link.get_attribute('href')
-                            if href:
-                                video_url = f'https://www.youtube.com{href}' if not href.startswith('http') else href
-                                if 'v=' in href:
-                                    video_id = href.split('v=')[-1].split('&')[0]
-                    
-                    # Extract video details
-                    title_element = video_element.query_selector('#video-title')
-                    title = title_element.text_content().strip() if title_element else "Unknown Title"
-                    
-                    # Get channel info with more specific selector
-                    channel_element = video_element.query_selector('#channel-name a')
-                    channel = channel_element.text_content().strip() if channel_element else "Unknown Channel"
-                    
-                    # Get metadata with more specific selectors
-                    metadata_spans = video_element.query_selector_all('#metadata-line span')
-                    views = "Unknown Views"
-                    posted_time = "Unknown Time"
-                    
-                    if len(metadata_spans) >= 2:
-                        views = metadata_spans[0].text_content().strip()
-                        posted_time = metadata_spans[1].text_content().strip()
-                    
-                    # Get high quality thumbnail URL
-                    thumbnail_url = None
-                    if video_id:
-                        thumbnail_url = f'https://i.ytimg.com/vi/{video_id}/hq720.jpg'
-                    else:
-                        # Try getting from img element as fallback
-                        thumbnail_img = video_element.query_selector('#thumbnail img[src]')
-                        if thumbnail_img:
-                            thumbnail_url = thumbnail_img.get_attribute('src')
-                    
-                    video_data = {
-                        'title': title,
-                        'url': video_url,
-                        'channel': channel,
-                        'views': views,
-                        'posted_time': posted_time,
-                        'thumbnail': thumbnail_url,
-                        'video_id': video_id
-                    }
-                    
-                    videos.append(video_data)
-                    print(f"Processed video {i+1}/{max_videos}: {title[:50]}...")
-                    
-                except Exception as e:
-                    print(f"Error extracting video {i}: {str(e)}")
+            async def read_pass(handled):
+                cards = await self._extract_videos_in_page(page, None, start=cursor.start)
+                return cursor.ready(enumerate(cards, start=cursor.start), cursor.start + len(cards))
             
-            page.close()
+            videos = await self._collect_async(page, driver, max_videos, read_pass)
+            self.scroll_steps = driver.steps
+            logger.info("Found %d videos", len(videos))
+            status = budget.status()
+        finally:
+            if blocker:
+                self.blocked_resources = blocker.report()
+            await page.close()
+            metrics.finish(status)
         
         return videos
 
-class XScraper:
-    def __init__(self, user_data_dir: str = None):
-        self.user_data_dir = user_data_dir
-    
+    def _extract_videos_in_page(self, page, max_videos: Optional[int], start: int = 0) -> List[Dict]:
+        """Serialize up to max_videos grid cards from `start` on (all when None) inside the page with a single round trip"""
+        return page.evaluate(VIDEO_BATCH_JS, [start, None if max_videos is None else start + max_videos])
+
+    def _extract_video_from_handle(self, video_element) -> Dict:
+        # Get video URL and ID from the thumbnail link
+        video_url = None
+        video_id = None
+        
+        # Try getting URL from thumbnail first
+        thumbnail_link = video_element.query_selector('#thumbnail[href]')
+        if thumbnail_link:
+            href = thumbnail_link.get_attribute('href')
+            if href:
+                video_url = f'https://www.youtube.com{href}' if not href.startswith('http') else href
+                # Extract video ID from href
+                if 'v=' in href:
+                    video_id = href.split('v=')[-1].split('&')[0]
+        
+        # If not found, try getting from title
+        if not video_url:
+            title_link = video_element.query_selector('#video-title[href]')
+            if title_link:
+                href = title_link.get_attribute('href')
+                if href:
+                    video_url = f'https://www.youtube.com{href}' if not href.startswith('http') else href
+                    if 'v=' in href:
+                        video_id = href.split('v=')[-1].split('&')[0]
+        
+        # Extract video details
+        title_element = video_element.query_selector('#video-title')
+        title = title_element.text_content().strip() if title_element else "Unknown Title"
+        
+        # Get channel info with more specific selector
+        channel_element = video_element.query_selector('#channel-name a')
+        channel = channel_element.text_content().strip() if channel_element else "Unknown Channel"
+        
+        # Get metadata with more specific selectors
+        metadata_spans = video_element.query_selector_all('#metadata-line span')
+        views = "Unknown Views"
+        posted_time = "Unknown Time"
+        
+        if len(metadata_spans) >= 2:
+            views = metadata_spans[0].text_content().strip()
+            posted_time = metadata_spans[1].text_content().strip()
+        
+        # Get high quality thumbnail URL
+        thumbnail_url = None
+        if video_id:
+            thumbnail_url = f'https://i.ytimg.com/vi/{video_id}/hq720.jpg'
+        else:
+            # Try getting from img element as fallback
+            thumbnail_img = video_element.query_selector('#thumbnail img[src]')
+            if thumbnail_img:
+                thumbnail_url = thumbnail_img.get_attribute('src')
+        
+        return {
+            'title': title,
+            'url': video_url,
+            'channel': channel,
+            'views': views,
+            'posted_time': posted_time,
+            'thumbnail': thumbnail_url,
+            'video_id': video_id
+        }
+
+class XScraper(FeedScraper):
+    HOME_URL = 'https://twitter.com/home'
+    PLATFORM = 'x'
+    ITEM_KEY = 'url'
+    # Remote image URLs MediaCache can replace with local copies
+    MEDIA_FIELDS = ('media_url',)
+    # Feed requests: counted by ScrollDriver's settle check and never aborted by ResourceBlocker
+    FEED_URL_PATTERN = X_TIMELINE_URL_PATTERN
+    RESOURCE_ALLOWLIST = (X_TIMELINE_URL_PATTERN.pattern,)
+    # 'batch' serializes all visible tweets in one page.evaluate per scroll pass,
+    # 'observer' drains only tweets attached since the last pass, 'network' builds
+    # tweets from the Home timeline GraphQL responses, 'handles' walks element
+    # handles with a round trip per field.
+    EXTRACTION_MODES = ('batch', 'observer', 'network', 'handles')
+
+    def __init__(self, *args, login_wait_ms: int = 120000, **kwargs):
+        super().__init__(*args, **kwargs)
+        # How long to wait for a manual login before giving up
+        self.login_wait_ms = login_wait_ms
+
+    def normalize(self, record: Dict) -> Dict:
+        return normalize_x_record(record, self.scraped_at)
+
     def scrape_feed(self, max_tweets: int = 50) -> List[Dict]:
+        return list(self.iter_feed(max_tweets))
+
+    async def scrape_feed_async(self, context, max_tweets: int = 50, started: Optional[float] = None) -> List[Dict]:
+        """Scrape the home timeline in a new tab of an already connected async context.
+
+        Used by scrape_feeds_concurrently, whose connect time counts from `started`
+        against the deadline; only batched extraction is available here.
+        """
         tweets = []
-        
-        with BrowserManager() as browser:
-            # Use the first context that's already open
-            context = browser.contexts[0]
-            print("\nDebug: Browser context created")
-            
-            # Create a new page in the existing context
-            page = context.new_page()
-            print("Debug: New page created")
-            
-            # Navigate to Twitter with a shorter timeout for initial load
-            print("Debug: Navigating to Twitter home...")
-            page.goto('https://twitter.com/home', wait_until='domcontentloaded')
-            print("Debug: Initial page load complete")
+        driver = None
+        metrics, budget = self._start_run(started)
+        status = 'failed'
+        page, blocker = await self._open_page_async(context, metrics)
+        try:
+            with metrics.phase('navigate'):
+                await page.goto(self.home_url, wait_until='domcontentloaded', timeout=budget.timeout_ms(30000))
             
-            # Check if we need to log in
+            # Check if we need to log in; other tabs keep scraping meanwhile
             if page.url.startswith('https://twitter.com/i/flow/login'):
-                print("\nPlease log in to X (Twitter) in the browser window")
-                print("Waiting for login (up to 2 minutes)...")
-                page.wait_for_url('https://twitter.com/home', timeout=120000)
-                print("Debug: Login page detected and waited for redirect")
-                
-                # Wait for the feed to be visible after login
-                print("Debug: Waiting for feed to load after login...")
-                try:
-                    page.wait_for_selector('article[role="article"]', timeout=30000)
-                    print("Debug: Feed loaded successfully")
-                except Exception as e:
-                    print(f"Debug: Error waiting for feed: {str(e)}")
-                    return []
-            
-            print("\nStarting to collect tweets...")
+                login_wait_ms = budget.timeout_ms(self.login_wait_ms)
+                logger.warning("Please log in to X (Twitter) in the browser window, waiting up to %d seconds",
+                               login_wait_ms // 1000)
+                await page.wait_for_url(self.home_url, timeout=login_wait_ms)
             
-            # Initial wait for any tweet to be visible
             try:
-                print("Debug: Waiting for initial tweet elements...")
-                page.wait_for_selector('article[role="article"]', timeout=30000)
-                print("Debug: Initial tweets found")
+                with metrics.phase('navigate'):
+                    await page.wait_for_selector('article[role="article"]', timeout=budget.timeout_ms(30000))
+            except AsyncPlaywrightTimeoutError:
+                # Out of time: the deadline handler below marks the run truncated
+                if budget.expired():
+                    raise
+                logger.warning("Timed out finding initial tweets")
+                return []
             except Exception as e:
-                print(f"Debug: Error finding initial tweets: {str(e)}")
+                logger.warning("Error finding initial tweets: %s", e)
                 return []
             
-            # Scroll to load more tweets with better handling
-            loaded_tweets = set()
-            attempts = 0
-            max_attempts = max_tweets * 2  # Allow more attempts to find unique tweets
-            last_tweet_count = 0
+            driver = AsyncScrollDriver(
+                page,
+                'article[role="article"]',
+                max_wait_ms=self.max_scroll_wait_ms,
+            )
+            tweets = await self._collect_async(page, driver, max_tweets,
+                                               lambda handled: self._extract_tweets_in_page(page))
+            status = budget.status()
+        except AsyncPlaywrightTimeoutError:
+            if not budget.expired():
+                raise
+            # Out of time while loading or waiting for a login; keep what was collected
+            budget.truncate('deadline')
+            status = budget.status()
+        finally:
+            if driver is not None:
+                self.scroll_steps = driver.steps
+            if blocker:
+                self.blocked_resources = blocker.report()
+            await page.close()
+            metrics.finish(status)
+        
+        return tweets
+
+    def _read_tweets(self, page, capture=None, loaded_tweets=()) -> Iterable[Dict]:
+        """One pass of the extraction mode: the tweets rendered (or captured) so far"""
+        if self.extraction_mode == 'batch':
+            return self._extract_tweets_in_page(page)
+        if capture is not None:
+            return capture.drain()
+        if self.extraction_mode == 'observer':
+            return self._drain_tweet_collector(page)
+        tweet_elements = page.query_selector_all('article[role="article"]')
+        # Fields are looked up lazily, one round trip each, as records are consumed
+        return self.metrics.timed_iter('extract', self._iter_tweets_from_handles(tweet_elements, loaded_tweets))
+
+    def _extract_tweets_in_page(self, page) -> List[Dict]:
+        """Serialize every tweet in the DOM inside the page with a single round trip"""
+        return page.evaluate(TWEET_BATCH_JS)
+
+    def _install_tweet_collector(self, page):
+        """Start queueing tweet articles in the page as the timeline attaches them"""
+        page.evaluate(TWEET_OBSERVER_INSTALL_JS)
+
+    def _drain_tweet_collector(self, page) -> List[Dict]:
+        """Serialize only the tweets queued since the previous drain"""
+        return page.evaluate(TWEET_OBSERVER_DRAIN_JS)
+
+    def _iter_tweets_from_handles(self, tweet_elements, loaded_tweets=()):
+        """Yield tweet_data for element handles, skipping links in loaded_tweets before the field lookups"""
+        for tweet_element in tweet_elements:
+            try:
+                # Get tweet link to use as unique identifier
+                time_element = tweet_element.query_selector('time')
+                if not time_element:
+                    continue
+
+                tweet_link = time_element.evaluate('(element) => element.parentElement.href')
+                if tweet_link in loaded_tweets:
+                    continue
+
+                yield self._extract_tweet_from_handle(tweet_element, tweet_link)
+
+            except Exception as e:
+                logger.warning("Error extracting tweet details: %s", e)
+
+    def _extract_tweet_from_handle(self, tweet_element, tweet_link: str) -> Dict:
+        # Extract tweet details using the correct selectors
+        # Author name and handle are in specific divs with dir="ltr"
+        author_element = tweet_element.query_selector('[data-testid="User-Name"]')
+        author_info = {
+            'name': "",
+            'handle': ""
+        }
+
+        if author_element:
+            # Get author name from the first div[dir="ltr"] containing the name
+            name_element = author_element.query_selector('div.css-175oi2r.r-1awozwy.r-18u37iz.r-1wbh5a2 div[dir="ltr"]')
+            if name_element:
+                author_info['name'] = name_element.text_content().strip()
+
+            # Get handle from the subsequent div[dir="ltr"]
+            handle_element = author_element.query_selector('div.css-175oi2r.r-1d09ksm div[dir="ltr"]')
+            if handle_element:
+                author_info['handle'] = handle_element.text_content().strip()
+
+        # Tweet text is in the tweetText element
+        text_element = tweet_element.query_selector('[data-testid="tweetText"]')
+        text = text_element.text_content().strip() if text_element else ""
+
+        # Get timestamp from time element
+        time_element = tweet_element.query_selector('time')
+        timestamp = time_element.get_attribute('datetime') if time_element else None
+
+        # Get tweet stats with updated selectors
+        stats = {}
+
+        # Get reply count
+        reply_element = tweet_element.query_selector('[data-testid="reply"]')
+        if reply_element:
+            reply_count = reply_element.query_selector('span[data-testid="app-text-transition-container"]')
+            stats['reply'] = reply_count.text_content().strip() if reply_count else "0"
+
+        # Get retweet count
+        retweet_element = tweet_element.query_selector('[data-testid="retweet"]')
+        if retweet_element:
+            retweet_count = retweet_element.query_selector('span[data-testid="app-text-transition-container"]')
+            stats['retweet'] = retweet_count.text_content().strip() if retweet_count else "0"
+
+        # Get like count
+        like_element = tweet_element.query_selector('[data-testid="like"]')
+        if like_element:
+            like_count = like_element.query_selector('span[data-testid="app-text-transition-container"]')
+            stats['like'] = like_count.text_content().strip() if like_count else "0"
+
+        # Get view count
+        view_element = tweet_element.query_selector('a[aria-label*="views"]')
+        if view_element:
+            view_count = view_element.query_selector('span[data-testid="app-text-transition-container"]')
+            stats['views'] = view_count.text_content().strip() if view_count else "0"
+
+        # Get media content if available
+        media_url = None
+        media_container = tweet_element.query_selector('[data-testid="tweetPhoto"]')
+        if media_container:
+            img_element = media_container.query_selector('img')
+            if img_element:
+                media_url = img_element.get_attribute('src')
+        else:
+            # Check for video content
+            video_container = tweet_element.query_selector('video')
+            if video_container:
+                media_url = video_container.get_attribute('poster')
+
+        return {
+            'author': author_info,
+            'text': text,
+            'timestamp': timestamp,
+            'stats': stats,
+            'url': tweet_link,
+            'media_url': media_url
+        }
+
+    def iter_feed(self, max_tweets: int = 50) -> Iterator[Dict]:
+        """Yield each tweet as soon as it is extracted; closing the generator stops the scrape"""
+        collected = 0
+        metrics, budget = self._start_run()
+        status = 'failed'
+        
+        with ExitStack() as stack:
+            try:
+                page, blocker = self._open_page(stack, metrics)
+            except RuntimeError:
+                if not budget.expired():
+                    raise
+                # Out of time before the browser was ready, so nothing was scraped
+                budget.truncate('deadline')
+                metrics.finish(budget.status())
+                return
+            logger.debug("New page created")
+            
+            driver = None
+            capture = None
+            try:
+                # Listen before navigating so the first timeline response is not missed
+                if self.extraction_mode == 'network':
+                    capture = FeedResponseCapture(page, X_TIMELINE_URL_PATTERN, parse_x_timeline_payload, key='url')
             
-            while len(tweets) < max_tweets and attempts < max_attempts:
-                try:
-                    # Get current scroll position
-                    current_position = page.evaluate("""
-                        window.pageYOffset || document.documentElement.scrollTop
-                    """)
-                    print(f"Debug: Current scroll position: {current_position}")
-                    
-                    # Scroll down
-                    page.evaluate("""
-                        window.scrollTo({
-                            top: document.documentElement.scrollHeight,
-                            behavior: 'smooth'
-                        });
-                    """)
-                    
-                    # Wait for new content
-                    page.wait_for_timeout(3000)
-                    
-                    # Check if we've actually scrolled
-                    new_position = page.evaluate("""
-                        window.pageYOffset || document.documentElement.scrollTop
-                    """)
-                    print(f"Debug: New scroll position: {new_position}")
-                    print(f"Debug: Scroll difference: {new_position - current_position}")
-                    
-                    if new_position <= current_position:
-                        print("Debug: No scroll movement detected, trying alternative scroll")
-                        # Try an alternative scroll method
-                        page.evaluate("""
-                            window.scrollBy({
-                                top: 1000,
-                                behavior: 'smooth'
-                            });
-                        """)
-                        page.wait_for_timeout(2000)
-                    
-                    # Extract tweet information
-                    tweet_elements = page.query_selector_all('article[role="article"]')
-                    print(f"Debug: Found {len(tweet_elements)} tweet elements")
-                    
-                    # Check if we're still getting new tweets
-                    if len(tweet_elements) == last_tweet_count:
-                        print("Debug: No new tweets found in this scroll")
-                        attempts += 1
-                        if attempts >= 3:  # If we haven't found new tweets in 3 attempts
-                            print("Debug: Stopping as no new tweets are being loaded")
-                            break
-                    else:
-                        attempts = 0  # Reset attempts if we found new tweets
-                        last_tweet_count = len(tweet_elements)
-                    
-                    for tweet_element in tweet_elements:
-                        try:
-                            # Get tweet link to use as unique identifier
-                            time_element = tweet_element.query_selector('time')
-                            if not time_element:
-                                continue
-                                
-                            tweet_link = time_element.evaluate('(element) => element.parentElement.href')
-                            if tweet_link in loaded_tweets:
-                                continue
-                            
-                            # Extract tweet details using the correct selectors
-                            # Author name and handle are in specific divs with dir="ltr"
-                            author_element = tweet_element.query_selector('[data-testid="User-Name"]')
-                            author_info = {
-                                'name': "",
-                                'handle': ""
-                            }
-                            
-                            if author_element:
-                                # Get author name from the first div[dir="ltr"] containing the name
-                                name_element = author_element.query_selector('div.css-175oi2r.r-1awozwy.r-18u37iz.r-1wbh5a2 div[dir="ltr"]')
-                                if name_element:
-                                    author_info['name'] = name_element.text_content().strip()
-                                
-                                # Get handle from the subsequent div[dir="ltr"]
-                                handle_element = author_element.query_selector('div.css-175oi2r.r-1d09ksm div[dir="ltr"]')
-                                if handle_element:
-                                    author_info['handle'] = handle_element.text_content().strip()
-                            
-                            # Tweet text is in the tweetText element
-                            text_element = tweet_element.query_selector('[data-testid="tweetText"]')
-                            text = text_element.text_content().strip() if text_element else ""
-                            
-                            print(f"Debug: Processing tweet by {author_info['name']} ({author_info['handle']})")
-                            
-                            # Get timestamp from time element
-                            time_element = tweet_element.query_selector('time')
-                            timestamp = time_element.get_attribute('datetime') if time_element else None
-                            
-                            # Get tweet stats with updated selectors
-                            stats = {}
-                            
-                            # Get reply count
-                            reply_element = tweet_element.query_selector('[data-testid="reply"]')
-                            if reply_element:
-                                reply_count = reply_element.query_selector('span[data-testid="app-text-transition-container"]')
-                                stats['reply'] = reply_count.text_content().strip() if reply_count else "0"
-                            
-                            # Get retweet count
-                            retweet_element = tweet_element.query_selector('[data-testid="retweet"]')
-                            if retweet_element:
-                                retweet_count = retweet_element.query_selector('span[data-testid="app-text-transition-container"]')
-                                stats['retweet'] = retweet_count.text_content().strip() if retweet_count else "0"
-                            
-                            # Get like count
-                            like_element = tweet_element.query_selector('[data-testid="like"]')
-                            if like_element:
-                                like_count = like_element.query_selector('span[data-testid="app-text-transition-container"]')
-                                stats['like'] = like_count.text_content().strip() if like_count else "0"
-                            
-                            # Get view count
-                            view_element = tweet_element.query_selector('a[aria-label*="views"]')
-                            if view_element:
-                                view_count = view_element.query_selector('span[data-testid="app-text-transition-container"]')
-                                stats['views'] = view_count.text_content().strip() if view_count else "0"
-                            
-                            # Get media content if available
-                            media_url = None
-                            media_container = tweet_element.query_selector('[data-testid="tweetPhoto"]')
-                            if media_container:
-                                img_element = media_container.query_selector('img')
-                                if img_element:
-                                    media_url = img_element.get_attribute('src')
-                            else:
-                                # Check for video content
-                                video_container = tweet_element.query_selector('video')
-                                if video_container:
-                                    media_url = video_container.get_attribute('poster')
-                            
-                            tweet_data = {
-                                'author': author_info,
-                                'text': text,
-                                'timestamp': timestamp,
-                                'stats': stats,
-                                'url': tweet_link,
-                                'media_url': media_url
-                            }
-                            
-                            loaded_tweets.add(tweet_link)
-                            tweets.append(tweet_data)
-                            print(f"Debug: Successfully added tweet {len(tweets)}")
-                            
-                            if len(tweets) >= max_tweets:
-                                break
-                                
-                        except Exception as e:
-                            print(f"Debug: Error extracting tweet details: {str(e)}")
-                    
-                except Exception as e:
-                    print(f"Debug: Error during scrolling: {str(e)}")
-                    page.wait_for_timeout(2000)
+                # Navigate to Twitter with a shorter timeout for initial load
+                logger.debug("Navigating to %s", self.home_url)
+                with metrics.phase('navigate'):
+                    page.goto(self.home_url, wait_until='domcontentloaded', timeout=budget.timeout_ms(30000))
+                logger.debug("Initial page load complete")
+            
+                # Check if we need to log in
+                if page.url.startswith('https://twitter.com/i/flow/login'):
+                    login_wait_ms = budget.timeout_ms(self.login_wait_ms)
+                    logger.warning("Please log in to X (Twitter) in the browser window, waiting up to %d seconds",
+                                   login_wait_ms // 1000)
+                    page.wait_for_url(self.home_url, timeout=login_wait_ms)
+                    logger.debug("Login page detected and waited for redirect")
                 
-                if len(tweets) < max_tweets:
-                    print(f"Debug: Collected {len(tweets)} tweets so far, continuing to scroll...")
+                    # Wait for the feed to be visible after login
+                    try:
+                        with metrics.phase('navigate'):
+                            page.wait_for_selector('article[role="article"]', timeout=budget.timeout_ms(30000))
+                        logger.debug("Feed loaded after login")
+                    except PlaywrightTimeoutError:
+                        # Out of time: the deadline handler below marks the run truncated
+                        if budget.expired():
+                            raise
+                        logger.warning("Timed out waiting for the feed after login")
+                        return
+                    except Exception as e:
+                        logger.warning("Error waiting for feed: %s", e)
+                        return
             
-            page.close()
-            print("Debug: Page closed")
+                logger.info("Starting to collect tweets")
             
-            if len(tweets) < max_tweets:
-                print(f"\nNote: Only found {len(tweets)} unique tweets after maximum attempts.")
+                # Initial wait for any tweet to be visible; network capture does not need the DOM
+                if capture is None:
+                    try:
+                        with metrics.phase('navigate'):
+                            page.wait_for_selector('article[role="article"]', timeout=budget.timeout_ms(30000))
+                        logger.debug("Initial tweets found")
+                    except PlaywrightTimeoutError:
+                        if budget.expired():
+                            raise
+                        logger.warning("Timed out finding initial tweets")
+                        return
+                    except Exception as e:
+                        logger.warning("Error finding initial tweets: %s", e)
+                        return
+            
+                if self.extraction_mode == 'observer':
+                    self._install_tweet_collector(page)
+            
+                driver = ScrollDriver(
+                    page,
+                    'article[role="article"]',
+                    max_wait_ms=self.max_scroll_wait_ms,
+                )
             
-        return tweets[:max_tweets]
+                # Extract what is rendered first, then let the budget decide whether to scroll for more
+                for tweet in self._collect(page, driver, max_tweets,
+                                           lambda handled: self._read_tweets(page, capture, handled)):
+                    collected += 1
+                    yield tweet
+                status = budget.status()
+            except PlaywrightTimeoutError:
+                if not budget.expired():
+                    raise
+                # Out of time while loading or waiting for a login; what was yielded stands
+                budget.truncate('deadline')
+                status = budget.status()
+            except GeneratorExit:
+                status = 'stopped'
+                raise
+            finally:
+                if capture is not None:
+                    metrics.count('duplicates_skipped', capture.duplicates)
+                if driver is not None:
+                    self.scroll_steps = driver.steps
+                    logger.debug("Waited %d ms over %d scroll steps", driver.total_wait_ms, len(driver.steps))
+                if blocker:
+                    self.blocked_resources = blocker.report()
+                    logger.debug("Blocked resources: %s", self.blocked_resources)
+                page.close()
+                metrics.finish(status)
+            
+            if collected < max_tweets:
+                logger.info("Only found %d unique tweets (%s)", collected, status)
+
+# os.umask can only be read by setting it, so it is read once at import rather than
+# flipped while other threads may be creating files
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def _new_file_mode(path: Path) -> int:
+    """Permissions for a rewrite of path: its current mode, or what open() would give a new file"""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+@contextmanager
+def open_atomic(path: Path, mode: str = "w"):
+    """Open a temp file beside path and rename it over path when the block completes, so readers never see half a file.
+
+    The temp file gets a unique name from mkstemp, so concurrent writers of one path,
+    in other threads or processes, never share it; the last rename wins. Its contents
+    are flushed to disk before the rename. If the block raises, the temp file is
+    removed and path is left untouched.
+    """
+    path = Path(path)
+    fd, temporary = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    temporary = Path(temporary)
+    try:
+        # mkstemp creates the file private to its owner
+        os.chmod(temporary, _new_file_mode(path))
+        with open(fd, mode, encoding=None if 'b' in mode else "utf-8") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+
+def write_text_atomic(path: Path, text: str):
+    with open_atomic(path) as f:
+        f.write(text)
+
+def write_json_atomic(path: Path, data, indent: Optional[int] = 2):
+    with open_atomic(path) as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent)
+
+def write_json_array_atomic(path: Path, records: Iterable[Dict]) -> int:
+    """Stream records into a JSON array at path, one per line, and return how many were written"""
+    written = 0
+    with open_atomic(path) as f:
+        f.write("[")
+        for record in records:
+            f.write(",\n" if written else "\n")
+            f.write(json.dumps(record, ensure_ascii=False))
+            written += 1
+        f.write("\n]\n")
+    return written
+
+JSON_ARRAY_SEPARATORS = re.compile(r'[\s,]*')
+
+def iter_feed_file(path: Path, chunk_size: int = 1 << 16) -> Iterator[Dict]:
+    """Decode the records of a feed JSON array one at a time instead of loading the whole file"""
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8") as f:
+        buffer = f.read(chunk_size).lstrip()
+        if not buffer.startswith('['):
+            raise ValueError(f"{path} does not hold a JSON array")
+        position = 1
+        while True:
+            position = JSON_ARRAY_SEPARATORS.match(buffer, position).end()
+            if buffer.startswith(']', position):
+                return
+            try:
+                record, position = decoder.raw_decode(buffer, position)
+            except ValueError:
+                # The record runs past the buffer; read on and decode it again
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    raise
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+            yield record
+
+def save_feed(records: Iterable[Dict], path: Path) -> int:
+    return write_json_array_atomic(path, records)
+
+class NDJSONWriter:
+    """Append-only newline-delimited JSON sink that flushes after every record.
+
+    Lets another process tail the file while a scrape is still running; with
+    append=False the file is truncated first.
+    """
+    
+    def __init__(self, path: Path, append: bool = True):
+        self.path = Path(path)
+        self._file = open(self.path, "a" if append else "w", encoding="utf-8")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def write(self, record: Dict):
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+    
+    def close(self):
+        self._file.close()
+
+def read_ndjson(path: Path) -> Iterator[Dict]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def stream_feed(records: Iterator[Dict], sink: NDJSONWriter, metrics: Optional[ScrapeMetrics] = None) -> int:
+    """Write each record to the sink as it arrives and return how many were written; nothing is kept in memory"""
+    written = 0
+    for record in records:
+        if metrics is not None:
+            with metrics.phase('serialize'):
+                sink.write(record)
+        else:
+            sink.write(record)
+        written += 1
+    return written
+
+def merge_feed(new_records: Iterable[Dict], path: Path, key: str) -> int:
+    """Put new_records ahead of the feed stored at path, dropping any that are already stored, and save it.
+
+    Both feeds are streamed; only the stored items' keys are held in memory. Returns the merged length.
+    Stored records older than scraped_at get the file's modification time as theirs, once, so
+    their relative posting times stay anchored after this rewrite moves it.
+    """
+    stored_keys = set()
+    if path.exists():
+        stored_keys = {record.get(key) or record.get('url') for record in iter_feed_file(path)}
+        stored_at = format_timestamp(datetime.fromtimestamp(path.stat().st_mtime, timezone.utc))
+    
+    def merged():
+        for record in new_records:
+            if (record.get(key) or record.get('url')) not in stored_keys:
+                yield record
+        if stored_keys:
+            for record in iter_feed_file(path):
+                record.setdefault('scraped_at', stored_at)
+                yield record
+    
+    return save_feed(merged(), path)
+
+class MediaCache:
+    """Content-addressed disk cache for thumbnails and tweet media, filled concurrently after a scrape.
+
+    Files are stored as <root>/<sha256[:2]>/<sha256><ext>, so identical bytes served
+    from different URLs are kept once. index.json maps each source URL to its file,
+    and URLs already in it are not downloaded again. Downloads share one pooled
+    requests.Session with at most max_workers in flight. With variant_widths and
+    Pillow installed, downscaled JPEG copies are written next to each original.
+    Serve `root` at `url_prefix` (e.g. symlink public/media to it) so the front end
+    can load the rewritten URLs.
+    """
+
+    def __init__(self, root: Path = Path("scraped_data") / "media", url_prefix: str = "/media",
+                 max_workers: int = 8, timeout: float = 15, variant_widths=(), session=None):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.url_prefix = url_prefix.rstrip('/')
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.variant_widths = tuple(sorted(variant_widths))
+        if self.variant_widths and Image is None:
+            logger.warning("Pillow is not installed, skipping downscaled media variants")
+            self.variant_widths = ()
+        self.session = session or requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.index_path = self.root / "index.json"
+        self._index = {}
+        if self.index_path.exists():
+            with open(self.index_path, encoding="utf-8") as f:
+                self._index = json.load(f)
+        self.downloaded = 0
+        self.cache_hits = 0
+        self.failed = 0
+        self.downloaded_bytes = 0
+
+    def cached(self, url: str) -> Optional[Dict]:
+        """The index entry for url if its file is still on disk"""
+        entry = self._index.get(url)
+        if entry and (self.root / entry['path']).exists():
+            return entry
+        return None
+
+    def _extension(self, url: str, content_type: str) -> str:
+        extension = mimetypes.guess_extension(content_type.split(';')[0].strip()) if content_type else None
+        if extension in (None, '.jpe'):
+            extension = os.path.splitext(url.split('?')[0])[1] or '.bin'
+        return extension
+
+    def _write(self, relative: str, data: bytes):
+        # Written atomically so a concurrent reader never sees a partial file
+        path = self.root / relative
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open_atomic(path, "wb") as f:
+            f.write(data)
+
+    def _variants(self, digest: str, data: bytes) -> Dict[str, str]:
+        variants = {}
+        if not self.variant_widths:
+            return variants
+        with Image.open(io.BytesIO(data)) as image:
+            for width in self.variant_widths:
+                if width >= image.width:
+                    continue
+                relative = f"{digest[:2]}/{digest}_w{width}.jpg"
+                if not (self.root / relative).exists():
+                    height = max(1, round(image.height * width / image.width))
+                    buffer = io.BytesIO()
+                    image.convert('RGB').resize((width, height), Image.LANCZOS).save(buffer, 'JPEG', quality=80)
+                    self._write(relative, buffer.getvalue())
+                variants[str(width)] = relative
+        return variants
+
+    def _download(self, url: str) -> Dict:
+        """Fetch one asset and store it under its content hash; runs on a worker thread"""
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        data = response.content
+        digest = hashlib.sha256(data).hexdigest()
+        relative = f"{digest[:2]}/{digest}{self._extension(url, response.headers.get('content-type', ''))}"
+        self._write(relative, data)
+        return {
+            'sha256': digest,
+            'path': relative,
+            'bytes': len(data),
+            'content_type': response.headers.get('content-type'),
+            'variants': self._variants(digest, data),
+        }
+
+    def prefetch(self, urls) -> Dict[str, Dict]:
+        """Download every URL not already cached, in parallel, and return the index entries for all of them"""
+        unique = list(dict.fromkeys(url for url in urls if url))
+        missing = [url for url in unique if self.cached(url) is None]
+        self.cache_hits += len(unique) - len(missing)
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {executor.submit(self._download, url): url for url in missing}
+                for future in as_completed(futures):
+                    url = futures[future]
+                    try:
+                        entry = future.result()
+                    except Exception as e:
+                        logger.warning("Could not fetch media %s: %s", url, e)
+                        self.failed += 1
+                        continue
+                    self._index[url] = entry
+                    self.downloaded += 1
+                    self.downloaded_bytes += entry['bytes']
+            self._save_index()
+
+        return {url: self._index[url] for url in unique if url in self._index}
+
+    def _save_index(self):
+        write_json_atomic(self.index_path, self._index)
+
+    def local_url(self, relative: str) -> str:
+        return f"{self.url_prefix}/{relative}"
+
+    def localize(self, records: List[Dict], fields) -> List[Dict]:
+        """Return copies of records whose media fields point at the cached files.
+
+        The original URL is kept in <field>_source and any downscaled copies in
+        <field>_variants (width -> URL). Fields that could not be fetched are left as they were.
+        """
+        entries = self.prefetch(record.get(field) for record in records for field in fields)
+        localized = []
+        for record in records:
+            record = dict(record)
+            for field in fields:
+                entry = entries.get(record.get(field))
+                if entry is None:
+                    continue
+                record[f'{field}_source'] = record[field]
+                record[field] = self.local_url(entry['path'])
+                if entry['variants']:
+                    record[f'{field}_variants'] = {
+                        width: self.local_url(relative) for width, relative in entry['variants'].items()
+                    }
+            localized.append(record)
+        return localized
+
+    def localize_ndjson(self, path: Path, fields, batch_size: int = 200):
+        """Rewrite an NDJSON feed so its media fields point at cached files, downloading batch_size records at a time"""
+        records = read_ndjson(path)
+        with open_atomic(path) as f:
+            while True:
+                batch = list(itertools.islice(records, batch_size))
+                if not batch:
+                    break
+                for record in self.localize(batch, fields):
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def report(self) -> Dict:
+        return {
+            'downloaded': self.downloaded,
+            'cache_hits': self.cache_hits,
+            'failed': self.failed,
+            'downloaded_bytes': self.downloaded_bytes,
+        }
+
+def store_feed(source: Path, path: Path, scraper, seen_index: Optional[SeenIndex] = None,
+               archive: Optional[FeedArchive] = None):
+    """Overwrite the feed file from the run's NDJSON source, or merge into it and record the items as seen
+    when running incrementally.
+
+    With an archive the records are also added to the searchable history. The source
+    is re-read for each destination, so the run's records are never held in memory.
+    """
+    with scraper.metrics.phase('serialize'):
+        if seen_index is None:
+            save_feed(read_ndjson(source), path)
+        else:
+            merge_feed(read_ndjson(source), path, scraper.ITEM_KEY)
+            seen_index.mark_seen(scraper.PLATFORM, read_ndjson(source), scraper.ITEM_KEY)
+        if archive is not None:
+            archive.ingest(read_ndjson(source), scraper.PLATFORM)
+
+def scrape_and_store(scraper, max_items: int, output_dir: Path, stem: str, seen_index: Optional[SeenIndex] = None,
+                     archive: Optional[FeedArchive] = None, media_cache: Optional['MediaCache'] = None) -> int:
+    """Stream a scrape into <stem>.ndjson, then build <stem>.json from that file; returns the number of items.
+
+    Records go to disk as they are scraped, so memory does not grow with the run.
+    """
+    source = Path(output_dir) / f"{stem}.ndjson"
+    with NDJSONWriter(source, append=False) as sink:
+        items = stream_feed(scraper.iter_feed(max_items), sink, scraper.metrics)
+    if media_cache is not None:
+        media_cache.localize_ndjson(source, scraper.MEDIA_FIELDS)
+    store_feed(source, Path(output_dir) / f"{stem}.json", scraper, seen_index, archive)
+    return items
+
+# Per-platform feed files merged into feed.json: file name, item type for the front end, normalizer
+UNIFIED_FEED_SOURCES = (
+    ("youtube_feed.json", 'youtube', normalize_youtube_record),
+    ("twitter_feed.json", 'twitter', normalize_x_record),
+)
+
+def _posted_at_key(record: Dict) -> str:
+    # posted_at strings share one UTC format, so they compare chronologically; undated items sort last
+    return record.get('posted_at') or ''
+
+def _load_feed_items(path: Path, item_type: str, normalize) -> List[Dict]:
+    """Read one platform's feed newest first, normalizing records stored before posted_at existed"""
+    if not path.exists():
+        return []
+    with open(path, encoding="utf-8") as f:
+        records = json.load(f)
+    # Older records carry no scraped_at; the file's modification time is the closest anchor
+    # (merge_feed saves it into them the first time it rewrites the file)
+    anchor = datetime.fromtimestamp(path.stat().st_mtime, timezone.utc)
+    for record in records:
+        if 'posted_at' not in record:
+            normalize(record, anchor)
+        record['type'] = item_type
+    # Stored feeds are already close to newest-first, which Timsort handles in near-linear time
+    records.sort(key=_posted_at_key, reverse=True)
+    return records
+
+def write_unified_feed(output_dir: Path, path: Optional[Path] = None, dedup_threshold: Optional[float] = None) -> int:
+    """k-way merge the per-platform feeds into one newest-first feed.json and return its length.
+
+    With a dedup_threshold (0.8 is a good start, see feed_dedup.py), near-duplicates
+    such as reposts and re-uploads are collapsed into their earliest-posted item.
+    Items are streamed to a temp file that replaces feed.json once complete.
+    """
+    path = path or output_dir / "feed.json"
+    sources = [_load_feed_items(output_dir / name, item_type, normalize)
+               for name, item_type, normalize in UNIFIED_FEED_SOURCES]
+    records = heapq.merge(*sources, key=_posted_at_key, reverse=True)
+    if dedup_threshold is not None:
+        records = collapse_near_duplicates(list(records), dedup_threshold)
+    return write_json_array_atomic(path, records)
+
+def write_run_metrics(scrapers: List, metrics_dir: Path) -> List[Dict]:
+    """Write each scraper's last-run summary as <platform>_metrics.json and <platform>.prom and return the summaries"""
+    metrics_dir.mkdir(parents=True, exist_ok=True)
+    summaries = []
+    for scraper in scrapers:
+        scraper.metrics.write_json(metrics_dir / f"{scraper.PLATFORM}_metrics.json")
+        scraper.metrics.write_prometheus(metrics_dir / f"{scraper.PLATFORM}.prom")
+        summaries.append(scraper.metrics.summary())
+    return summaries
+
+async def scrape_feeds_concurrently(max_videos: int, max_tweets: int, output_dir: Path,
+                                    youtube_scraper: YouTubeScraper = None,
+                                    x_scraper: XScraper = None,
+                                    media_cache: MediaCache = None) -> Dict[str, List[Dict]]:
+    """Scrape YouTube and X in parallel tabs over one browser connection and save both feeds.
+
+    The connection uses youtube_scraper's debugging_port and user_data_dir, and
+    connecting counts against each scraper's deadline_seconds. With a media_cache,
+    thumbnails and tweet media are downloaded and the saved records point at the
+    local copies.
+    """
+    youtube_scraper = youtube_scraper or YouTubeScraper()
+    x_scraper = x_scraper or XScraper()
+    started = time.monotonic()
+    # Chrome must be ready before the first scraper's deadline
+    deadlines = [scraper.deadline_seconds for scraper in (youtube_scraper, x_scraper)
+                 if scraper.deadline_seconds is not None]
+    manager = AsyncBrowserManager(port=youtube_scraper.debugging_port, user_data_dir=youtube_scraper.user_data_dir,
+                                  deadline=started + min(deadlines) if deadlines else None)
+    async with manager as browser:
+        connect_seconds = time.monotonic() - started
+        # Use the first context that's already open
+        context = browser.contexts[0]
+        youtube_videos, tweets = await asyncio.gather(
+            youtube_scraper.scrape_feed_async(context, max_videos=max_videos, started=started),
+            x_scraper.scrape_feed_async(context, max_tweets=max_tweets, started=started),
+        )
+    
+    if media_cache is not None:
+        youtube_videos = media_cache.localize(youtube_videos, youtube_scraper.MEDIA_FIELDS)
+        tweets = media_cache.localize(tweets, x_scraper.MEDIA_FIELDS)
+    
+    # Both tabs share one connection, so each run is charged the full connect time
+    for scraper, records, name in ((youtube_scraper, youtube_videos, "youtube_feed.json"),
+                                   (x_scraper, tweets, "twitter_feed.json")):
+        scraper.metrics.record('connect', connect_seconds)
+        with scraper.metrics.phase('serialize'):
+            save_feed(records, output_dir / name)
+    return {'youtube': youtube_videos, 'x': tweets}
+
+# Platforms a profile worker can scrape: scraper class and output file stem
+PROFILE_SCRAPERS = {
+    'youtube': (YouTubeScraper, "youtube_feed"),
+    'x': (XScraper, "twitter_feed"),
+}
+
+def scrape_profile(profile_dir: str, output_dir: str, max_items: int, platforms=('youtube', 'x'),
+                   headless: bool = False, scraper_options: Optional[Dict] = None,
+                   dedup_threshold: Optional[float] = None) -> Dict:
+    """Scrape one Chrome profile's feeds on its own browser and write them under output_dir/<profile name>.
+
+    Runs in a worker process: Chrome is launched on a port it picks itself (port=0),
+    shared by the profile's platforms, and stopped afterwards. scraper_options are
+    passed to every scraper, e.g. deadline_seconds and max_scrolls.
+    """
+    configure_logging()
+    name = Path(profile_dir).name
+    profile_output = Path(output_dir) / name
+    profile_output.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+    
+    pool = BrowserPool(user_data_dir=profile_dir, port=0, headless=headless, stop_on_exit=True)
+    archive = FeedArchive(profile_output / "archive.sqlite3")
+    scrapers = []
+    items = {}
+    try:
+        for platform in platforms:
+            scraper_class, stem = PROFILE_SCRAPERS[platform]
+            scraper = scraper_class(user_data_dir=profile_dir, browser_pool=pool, **(scraper_options or {}))
+            items[platform] = scrape_and_store(scraper, max_items, profile_output, stem, archive=archive)
+            scrapers.append(scraper)
+    finally:
+        pool.close()
+        archive.close()
+    
+    write_unified_feed(profile_output, dedup_threshold=dedup_threshold)
+    write_run_metrics(scrapers, profile_output / "metrics")
+    return {
+        'profile': name,
+        'output_dir': str(profile_output),
+        'items': items,
+        'status': {scraper.PLATFORM: scraper.metrics.status for scraper in scrapers},
+        'seconds': round(time.perf_counter() - started, 1),
+    }
+
+def run_profiles(profile_dirs: List[str], output_dir: Path, max_items: int, platforms=('youtube', 'x'),
+                 workers: Optional[int] = None, headless: bool = False,
+                 scraper_options: Optional[Dict] = None, dedup_threshold: Optional[float] = None) -> List[Dict]:
+    """Scrape several Chrome profiles in parallel, one worker process and one browser per profile"""
+    names = [Path(profile_dir).name for profile_dir in profile_dirs]
+    if len(set(names)) != len(names):
+        raise ValueError("Profile directories must have distinct names, they name the output folders")
+    workers = workers or min(len(profile_dirs), os.cpu_count() or 1)
+    
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(scrape_profile, str(Path(profile_dir).resolve()), str(output_dir), max_items,
+                            tuple(platforms), headless, scraper_options, dedup_threshold): profile_dir
+            for profile_dir in profile_dirs
+        }
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error("Profile %s failed: %s", futures[future], e)
+                results.append({'profile': Path(futures[future]).name, 'error': str(e)})
+    return results
+
+def configure_logging():
+    # Only warnings by default; SCRAPER_LOG_LEVEL=DEBUG shows every scroll step and item
+    logging.basicConfig(
+        level=os.environ.get('SCRAPER_LOG_LEVEL', 'WARNING').upper(),
+        format='%(asctime)s %(levelname)s %(name)s: %(message)s',
+    )
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape YouTube and X home feeds. Runs interactively unless --profiles "
+                                                 "is given; see scrape_daemon.py for recurring unattended scrapes.")
+    parser.add_argument("--profiles", nargs="+", metavar="DIR",
+                        help="Chrome profile directories to scrape in parallel, one worker process each")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per profile, up to the CPU count)")
+    parser.add_argument("--max-items", type=int, default=50, help="items per platform and profile")
+    parser.add_argument("--platforms", nargs="+", choices=sorted(PROFILE_SCRAPERS), default=['youtube', 'x'])
+    parser.add_argument("--headless", action="store_true", help="run the profile browsers headless")
+    parser.add_argument("--output-dir", type=Path, default=Path("scraped_data"))
+    parser.add_argument("--deadline", type=float, default=None, metavar="SECONDS",
+                        help="return whatever each scrape has collected after this long")
+    parser.add_argument("--max-scrolls", type=int, default=None, help="scroll steps allowed per scrape")
+    parser.add_argument("--max-playwright-calls", type=int, default=None, help="Playwright calls allowed per scrape")
+    parser.add_argument("--dedup-threshold", type=float, default=None, metavar="SIMILARITY",
+                        help="collapse near-duplicate items in feed.json (0.8 is a good start; default: off)")
+    return parser.parse_args(argv)
+
+def budget_options(args) -> Dict:
+    """Scraper keyword arguments for the --deadline, --max-scrolls and --max-playwright-calls flags"""
+    return {
+        'deadline_seconds': args.deadline,
+        'max_scrolls': args.max_scrolls,
+        'max_playwright_calls': args.max_playwright_calls,
+    }
 
 def main():
+    args = parse_args()
+    configure_logging()
+    
     # Define the path to save scraped data
-    output_dir = Path("scraped_data")
+    output_dir = args.output_dir
     output_dir.mkdir(exist_ok=True)
     
+    # Non-interactive: every profile gets its own worker, browser and debugging port
+    if args.profiles:
+        for result in run_profiles(args.profiles, output_dir / "profiles", args.max_items, args.platforms,
+                                   args.workers, args.headless, budget_options(args), args.dedup_threshold):
+            print(json.dumps(result))
+        return
+    
     # Get user input for platform choice
     print("\nAvailable options:")
     print("1. YouTube Feed")
     print("2. X (Twitter) Feed")
+    print("3. Both feeds (in parallel)")
     
+    platforms = {1: 'youtube_feed', 2: 'x', 3: 'both'}
     while True:
         try:
-            choice = int(input("\nEnter the number of your choice (1-2): "))
-            if choice in [1, 2]:
-                platform = 'youtube_feed' if choice == 1 else 'x'
+            choice = int(input("\nEnter the number of your choice (1-3): "))
+            if choice in platforms:
+                platform = platforms[choice]
                 break
-            print("Invalid choice. Please enter 1 or 2.")
+            print("Invalid choice. Please enter 1, 2 or 3.")
         except ValueError:
-            print("Invalid input. Please enter a number (1 or 2).")
+            print("Invalid input. Please enter a number (1, 2 or 3).")
     
     # Get user input for content count for feed scraping
     MAX_ITEMS = 100
@@ -451,27 +2723,67 @@ def main():
         except ValueError:
             print("Please enter a valid number.")
     
+    # Incremental runs skip items saved by earlier runs and merge the rest into the stored feed
+    seen_index = None
+    if platform != 'both':
+        answer = input("Only scrape items that are new since the last run? (y/N): ")
+        if answer.strip().lower() == 'y':
+            seen_index = SeenIndex(output_dir / "seen_index.sqlite3")
+    
+    # Optionally keep local copies of thumbnails and media so the feed survives expiring URLs
+    media_cache = None
+    answer = input("Download thumbnails and media for offline viewing? (y/N): ")
+    if answer.strip().lower() == 'y':
+        media_cache = MediaCache(output_dir / "media", variant_widths=(320,))
+    
+    # Every run is kept in the searchable archive (see feed_archive.py for the query CLI)
+    archive = FeedArchive(output_dir / "archive.sqlite3")
+    
     if platform == 'youtube_feed':
         # Scrape YouTube feed
-        youtube_scraper = YouTubeScraper()
-        youtube_videos = youtube_scraper.scrape_feed(max_videos=count)
+        youtube_scraper = YouTubeScraper(seen_index=seen_index, **budget_options(args))
+        # Save YouTube data as it streams in
+        youtube_videos = scrape_and_store(youtube_scraper, count, output_dir, "youtube_feed", seen_index, archive,
+                                          media_cache)
         
-        # Save YouTube data
-        with open(output_dir / "youtube_feed.json", "w", encoding="utf-8") as f:
-            json.dump(youtube_videos, f, ensure_ascii=False, indent=2)
-        
-        print(f"Saved {len(youtube_videos)} YouTube videos to {output_dir / 'youtube_feed.json'}")
+        print(f"Saved {youtube_videos} YouTube videos to {output_dir / 'youtube_feed.json'}")
+        scrapers = [youtube_scraper]
     
-    else:  # platform == 'x'
+    elif platform == 'x':
         # Scrape Twitter feed
-        x_scraper = XScraper()
-        tweets = x_scraper.scrape_feed(max_tweets=count)
+        x_scraper = XScraper(seen_index=seen_index, **budget_options(args))
+        # Save Twitter data as it streams in
+        tweets = scrape_and_store(x_scraper, count, output_dir, "twitter_feed", seen_index, archive, media_cache)
         
-        # Save Twitter data
-        with open(output_dir / "twitter_feed.json", "w", encoding="utf-8") as f:
-            json.dump(tweets, f, ensure_ascii=False, indent=2)
+        print(f"Saved {tweets} tweets to {output_dir / 'twitter_feed.json'}")
+        scrapers = [x_scraper]
+    
+    else:  # platform == 'both'
+        # Scrape both feeds in parallel tabs of one browser session
+        scrapers = [YouTubeScraper(**budget_options(args)), XScraper(**budget_options(args))]
+        results = asyncio.run(scrape_feeds_concurrently(count, count, output_dir, *scrapers, media_cache))
+        for scraper in scrapers:
+            archive.ingest(results[scraper.PLATFORM], scraper.PLATFORM)
         
-        print(f"Saved {len(tweets)} tweets to {output_dir / 'twitter_feed.json'}")
+        print(f"Saved {len(results['youtube'])} YouTube videos to {output_dir / 'youtube_feed.json'}")
+        print(f"Saved {len(results['x'])} tweets to {output_dir / 'twitter_feed.json'}")
+    
+    # One pre-merged, pre-sorted feed so the front end does no parsing or sorting
+    feed_length = write_unified_feed(output_dir, dedup_threshold=args.dedup_threshold)
+    print(f"Wrote {feed_length} items to {output_dir / 'feed.json'}")
+    
+    # Per-run summaries for the scheduler: JSON plus a Prometheus textfile per platform
+    for summary in write_run_metrics(scrapers, output_dir / "metrics"):
+        phases = ", ".join(f"{name} {phase['seconds']:.2f}s" for name, phase in summary['phases'].items())
+        print(f"{summary['platform']}: {summary['counters']['items']} items in {summary['duration_seconds']:.1f}s, "
+              f"{summary['status']} ({phases})")
+    
+    if media_cache is not None:
+        print(f"Media cache: {media_cache.report()}")
+    
+    archive.close()
+    if seen_index is not None:
+        seen_index.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
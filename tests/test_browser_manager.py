@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("playwright")
+pytest.importorskip("requests")
+
+import social_media_scraper as scraper_module
+from social_media_scraper import AsyncBrowserManager, BrowserManager, BrowserPool
+
+
+class FakeProcess:
+    """A Chrome this manager launched"""
+
+    def __init__(self):
+        self.terminated = False
+
+    def poll(self):
+        return 0 if self.terminated else None
+
+    def terminate(self):
+        self.terminated = True
+
+    def wait(self, timeout=None):
+        return 0
+
+
+class FakeChromium:
+    def connect_over_cdp(self, endpoint_url, timeout):
+        raise ConnectionError("connection refused")
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = FakeChromium()
+        self.stopped = False
+
+    def start(self):
+        return self
+
+    def stop(self):
+        self.stopped = True
+
+
+class AsyncFakeChromium:
+    async def connect_over_cdp(self, endpoint_url, timeout):
+        raise ConnectionError("connection refused")
+
+
+class AsyncFakePlaywright(FakePlaywright):
+    def __init__(self):
+        super().__init__()
+        self.chromium = AsyncFakeChromium()
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture
+def launched(monkeypatch):
+    """Every manager 'launches' a FakeProcess instead of probing for and starting Chrome"""
+    processes = []
+
+    def ensure_debugging_endpoint(manager):
+        manager.process = FakeProcess()
+        processes.append(manager.process)
+        return manager.endpoint
+
+    monkeypatch.setattr(BrowserManager, '_ensure_debugging_endpoint', ensure_debugging_endpoint)
+    return processes
+
+
+def test_failed_connect_stops_playwright_and_launched_chrome(monkeypatch, launched):
+    playwright = FakePlaywright()
+    monkeypatch.setattr(scraper_module, 'sync_playwright', lambda: playwright)
+    with pytest.raises(RuntimeError):
+        with BrowserManager(stop_on_exit=True):
+            pass
+    assert playwright.stopped
+    assert launched[0].terminated
+
+
+def test_failed_pool_session_stops_launched_chrome(monkeypatch, launched):
+    playwright = FakePlaywright()
+    monkeypatch.setattr(scraper_module, 'sync_playwright', lambda: playwright)
+    pool = BrowserPool(stop_on_exit=True)
+    with pytest.raises(RuntimeError):
+        with pool.session():
+            pass
+    assert launched[0].terminated
+    # The pool's shared driver stays up for the next session
+    assert not playwright.stopped
+    pool.close()
+    assert playwright.stopped
+
+
+def test_failed_async_connect_stops_playwright_and_launched_chrome(monkeypatch, launched):
+    playwright = AsyncFakePlaywright()
+    monkeypatch.setattr(scraper_module, 'async_playwright', lambda: playwright)
+
+    async def enter():
+        async with AsyncBrowserManager(stop_on_exit=True):
+            pass
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(enter())
+    assert playwright.stopped
+    assert launched[0].terminated
@@ -0,0 +1,81 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from feed_archive import FeedArchive, format_timestamp, fts_query
+
+
+def tweet(index, text, handle="@someone", posted_at="2026-01-01T00:00:00Z", scraped_at="2026-01-02T00:00:00Z",
+          likes=1):
+    return {'author': {'name': handle[1:].title(), 'handle': handle}, 'text': text, 'posted_at': posted_at,
+            'scraped_at': scraped_at, 'url': f"https://x.com/{handle[1:]}/status/{index}", 'counts': {'like': likes}}
+
+
+@pytest.fixture
+def archive(tmp_path):
+    with FeedArchive(tmp_path / "archive.sqlite3") as archive:
+        yield archive
+
+
+def urls(results):
+    return [item['url'] for item in results]
+
+
+def test_format_timestamp_normalizes_to_utc():
+    assert format_timestamp(datetime(2026, 1, 1, 12, 30)) == "2026-01-01T12:30:00Z"
+    moment = datetime.fromisoformat("2026-01-01T12:30:00+02:00")
+    assert format_timestamp(moment) == "2026-01-01T10:30:00Z"
+    assert format_timestamp(moment.astimezone(timezone.utc)) == "2026-01-01T10:30:00Z"
+
+
+def test_upsert_keeps_one_item_and_updates_it(archive):
+    archive.ingest([tweet(1, "first draft")], 'x')
+    archive.ingest([tweet(1, "edited text", scraped_at="2026-01-03T00:00:00Z")], 'x')
+    assert archive.stats()['items'] == {'x': 1}
+    [item] = archive.search("edited")
+    assert item['first_seen'] == "2026-01-02T00:00:00Z"
+    assert item['last_seen'] == "2026-01-03T00:00:00Z"
+    assert archive.search("draft") == []
+
+
+def test_one_snapshot_per_scrape(archive):
+    archive.ingest([tweet(1, "hello", likes=5)], 'x')
+    # Ingesting the same file again adds nothing
+    archive.ingest([tweet(1, "hello", likes=5)], 'x')
+    archive.ingest([tweet(1, "hello", scraped_at="2026-01-03T00:00:00Z", likes=9)], 'x')
+    history = archive.history("https://x.com/someone/status/1")
+    assert [(snapshot['captured_at'], snapshot['like']) for snapshot in history] == [
+        ("2026-01-02T00:00:00Z", 5), ("2026-01-03T00:00:00Z", 9)]
+
+
+@pytest.mark.parametrize("text", ["AND", "NEAR(", 'say "hi', "OR NOT", "-minus", "col:umn"])
+def test_query_syntax_in_search_text_is_matched_literally(archive, text):
+    archive.ingest([tweet(1, "AND then NEAR( the col:umn OR NOT -minus say \"hi"), tweet(2, "unrelated")], 'x')
+    assert urls(archive.search(text)) == ["https://x.com/someone/status/1"]
+
+
+def test_search_text_without_terms_is_no_filter(archive):
+    archive.ingest([tweet(1, "hello")], 'x')
+    assert fts_query("* **") == ""
+    assert urls(archive.search("* **")) == ["https://x.com/someone/status/1"]
+
+
+def test_prefix_search(archive):
+    archive.ingest([tweet(1, "asynchronous runtimes"), tweet(2, "synchronous code")], 'x')
+    assert urls(archive.search("async*")) == ["https://x.com/someone/status/1"]
+
+
+def test_author_filter_accepts_handles_with_or_without_at(archive):
+    archive.ingest([tweet(1, "mine", handle="@Ada"), tweet(2, "theirs", handle="@grace")], 'x')
+    archive.ingest([{'video_id': "v1", 'title': "a talk", 'channel': "ada", 'url': "https://youtu.be/v1",
+                     'posted_at': "2025-12-31T00:00:00Z"}], 'youtube')
+    assert urls(archive.search(author="@ada")) == ["https://x.com/Ada/status/1", "https://youtu.be/v1"]
+    assert urls(archive.search(author="ADA", platform='x')) == ["https://x.com/Ada/status/1"]
+
+
+def test_since_is_inclusive_and_until_exclusive(archive):
+    archive.ingest([tweet(index, f"day {index}", posted_at=f"2026-01-0{index}T00:00:00Z") for index in (1, 2, 3)], 'x')
+    results = archive.search(since="2026-01-02", until="2026-01-03T00:00:00Z")
+    assert urls(results) == ["https://x.com/someone/status/2"]
+    assert urls(archive.search(since="2026-01-02T00:00:00+01:00")) == [
+        "https://x.com/someone/status/3", "https://x.com/someone/status/2"]
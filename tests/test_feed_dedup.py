@@ -0,0 +1,66 @@
+import pytest
+
+from feed_dedup import collapse_near_duplicates, find_clusters, item_features
+
+
+def tweet(text, handle="@someone", posted_at="2026-01-01T00:00:00Z"):
+    return {'type': 'twitter', 'text': text, 'author': {'name': handle[1:], 'handle': handle},
+            'posted_at': posted_at, 'url': f"https://x.com/{handle[1:]}/status/{abs(hash(text))}"}
+
+
+def video(title, channel="Some Channel", posted_at="2026-01-01T00:00:00Z"):
+    return {'type': 'youtube', 'title': title, 'channel': channel, 'posted_at': posted_at,
+            'url': f"https://www.youtube.com/watch?v={abs(hash((title, channel)))}"}
+
+
+NEAR_MISSES = [
+    (tweet("tweet one is here and long"), tweet("tweet two is here and long too")),
+    (video("Minecraft Hardcore Day 1"), video("Minecraft Hardcore Day 2")),
+    (video("I survived 100 days in Minecraft Hardcore, Day 41"), video("I survived 100 days in Minecraft Hardcore, Day 42")),
+    (tweet("What is the best way to learn Rust in 2026?"), tweet("What is the best way to learn Go in 2026?")),
+    (video("The Best Budget Gaming PC Build of 2025"), video("The Best Budget Gaming PC Build of 2026")),
+    (tweet("Just shipped version 2.3 of the scraper, release notes in the thread"),
+     tweet("Just shipped version 2.4 of the scraper, release notes in the thread")),
+    (video("Official Trailer", "Studio A"), video("Official Trailer", "Studio B")),
+    (tweet("Good morning everyone, have a great day"), tweet("Good night everyone, have a great sleep")),
+]
+
+DUPLICATES = [
+    (tweet("Big news: the new compiler release cuts build times in half for most projects", "@alice"),
+     tweet("RT @alice: Big news: the new compiler release cuts build times in half for most projects", "@bob")),
+    (tweet("Our paper on streaming joins got accepted, preprint coming next week"),
+     tweet("Our paper on streaming joins got accepted, preprint coming next week https://t.co/abc123")),
+    (video("Building a Home Lab From Scratch in One Weekend", "Original Channel"),
+     video("Building a Home Lab From Scratch in One Weekend", "Reupload Channel")),
+]
+
+
+@pytest.mark.parametrize("first, second", NEAR_MISSES)
+def test_near_misses_stay_apart(first, second):
+    assert len(collapse_near_duplicates([first, second], 0.8)) == 2
+
+
+@pytest.mark.parametrize("first, second", DUPLICATES)
+def test_reposts_and_reuploads_collapse(first, second):
+    assert find_clusters([first, second], 0.8) == [[0, 1]]
+
+
+def test_collapse_keeps_earliest_member_in_feed_order():
+    original = video("Building a Home Lab From Scratch in One Weekend", "Original", "2026-01-01T00:00:00Z")
+    reupload = video("Building a Home Lab From Scratch in One Weekend", "Reupload", "2026-01-05T00:00:00Z")
+    other = tweet("An unrelated tweet about something else entirely", posted_at="2026-01-03T00:00:00Z")
+
+    collapsed = collapse_near_duplicates([reupload, other, original], 0.8)
+
+    assert [record['url'] for record in collapsed] == [other['url'], original['url']]
+    assert collapsed[1]['cluster_size'] == 2
+    assert collapsed[1]['duplicates'][0]['author'] == "Reupload"
+
+
+def test_short_texts_are_never_compared():
+    assert item_features(tweet("lol same")) == set()
+    assert len(collapse_near_duplicates([tweet("gm"), tweet("gm", "@other")], 0.8)) == 2
+
+
+def test_channel_is_not_a_feature():
+    assert not any('channel' in feature for feature in item_features(video("A long enough title for shingles", "Channel")))
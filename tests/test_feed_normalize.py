@@ -0,0 +1,88 @@
+import json
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("playwright")
+pytest.importorskip("requests")
+
+from social_media_scraper import (merge_feed, normalize_x_record, normalize_youtube_record, parse_count,
+                                  parse_relative_time, save_feed, write_unified_feed)
+
+SCRAPED_AT = datetime(2024, 5, 10, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("text, count", [
+    ("1.2M views", 1_200_000),
+    ("4.5K", 4_500),
+    ("1,234 views", 1_234),
+    ("3b", 3_000_000_000),
+    ("No views", 0),
+    ("views", None),
+    ("", None),
+    (None, None),
+    (42, 42),
+])
+def test_parse_count(text, count):
+    assert parse_count(text) == count
+
+
+@pytest.mark.parametrize("text, posted_at", [
+    ("3 days ago", "2024-05-07T12:00:00Z"),
+    ("Streamed 2 hours ago", "2024-05-10T10:00:00Z"),
+    ("1 month ago", "2024-04-10T12:00:00Z"),
+    ("1 year ago", "2023-05-11T12:00:00Z"),
+    ("Premieres tomorrow", None),
+    (None, None),
+])
+def test_parse_relative_time(text, posted_at):
+    assert parse_relative_time(text, SCRAPED_AT) == posted_at
+
+
+def test_normalize_youtube_record_anchors_to_its_own_scraped_at():
+    record = normalize_youtube_record({'posted_time': "1 day ago", 'views': "2K views",
+                                       'scraped_at': "2024-01-02T00:00:00Z"}, SCRAPED_AT)
+    assert record['posted_at'] == "2024-01-01T00:00:00Z"
+    assert record['counts'] == {'views': 2_000}
+    fresh = normalize_youtube_record({'posted_time': "1 day ago"}, SCRAPED_AT)
+    assert fresh['scraped_at'] == "2024-05-10T12:00:00Z"
+    assert fresh['posted_at'] == "2024-05-09T12:00:00Z"
+
+
+def test_normalize_x_record_keeps_exact_counts():
+    record = normalize_x_record({'timestamp': "2024-05-10T09:30:00.000Z",
+                                 'stats': {'likes': "1.5K", 'replies': "12"},
+                                 'counts': {'likes': 1_523, 'views': None}}, SCRAPED_AT)
+    assert record['posted_at'] == "2024-05-10T09:30:00Z"
+    assert record['counts'] == {'likes': 1_523, 'replies': 12}
+    assert normalize_x_record({'timestamp': "not a date"}, SCRAPED_AT)['posted_at'] is None
+
+
+def test_write_unified_feed_interleaves_platforms_newest_first(tmp_path):
+    save_feed([{'video_id': "v2", 'posted_at': "2024-05-10T08:00:00Z"},
+               {'video_id': "v1", 'posted_at': "2024-05-09T08:00:00Z"},
+               {'video_id': "v0", 'posted_at': None}], tmp_path / "youtube_feed.json")
+    save_feed([{'url': "t2", 'posted_at': "2024-05-10T09:00:00Z"},
+               {'url': "t1", 'posted_at': "2024-05-09T09:00:00Z"}], tmp_path / "twitter_feed.json")
+    assert write_unified_feed(tmp_path) == 5
+    feed = json.loads((tmp_path / "feed.json").read_text(encoding="utf-8"))
+    assert [(item['type'], item.get('video_id') or item['url']) for item in feed] == [
+        ('twitter', "t2"), ('youtube', "v2"), ('twitter', "t1"), ('youtube', "v1"), ('youtube', "v0")]
+
+
+def test_records_without_scraped_at_keep_their_date_across_merges(tmp_path):
+    path = tmp_path / "youtube_feed.json"
+    save_feed([{'video_id': "old", 'posted_time': "2 days ago"}], path)
+    stored_at = datetime(2024, 1, 10, tzinfo=timezone.utc).timestamp()
+    os.utime(path, (stored_at, stored_at))
+
+    def unified_posted_at():
+        write_unified_feed(tmp_path)
+        feed = json.loads((tmp_path / "feed.json").read_text(encoding="utf-8"))
+        return {item['video_id']: item['posted_at'] for item in feed}
+
+    assert unified_posted_at() == {"old": "2024-01-08T00:00:00Z"}
+    merge_feed([{'video_id': "new", 'posted_at': "2024-05-10T00:00:00Z"}], path, 'video_id')
+    merge_feed([{'video_id': "newer", 'posted_at': "2024-05-11T00:00:00Z"}], path, 'video_id')
+    assert unified_posted_at()["old"] == "2024-01-08T00:00:00Z"
@@ -0,0 +1,55 @@
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("playwright")
+pytest.importorskip("requests")
+
+from social_media_scraper import _format_count, _x_tweet_record, parse_x_timeline_payload
+
+FIXTURES = Path(__file__).resolve().parent.parent / "benchmarks" / "fixtures"
+
+
+def tweet_result(full_text, display_text_range):
+    return {
+        '__typename': 'Tweet',
+        'rest_id': '1',
+        'core': {'user_results': {'result': {'legacy': {'name': 'Tom', 'screen_name': 'tom'}}}},
+        'legacy': {'id_str': '1', 'full_text': full_text, 'display_text_range': display_text_range},
+    }
+
+
+def test_display_range_counts_unescaped_characters():
+    record = _x_tweet_record(tweet_result("Tom &amp; Jerry are back!! https://t.co/AbCdEf", [0, 22]))
+    assert record['text'] == "Tom & Jerry are back!!"
+
+
+def test_escaped_markup_is_unescaped_once():
+    record = _x_tweet_record(tweet_result("a &lt;b&gt; tag &amp;amp; more", [0, 20]))
+    assert record['text'] == "a <b> tag &amp; more"
+
+
+def test_timeline_fixture_texts_match_the_rendered_feed():
+    with open(FIXTURES / "x_home_timeline.json", encoding="utf-8") as f:
+        tweets = parse_x_timeline_payload(json.load(f))
+    texts = [tweet['text'] for tweet in tweets]
+    assert "Shipping the analytical engine notes today. Feedback & errata welcome!" in texts
+    assert "It's easier to ask forgiveness than it is to get permission." in texts
+    assert "Clip from this morning's talk on computable numbers" in texts
+
+
+@pytest.mark.parametrize("count, shown", [
+    (0, "0"),
+    (999, "999"),
+    (1_000, "1K"),
+    (4_500, "4.5K"),
+    (999_949, "999.9K"),
+    (999_999, "1M"),
+    (1_250_000, "1.2M"),
+    (999_999_999, "1B"),
+    (2_000_000_000_000, "2000B"),
+    (None, "0"),
+])
+def test_format_count(count, shown):
+    assert _format_count(count) == shown
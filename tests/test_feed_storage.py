@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+pytest.importorskip("playwright")
+pytest.importorskip("requests")
+
+from social_media_scraper import iter_feed_file, merge_feed, read_ndjson, save_feed
+
+
+def records(*keys):
+    return [{'video_id': key, 'title': f"Video {key} with \"quotes\", commas and ]brackets["} for key in keys]
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_iter_feed_file_streams_small_chunks(tmp_path, indent):
+    path = tmp_path / "feed.json"
+    path.write_text(json.dumps(records(*"abcde"), indent=indent), encoding="utf-8")
+    assert list(iter_feed_file(path, chunk_size=7)) == records(*"abcde")
+
+
+def test_iter_feed_file_reads_what_save_feed_writes(tmp_path):
+    path = tmp_path / "feed.json"
+    assert save_feed(iter(records(*"abc")), path) == 3
+    assert list(iter_feed_file(path, chunk_size=16)) == records(*"abc")
+    assert json.loads(path.read_text(encoding="utf-8")) == records(*"abc")
+
+
+def test_empty_feed(tmp_path):
+    path = tmp_path / "feed.json"
+    save_feed([], path)
+    assert list(iter_feed_file(path)) == []
+
+
+def test_merge_feed_puts_new_items_first_and_drops_stored_ones(tmp_path):
+    path = tmp_path / "feed.json"
+    save_feed(records("c", "d"), path)
+    assert merge_feed(iter(records("a", "b", "c")), path, 'video_id') == 4
+    assert [record['video_id'] for record in iter_feed_file(path)] == ["a", "b", "c", "d"]
+
+
+def test_read_ndjson_skips_blank_lines(tmp_path):
+    path = tmp_path / "feed.ndjson"
+    path.write_text("".join(json.dumps(record) + "\n\n" for record in records("a", "b")), encoding="utf-8")
+    assert list(read_ndjson(path)) == records("a", "b")
+
+
+def test_atomic_writes_leave_no_temp_files_and_keep_the_mode(tmp_path):
+    path = tmp_path / "feed.json"
+    save_feed(records("a"), path)
+    path.chmod(0o640)
+    save_feed(records("b"), path)
+    assert [child.name for child in tmp_path.iterdir()] == ["feed.json"]
+    assert path.stat().st_mode & 0o777 == 0o640
+
+
+def test_failed_atomic_write_keeps_the_old_file(tmp_path):
+    path = tmp_path / "feed.json"
+    save_feed(records("a"), path)
+
+    def failing():
+        yield from records("b")
+        raise RuntimeError("scrape failed")
+
+    with pytest.raises(RuntimeError):
+        save_feed(failing(), path)
+    assert list(iter_feed_file(path)) == records("a")
+    assert [child.name for child in tmp_path.iterdir()] == ["feed.json"]
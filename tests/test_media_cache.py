@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+pytest.importorskip("playwright")
+pytest.importorskip("requests")
+
+from benchmarks.synthetic_server import png_image, start_server
+from social_media_scraper import MediaCache, YouTubeScraper
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = start_server()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def video(base_url, key, image=None):
+    return {'video_id': key, 'thumbnail': f"{base_url}/img/{image or key}.jpg"}
+
+
+def local_path(cache, url):
+    return cache.root / url[len(cache.url_prefix) + 1:]
+
+
+def test_records_point_at_the_cached_files(tmp_path, base_url):
+    cache = MediaCache(tmp_path / "media", max_workers=4)
+    records = [video(base_url, "a"), video(base_url, "b"), {'video_id': "c", 'thumbnail': None}]
+    localized = cache.localize(records, YouTubeScraper.MEDIA_FIELDS)
+    assert localized[0]['thumbnail_source'] == f"{base_url}/img/a.jpg"
+    assert localized[0]['thumbnail'].startswith("/media/")
+    assert local_path(cache, localized[0]['thumbnail']).read_bytes() == png_image("a.jpg")
+    # Records without media are copied unchanged, and the input is not modified
+    assert localized[2] == records[2]
+    assert records[0]['thumbnail'] == f"{base_url}/img/a.jpg"
+    assert cache.report()['downloaded'] == 2
+
+
+def test_identical_bytes_are_stored_once(tmp_path, base_url):
+    cache = MediaCache(tmp_path / "media")
+    # Same image name behind two URLs, plus the same URL twice
+    records = [video(base_url, "a"), {'video_id': "b", 'thumbnail': f"{base_url}/img/a.jpg?size=large"},
+               video(base_url, "c", image="a")]
+    localized = cache.localize(records, YouTubeScraper.MEDIA_FIELDS)
+    assert len({record['thumbnail'] for record in localized}) == 1
+    assert cache.downloaded == 2
+    files = [path for path in (tmp_path / "media").rglob("*") if path.is_file() and path.name != "index.json"]
+    assert len(files) == 1
+    assert files[0].suffix == ".png"
+
+
+def test_a_new_cache_on_the_same_root_reuses_the_index(tmp_path, base_url):
+    records = [video(base_url, "a"), video(base_url, "b")]
+    first = MediaCache(tmp_path / "media").localize(records, YouTubeScraper.MEDIA_FIELDS)
+    cache = MediaCache(tmp_path / "media")
+    assert cache.localize(records, YouTubeScraper.MEDIA_FIELDS) == first
+    assert (cache.downloaded, cache.cache_hits) == (0, 2)
+    # A file removed from disk is fetched again
+    local_path(cache, first[0]['thumbnail']).unlink()
+    cache.localize(records, YouTubeScraper.MEDIA_FIELDS)
+    assert cache.downloaded == 1
+
+
+def test_failed_downloads_leave_the_record_alone(tmp_path, base_url):
+    cache = MediaCache(tmp_path / "media")
+    record = {'video_id': "x", 'thumbnail': f"{base_url}/missing/x.jpg"}
+    assert cache.localize([record], YouTubeScraper.MEDIA_FIELDS) == [record]
+    assert cache.report()['failed'] == 1
+
+
+def test_localize_ndjson_rewrites_the_feed_in_batches(tmp_path, base_url):
+    path = tmp_path / "youtube_feed.ndjson"
+    records = [video(base_url, f"v{index}") for index in range(5)]
+    path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+    cache = MediaCache(tmp_path / "media")
+    cache.localize_ndjson(path, YouTubeScraper.MEDIA_FIELDS, batch_size=2)
+    rewritten = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [record['video_id'] for record in rewritten] == [record['video_id'] for record in records]
+    assert all(local_path(cache, record['thumbnail']).exists() for record in rewritten)
+
+
+def test_downscaled_variants(tmp_path, base_url):
+    image_module = pytest.importorskip("PIL.Image")
+    cache = MediaCache(tmp_path / "media", variant_widths=(320, 1280))
+    [record] = cache.localize([video(base_url, "a")], YouTubeScraper.MEDIA_FIELDS)
+    # The synthetic images are 640 px wide, so only the smaller width is made
+    assert list(record['thumbnail_variants']) == ["320"]
+    with image_module.open(local_path(cache, record['thumbnail_variants']["320"])) as image:
+        assert image.size == (320, 180)
@@ -0,0 +1,83 @@
+import pytest
+
+pytest.importorskip("playwright")
+pytest.importorskip("requests")
+
+from social_media_scraper import ResourceBlocker
+
+
+class FakeSession:
+    """A CDP session that records commands and lets the test fire events"""
+
+    def __init__(self):
+        self.sent = []
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def send(self, method, params=None):
+        self.sent.append((method, params))
+
+    def emit(self, event, params):
+        self.handlers[event](params)
+
+
+class FakeContext:
+    def __init__(self, session):
+        self.session = session
+
+    def new_cdp_session(self, page):
+        return self.session
+
+
+class FakePage:
+    def __init__(self, session):
+        self.context = FakeContext(session)
+
+
+def install(**options):
+    session = FakeSession()
+    blocker = ResourceBlocker(**options)
+    blocker.install(FakePage(session))
+    return blocker, session
+
+
+def test_only_blocked_types_are_paused():
+    blocker, session = install()
+    methods = dict(session.sent)
+    assert methods['Network.setBlockedURLs']['urls'] == list(ResourceBlocker.TRACKER_PATTERNS)
+    patterns = methods['Fetch.enable']['patterns']
+    assert sorted(pattern['resourceType'] for pattern in patterns) == ['Font', 'Image', 'Media']
+
+
+def test_measuring_only_never_enables_fetch():
+    blocker, session = install(blocked_types=(), blocked_patterns=())
+    assert 'Fetch.enable' not in dict(session.sent)
+
+
+def test_paused_requests_fail_unless_allowed():
+    blocker, session = install(allowed_patterns=(r'/youtubei/v1/browse',))
+    session.emit('Fetch.requestPaused', {'requestId': '1', 'resourceType': 'Image',
+                                         'request': {'url': 'https://i.ytimg.com/vi/a/hq.jpg'}})
+    session.emit('Fetch.requestPaused', {'requestId': '2', 'resourceType': 'Image',
+                                         'request': {'url': 'https://www.youtube.com/youtubei/v1/browse'}})
+    assert session.sent[-2] == ('Fetch.failRequest', {'requestId': '1', 'errorReason': 'BlockedByClient'})
+    assert session.sent[-1] == ('Fetch.continueRequest', {'requestId': '2'})
+    assert blocker.blocked_by_type == {'image': 1}
+
+
+def test_transfers_and_tracker_blocks_come_from_network_events():
+    blocker, session = install()
+    session.emit('Network.responseReceived', {'requestId': '1', 'type': 'Script'})
+    session.emit('Network.loadingFinished', {'requestId': '1', 'encodedDataLength': 20_000})
+    # A cache hit transfers nothing
+    session.emit('Network.responseReceived', {'requestId': '2', 'type': 'Script'})
+    session.emit('Network.loadingFinished', {'requestId': '2', 'encodedDataLength': 0})
+    session.emit('Network.loadingFailed', {'requestId': '3', 'type': 'Script', 'blockedReason': 'inspector'})
+    session.emit('Network.loadingFailed', {'requestId': '4', 'type': 'XHR', 'errorText': 'net::ERR_ABORTED'})
+    report = blocker.report()
+    assert report['transferred_bytes'] == 20_000
+    assert report['allowed_requests'] == 2
+    assert report['blocked_by_type'] == {'script': 1}
+    assert report['blocked_bytes_estimate'] == 10_000
@@ -0,0 +1,129 @@
+import pytest
+
+pytest.importorskip("playwright")
+pytest.importorskip("requests")
+
+import social_media_scraper as scraper_module
+from social_media_scraper import MIN_STEP_WAIT_MS, ScrapeBudget, ScrapeMetrics
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(scraper_module.time, 'monotonic', clock)
+    return clock
+
+
+def test_unbounded_budget_only_stops_on_stalls(clock):
+    budget = ScrapeBudget()
+    assert budget.stop_reason(100) is None
+    assert budget.step_wait_ms(5000, 100) == 5000
+    for _ in range(3):
+        budget.record_scroll(1.0, 0)
+    assert budget.stop_reason(100) == 'stalled'
+    # A stalled feed is exhausted, not truncated
+    assert budget.status() == 'complete'
+
+
+def test_a_scroll_with_new_items_resets_the_stall_count(clock):
+    budget = ScrapeBudget()
+    for new_items in (0, 0, 5, 0, 0):
+        budget.record_scroll(1.0, new_items)
+    assert budget.stop_reason() is None
+
+
+def test_scroll_budget_truncates(clock):
+    budget = ScrapeBudget(max_scrolls=2)
+    budget.record_scroll(1.0, 10)
+    assert budget.stop_reason() is None
+    budget.record_scroll(1.0, 10)
+    assert budget.stop_reason() == 'scroll_budget'
+    assert (budget.status(), budget.truncated_by) == ('truncated', 'scroll_budget')
+
+
+def test_call_budget_reads_the_metrics_counter(clock):
+    metrics = ScrapeMetrics('x')
+    budget = ScrapeBudget(max_playwright_calls=10, metrics=metrics)
+    metrics.count('playwright_calls', 9)
+    assert budget.stop_reason() is None
+    metrics.count('playwright_calls')
+    assert budget.stop_reason() == 'call_budget'
+
+
+def test_the_first_limit_reached_is_the_one_reported(clock):
+    budget = ScrapeBudget(max_scrolls=1, deadline_seconds=10)
+    budget.record_scroll(1.0, 1)
+    assert budget.stop_reason() == 'scroll_budget'
+    clock.advance(20)
+    assert budget.stop_reason() == 'scroll_budget'
+    assert budget.truncate('deadline') == 'deadline'
+    assert budget.truncated_by == 'scroll_budget'
+
+
+def test_deadline_keeps_the_extraction_reserve(clock):
+    budget = ScrapeBudget(deadline_seconds=10, reserve_seconds=2)
+    budget.record_scroll(3.0, 5)
+    clock.advance(4)
+    # 6 s left: 4 s after the reserve, more than a typical 3 s scroll
+    assert budget.stop_reason() is None
+    assert budget.step_wait_ms(5000) == 4000
+    clock.advance(1.5)
+    assert budget.stop_reason() == 'deadline'
+    assert budget.status() == 'truncated'
+
+
+def test_timeout_ms_is_capped_by_the_deadline(clock):
+    budget = ScrapeBudget(deadline_seconds=10)
+    assert budget.timeout_ms(30000) == 10000
+    clock.advance(9.5)
+    assert budget.timeout_ms(30000) == 500
+    clock.advance(1)
+    assert budget.expired()
+    assert budget.timeout_ms(30000) == 1
+
+
+def test_scrolls_needed_follows_the_observed_yield(clock):
+    budget = ScrapeBudget()
+    assert budget.scrolls_needed(10) is None
+    budget.record_scroll(1.0, 4)
+    budget.record_scroll(1.0, 0)
+    assert budget.yield_per_scroll == 2
+    assert budget.scrolls_needed(9) == 5
+    assert budget.scrolls_needed(0) is None
+
+
+def test_step_waits_are_paced_to_fit_the_scrolls_still_needed(clock):
+    budget = ScrapeBudget(deadline_seconds=12, reserve_seconds=2)
+    budget.record_scroll(1.0, 10)
+    # 10 s usable; 40 missing items at 10 per scroll need 4 scrolls of 2.5 s
+    assert budget.step_wait_ms(5000, missing=40) == 2500
+    # Never paced below MIN_STEP_WAIT_MS while the time lasts
+    assert budget.step_wait_ms(5000, missing=1000) == MIN_STEP_WAIT_MS
+    # Few missing items leave the full wait
+    assert budget.step_wait_ms(5000, missing=10) == 5000
+
+
+def test_paced_scrolls_are_still_allowed_near_the_deadline(clock):
+    budget = ScrapeBudget(deadline_seconds=10, reserve_seconds=2)
+    budget.record_scroll(4.0, 10)
+    clock.advance(7)
+    # 1 s after the reserve: a paced scroll for 20 missing items fits, a typical 4 s scroll does not
+    assert budget.stop_reason(missing=20) is None
+    assert budget.step_wait_ms(5000, missing=20) == MIN_STEP_WAIT_MS
+    assert budget.stop_reason() == 'deadline'
+
+
+def test_started_moves_the_deadline(clock):
+    budget = ScrapeBudget(deadline_seconds=10, started=clock.now - 4)
+    assert budget.remaining_seconds() == 6
@@ -0,0 +1,104 @@
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("playwright")
+pytest.importorskip("requests")
+
+import scrape_daemon
+from scrape_daemon import ScrapeJob, load_config
+
+EXAMPLE_CONFIG = Path(__file__).resolve().parent.parent / "scraper_config.example.json"
+
+
+@pytest.fixture
+def no_jitter(monkeypatch):
+    monkeypatch.setattr(scrape_daemon.random, 'uniform', lambda low, high: low)
+
+
+def test_success_waits_one_interval():
+    job = ScrapeJob('x', interval_seconds=900)
+    job.reschedule(1000.0, True, initial_backoff=60, max_backoff=3600)
+    assert job.next_run == 1900.0
+    assert job.failures == 0
+
+
+def test_failures_back_off_exponentially_up_to_the_cap(no_jitter):
+    job = ScrapeJob('youtube', interval_seconds=3600)
+    delays = []
+    for _ in range(6):
+        job.reschedule(1000.0, False, initial_backoff=60, max_backoff=600)
+        delays.append(job.next_run - 1000.0)
+    assert delays == [60, 120, 240, 480, 600, 600]
+    assert job.failures == 6
+
+
+def test_a_success_resets_the_backoff(no_jitter):
+    job = ScrapeJob('x', interval_seconds=900)
+    for _ in range(3):
+        job.reschedule(1000.0, False, initial_backoff=60, max_backoff=3600)
+    job.reschedule(2000.0, True, initial_backoff=60, max_backoff=3600)
+    assert (job.failures, job.next_run) == (0, 2900.0)
+    job.reschedule(3000.0, False, initial_backoff=60, max_backoff=3600)
+    assert job.next_run == 3060.0
+
+
+def test_backoff_jitter_only_ever_delays_by_up_to_ten_percent(monkeypatch):
+    job = ScrapeJob('x', interval_seconds=900)
+    monkeypatch.setattr(scrape_daemon.random, 'uniform', lambda low, high: high)
+    job.reschedule(0.0, False, initial_backoff=100, max_backoff=3600)
+    assert job.next_run == pytest.approx(110.0)
+    monkeypatch.undo()
+    for _ in range(50):
+        job.failures = 0
+        job.reschedule(0.0, False, initial_backoff=100, max_backoff=3600)
+        assert 100.0 <= job.next_run <= 110.0
+
+
+@pytest.mark.parametrize("options", [{'platform': 'tiktok', 'interval_seconds': 60},
+                                     {'platform': 'x', 'interval_seconds': 0}])
+def test_invalid_jobs_are_rejected(options):
+    with pytest.raises(ValueError):
+        ScrapeJob(**options)
+
+
+def write_config(tmp_path, config):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(config), encoding="utf-8")
+    return path
+
+
+def test_load_config_fills_in_defaults(tmp_path):
+    config = load_config(write_config(tmp_path, {
+        'jobs': [{'platform': 'x', 'interval_seconds': 900}],
+        'backoff': {'max_seconds': 120},
+    }))
+    assert config['backoff'] == {'initial_seconds': 60, 'max_seconds': 120}
+    assert config['stagger_seconds'] == 60
+    assert config['output_dir'] == 'scraped_data'
+
+
+def test_the_example_config_loads():
+    jobs = [ScrapeJob(**job) for job in load_config(EXAMPLE_CONFIG)['jobs']]
+    assert {job.platform for job in jobs} == {'youtube', 'x'}
+
+
+@pytest.mark.parametrize("config, message", [
+    ({'jobs': []}, "no jobs"),
+    ({'browser': {'port': 9222, 'proxy': 'socks://x'}, 'jobs': [{'platform': 'x', 'interval_seconds': 60}]},
+     "Unknown browser options"),
+    ({'jobs': [{'platform': 'x', 'interval_seconds': 60}, {'platform': 'x', 'interval_seconds': 600}]},
+     "distinct names"),
+])
+def test_load_config_rejects_unusable_settings(tmp_path, config, message):
+    with pytest.raises(ValueError, match=message):
+        load_config(write_config(tmp_path, config))
+
+
+def test_named_jobs_may_share_a_platform(tmp_path):
+    config = load_config(write_config(tmp_path, {'jobs': [
+        {'platform': 'x', 'interval_seconds': 60, 'name': 'x-fast'},
+        {'platform': 'x', 'interval_seconds': 600, 'name': 'x-deep', 'max_items': 500},
+    ]}))
+    assert [job['name'] for job in config['jobs']] == ['x-fast', 'x-deep']
@@ -0,0 +1,242 @@
+import asyncio
+import time
+from contextlib import contextmanager
+
+import pytest
+
+pytest.importorskip("playwright")
+pytest.importorskip("requests")
+
+import social_media_scraper as scraper_module
+from social_media_scraper import XScraper, YouTubeScraper
+
+
+def rendered_tweet(index):
+    return {'author': {'name': f"User {index}", 'handle': f"@user{index}"}, 'text': f"Tweet number {index}",
+            'timestamp': None, 'stats': {}, 'url': f"https://x.com/user{index}/status/{index}", 'media_url': None}
+
+
+def rendered_video(index):
+    return {'title': f"Video {index}", 'url': f"https://www.youtube.com/watch?v=vid{index}", 'channel': "Channel",
+            'views': "1K views", 'posted_time': "1 day ago", 'thumbnail': None, 'video_id': f"vid{index}"}
+
+
+class FakePage:
+    """Stands in for a Playwright page whose feed already shows `items` and never loads more"""
+
+    def __init__(self, url, items):
+        self.url = url
+        self.items = items
+        self.closed = False
+        self.calls = []
+
+    def on(self, event, handler):
+        pass
+
+    def add_init_script(self, script=None, **kwargs):
+        self.calls.append('add_init_script')
+
+    def goto(self, url, **kwargs):
+        self.calls.append('goto')
+        self.url = url
+
+    def wait_for_selector(self, selector, **kwargs):
+        pass
+
+    def wait_for_function(self, expression, **kwargs):
+        pass
+
+    def wait_for_timeout(self, timeout):
+        pass
+
+    def query_selector_all(self, selector):
+        return []
+
+    def evaluate(self, expression, arg=None):
+        if expression == scraper_module.SCROLL_STEP_JS:
+            self.scrolled()
+        if expression in (scraper_module.SCROLL_STEP_JS, scraper_module.SCROLL_STATE_JS):
+            return {'count': len(self.items), 'height': 1000, 'position': 0}
+        if expression == scraper_module.TWEET_BATCH_JS:
+            return list(self.items)
+        if expression == scraper_module.VIDEO_BATCH_JS:
+            start, end = arg
+            return list(self.items[start:end])
+        return None
+
+    def scrolled(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class LateFillPage(FakePage):
+    """A grid whose third card only gets its link after the first scroll"""
+
+    def __init__(self, url, items):
+        super().__init__(url, items)
+        self.complete = list(items)
+        self.items[2] = {**items[2], 'url': None, 'video_id': None}
+
+    def scrolled(self):
+        self.items = list(self.complete)
+
+
+class FakeContext:
+    def __init__(self, page):
+        self.page = page
+
+    def new_page(self):
+        return self.page
+
+
+class FakeBrowser:
+    def __init__(self, page):
+        self.contexts = [FakeContext(page)]
+
+
+class FakePool:
+    def __init__(self, page):
+        self.page = page
+
+    @contextmanager
+    def session(self, deadline=None):
+        yield FakeBrowser(self.page)
+
+
+@pytest.mark.parametrize("scraper_class, make_item", [(XScraper, rendered_tweet), (YouTubeScraper, rendered_video)])
+def test_rendered_items_are_returned_when_no_scroll_is_allowed(scraper_class, make_item):
+    page = FakePage(scraper_class.HOME_URL, [make_item(index) for index in range(5)])
+    scraper = scraper_class(browser_pool=FakePool(page), block_resources=False, max_scrolls=0)
+    items = scraper.scrape_feed(10)
+    assert len(items) == 5
+    assert scraper.metrics.status == 'truncated'
+    assert page.closed
+
+
+@pytest.mark.parametrize("scraper_class, make_item", [(XScraper, rendered_tweet), (YouTubeScraper, rendered_video)])
+def test_exhausted_feed_stalls_and_completes(scraper_class, make_item):
+    page = FakePage(scraper_class.HOME_URL, [make_item(index) for index in range(3)])
+    scraper = scraper_class(browser_pool=FakePool(page), block_resources=False)
+    assert len(scraper.scrape_feed(10)) == 3
+    assert scraper.metrics.status == 'complete'
+
+
+def test_scrape_feed_keeps_the_platform_keywords():
+    for scraper_class, keyword, make_item in ((YouTubeScraper, 'max_videos', rendered_video),
+                                              (XScraper, 'max_tweets', rendered_tweet)):
+        page = FakePage(scraper_class.HOME_URL, [make_item(index) for index in range(3)])
+        scraper = scraper_class(browser_pool=FakePool(page), block_resources=False)
+        assert len(scraper.scrape_feed(**{keyword: 2})) == 2
+
+
+@pytest.mark.parametrize("scraper_class, make_item", [(XScraper, rendered_tweet), (YouTubeScraper, rendered_video)])
+def test_feed_request_tracker_is_installed_before_navigation(scraper_class, make_item):
+    page = FakePage("about:blank", [make_item(index) for index in range(3)])
+    scraper_class(browser_pool=FakePool(page), block_resources=False).scrape_feed(10)
+    assert page.calls[:2] == ['add_init_script', 'goto']
+
+
+def test_feed_scraper_is_abstract():
+    with pytest.raises(TypeError):
+        scraper_module.FeedScraper()
+
+
+class FakeCard:
+    """Element handle stand-in; its fields are whatever the page currently shows at its index"""
+
+    def __init__(self, page, index):
+        self.page = page
+        self.index = index
+
+
+@pytest.mark.parametrize("extraction_mode", ['batch', 'handles'])
+def test_cards_without_a_link_are_read_again(monkeypatch, extraction_mode):
+    page = LateFillPage(YouTubeScraper.HOME_URL, [rendered_video(index) for index in range(5)])
+    page.query_selector_all = lambda selector: [FakeCard(page, index) for index in range(len(page.items))]
+    monkeypatch.setattr(YouTubeScraper, '_extract_video_from_handle',
+                        lambda self, card: dict(card.page.items[card.index]))
+    scraper = YouTubeScraper(browser_pool=FakePool(page), block_resources=False, extraction_mode=extraction_mode)
+    videos = scraper.scrape_feed(max_videos=10)
+    assert sorted(video['url'] for video in videos) == sorted(rendered_video(index)['url'] for index in range(5))
+
+
+class AsyncFakePage:
+    """The async API view of a FakePage: every method is a coroutine"""
+
+    def __init__(self, page):
+        self.page = page
+
+    def __getattr__(self, name):
+        attr = getattr(self.page, name)
+        if not callable(attr) or name == 'on':
+            return attr
+
+        async def call(*args, **kwargs):
+            return attr(*args, **kwargs)
+
+        return call
+
+
+class AsyncFakeContext:
+    def __init__(self, page):
+        self.page = AsyncFakePage(page)
+
+    async def new_page(self):
+        return self.page
+
+
+@pytest.mark.parametrize("scraper_class, make_item", [(XScraper, rendered_tweet), (YouTubeScraper, rendered_video)])
+@pytest.mark.parametrize("max_scrolls, status", [(0, 'truncated'), (None, 'complete')])
+def test_async_scrape_matches_the_sync_loop(scraper_class, make_item, max_scrolls, status):
+    items = [make_item(index) for index in range(5)]
+    sync_scraper = scraper_class(browser_pool=FakePool(FakePage(scraper_class.HOME_URL, list(items))),
+                                 block_resources=False, max_scrolls=max_scrolls)
+    expected = sync_scraper.scrape_feed(10)
+    async_scraper = scraper_class(block_resources=False, max_scrolls=max_scrolls)
+    page = FakePage(scraper_class.HOME_URL, list(items))
+    records = asyncio.run(async_scraper.scrape_feed_async(AsyncFakeContext(page), 10))
+    assert [record['url'] for record in records] == [record['url'] for record in expected]
+    assert async_scraper.metrics.status == sync_scraper.metrics.status == status
+    assert async_scraper.metrics.counters['items'] == 5
+    assert page.closed
+
+
+def test_async_youtube_reads_cards_without_a_link_again():
+    page = LateFillPage(YouTubeScraper.HOME_URL, [rendered_video(index) for index in range(5)])
+    videos = asyncio.run(YouTubeScraper(block_resources=False).scrape_feed_async(AsyncFakeContext(page), 10))
+    assert sorted(video['url'] for video in videos) == sorted(rendered_video(index)['url'] for index in range(5))
+
+
+def test_concurrent_scrape_connects_with_the_scrapers_options(monkeypatch, tmp_path):
+    managers = []
+
+    class FakeAsyncBrowserManager:
+        def __init__(self, **options):
+            self.options = options
+            managers.append(self)
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc_val, exc_tb):
+            pass
+
+        @property
+        def contexts(self):
+            return [AsyncFakeContext(FakePage(YouTubeScraper.HOME_URL, [rendered_video(index) for index in range(3)]))]
+
+    monkeypatch.setattr(scraper_module, 'AsyncBrowserManager', FakeAsyncBrowserManager)
+    youtube = YouTubeScraper(block_resources=False, debugging_port=9333, user_data_dir="/tmp/profile",
+                             deadline_seconds=60)
+    x = XScraper(block_resources=False, deadline_seconds=30)
+    before = time.monotonic()
+    asyncio.run(scraper_module.scrape_feeds_concurrently(2, 2, tmp_path, youtube, x))
+    options = managers[0].options
+    assert (options['port'], options['user_data_dir']) == (9333, "/tmp/profile")
+    assert before + 30 <= options['deadline'] <= time.monotonic() + 30
+    # Both runs' deadlines count from before the connection was made
+    assert x.metrics.budget.deadline == pytest.approx(options['deadline'])
+    assert youtube.metrics.budget.started == x.metrics.budget.started
+    assert (tmp_path / "youtube_feed.json").exists()
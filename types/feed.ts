@@ -6,6 +6,14 @@ export type TwitterPost = {
   };
   text: string;
   timestamp: string;
+  // UTC ISO-8601, normalized by the scraper; null when the tweet had no timestamp
+  posted_at: string | null;
+  counts: {
+    reply?: number | null;
+    retweet?: number | null;
+    like?: number | null;
+    views?: number | null;
+  };
   url: string;
   media_url: string | null;
 };
@@ -17,7 +25,25 @@ export type YouTubePost = {
   url: string;
   thumbnail: string;
   posted_time: string;
+  // posted_time resolved against the scrape time; null when it could not be parsed
+  posted_at: string | null;
   views: string;
+  counts: {
+    views: number | null;
+  };
+};
+
+// Set on the earliest item of a near-duplicate cluster (reposts, re-uploads)
+export type DuplicateSummary = {
+  type: 'twitter' | 'youtube';
+  url: string;
+  author: string | null;
+  posted_at: string | null;
+};
+
+type Clustered = {
+  cluster_size?: number;
+  duplicates?: DuplicateSummary[];
 };
 
-export type FeedItem = TwitterPost | YouTubePost; 
\ No newline at end of file
+export type FeedItem = (TwitterPost | YouTubePost) & Clustered;